@@ -15,6 +15,7 @@ import django
 django.setup()
 
 from game.models import PhoneticPattern
+from game.sounds import normalize, sound_ids_for
 
 def load_additional_patterns():
     """Load additional phonetic patterns directly into database."""
@@ -94,15 +95,19 @@ def load_additional_patterns():
     inserted_count = 0
     skipped_count = 0
     
+    # Sounds are rows of their own now; resolve every name (and alias, e.g. 'a' -> 'ay') once
+    sound_ids = sound_ids_for({sound for _, sound, _ in patterns})
+
     for letters, sound, reference in patterns:
+        sound_id = sound_ids[normalize(sound)]
         # Check if this exact pattern already exists
-        if PhoneticPattern.objects.filter(letters=letters, sound=sound, reference=reference).exists():
+        if PhoneticPattern.objects.filter(letters=letters, sound_id=sound_id, reference=reference).exists():
             skipped_count += 1
         else:
             # Pattern doesn't exist, create it
             PhoneticPattern.objects.create(
                 letters=letters,
-                sound=sound,
+                sound_id=sound_id,
                 reference=reference
             )
             inserted_count += 1
@@ -118,7 +123,7 @@ def load_additional_patterns():
     # Show some new patterns
     if inserted_count > 0:
         print("\nSample of newly added patterns:")
-        new_patterns = PhoneticPattern.objects.exclude(letters='*').order_by('-id')[:5]
+        new_patterns = PhoneticPattern.objects.exclude(letters='*').select_related('sound').order_by('-id')[:5]
         for pattern in new_patterns:
             print(f"  {pattern.letters} → {pattern.sound} (from '{pattern.reference}')")
     
@@ -1,32 +1,108 @@
 from django.contrib import admin
-from .models import ValidWord, Word, PhoneticPattern, PhoneticComponent, UserStats
+from .models import ValidWord, Word, PhoneticPattern, PhoneticComponent, UserStats, OutboundEmail, PuzzleScore, PuzzleStats, LeaderboardRollup, WordCoverage, Sound, SoundAlias
+from .paginators import EstimatedCountPaginator
 
 @admin.register(ValidWord)
 class ValidWordAdmin(admin.ModelAdmin):
     list_display = ['word']
     search_fields = ['word']
+    search_help_text = 'Prefix match (e.g. "gho"). Start with * for a substring match (e.g. "*ough").'
     list_per_page = 50
     ordering = ['word']
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def get_search_results(self, request, queryset, search_term):
+        # Words are stored lowercase, so case-sensitive lookups are exact and
+        # can use the prefix (varchar_pattern_ops) and trigram indexes
+        term = search_term.strip().lower()
+        if not term:
+            return queryset, False
+        if term.startswith('*'):
+            return queryset.filter(word__contains=term.strip('*')), False
+        return queryset.filter(word__startswith=term), False
+
+class SoundAliasInline(admin.TabularInline):
+    model = SoundAlias
+    extra = 1
+
+@admin.register(Sound)
+class SoundAdmin(admin.ModelAdmin):
+    list_display = ['name', 'alias_list']
+    search_fields = ['name', 'aliases__alias']
+    inlines = [SoundAliasInline]
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).prefetch_related('aliases')
+
+    @admin.display(description='Aliases')
+    def alias_list(self, obj):
+        return ', '.join(a.alias for a in obj.aliases.all())
+
+    def save_formset(self, request, form, formset, change):
+        # New aliases may name an existing sound, which then has to be merged in
+        from .sounds import add_alias
+        aliases = formset.save(commit=False)
+        for alias in formset.deleted_objects:
+            alias.delete()
+        for alias in aliases:
+            add_alias(alias.alias, form.instance)
 
 @admin.register(PhoneticPattern)
 class PhoneticPatternAdmin(admin.ModelAdmin):
     list_display = ['letters', 'sound', 'reference']
-    search_fields = ['letters', 'sound', 'reference']
+    list_select_related = ['sound']
+    search_fields = ['letters', 'sound__name', 'reference']
     list_filter = ['sound']
 
+class PhoneticComponentInline(admin.TabularInline):
+    model = PhoneticComponent
+    fields = ['position', 'pattern', 'no_change']
+    ordering = ['position']
+    extra = 0
+
+    def get_queryset(self, request):
+        # Each row's label is str(component), which reads word, pattern and its sound
+        return super().get_queryset(request).select_related('word', 'pattern__sound')
+
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        if db_field.name == 'pattern':
+            # Option labels are str(pattern), which reads the sound
+            kwargs['queryset'] = PhoneticPattern.objects.select_related('sound')
+        formfield = super().formfield_for_foreignkey(db_field, request, **kwargs)
+        if db_field.name == 'pattern':
+            # Build the pattern <select> once per request instead of once per row
+            if not hasattr(request, '_pattern_choices'):
+                request._pattern_choices = list(formfield.choices)
+            formfield.choices = request._pattern_choices
+        return formfield
+
 @admin.register(Word)
 class WordAdmin(admin.ModelAdmin):
-    list_display = ['date', 'phonetic', 'secret']
+    list_display = ['date', 'phonetic', 'secret', 'dictionary']
     search_fields = ['secret', 'phonetic']
-    list_filter = ['date']
+    list_filter = ['date', 'dictionary']
     date_hierarchy = 'date'
     ordering = ['-date']
+    inlines = [PhoneticComponentInline]
+
+@admin.register(PhoneticComponent)
+class PhoneticComponentAdmin(admin.ModelAdmin):
+    list_display = ['word', 'position', 'pattern', 'no_change']
+    list_select_related = ['word', 'pattern__sound']
+    search_fields = ['word__secret', 'word__phonetic']
+    autocomplete_fields = ['word', 'pattern']
+    ordering = ['-word__date', 'position']
 
 @admin.register(UserStats)
 class UserStatsAdmin(admin.ModelAdmin):
     list_display = ['user', 'correctGuesses', 'wrongGuesses', 'streak', 'get_total_games', 'get_win_rate']
     search_fields = ['user__username']
     list_filter = ['streak']
+    list_select_related = ['user']
+    autocomplete_fields = ['user']
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     ordering = ['-streak', '-correctGuesses']
     readonly_fields = ['get_total_games', 'get_win_rate']
     
@@ -38,8 +114,47 @@ class UserStatsAdmin(admin.ModelAdmin):
         return f"{obj.win_rate:.1f}%"
     get_win_rate.short_description = 'Win Rate'
 
+@admin.register(PuzzleStats)
+class PuzzleStatsAdmin(admin.ModelAdmin):
+    list_display = ['date', 'players', 'solved_1', 'solved_2', 'solved_3', 'solved_4', 'solved_5', 'solved_6', 'failed']
+    date_hierarchy = 'date'
+    ordering = ['-date']
+
+@admin.register(PuzzleScore)
+class PuzzleScoreAdmin(admin.ModelAdmin):
+    list_display = ['word', 'expected_remaining', 'solve_depth', 'worst_case_depth', 'rarity', 'opener', 'scored_at']
+    list_select_related = ['word']
+    search_fields = ['word__word']
+    list_filter = ['worst_case_depth']
+    list_per_page = 50
+    ordering = ['-worst_case_depth', '-expected_remaining']
+
+@admin.register(WordCoverage)
+class WordCoverageAdmin(admin.ModelAdmin):
+    list_display = ['word', 'covered', 'segments', 'missing', 'mined_at']
+    search_fields = ['word__word']
+    list_filter = ['covered']
+    list_per_page = 50
+
+@admin.register(OutboundEmail)
+class OutboundEmailAdmin(admin.ModelAdmin):
+    list_display = ['to_email', 'subject', 'status', 'attempts', 'next_attempt_at', 'created_at']
+    list_filter = ['status']
+    search_fields = ['to_email']
+    ordering = ['-created_at']
+
+@admin.register(LeaderboardRollup)
+class LeaderboardRollupAdmin(admin.ModelAdmin):
+    list_display = ['period', 'period_start', 'user', 'correctGuesses', 'wrongGuesses']
+    list_select_related = ['user']
+    list_filter = ['period']
+    raw_id_fields = ['user']
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
+    ordering = ['-period_start', '-correctGuesses']
+
 # Note: PhoneticComponent is the through table for ManyToMany relationship
-# It's automatically managed through the Word admin interface
+# It's edited inline on the Word admin page
 
 
 # class PhoneticPatternInline(admin.TabularInline):
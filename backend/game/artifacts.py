@@ -0,0 +1,101 @@
+"""
+Client-side lexicon artifact.
+
+Each dictionary is shipped to the browser as a Bloom filter so the frontend can
+reject non-words without a request. The server stays authoritative: a false
+positive just means the guess goes to `validate/` as before.
+
+Binary layout (big-endian):
+    4 bytes  magic b'GHBF'
+    1 byte   format version (1)
+    1 byte   number of hash functions k
+    4 bytes  number of bits m
+    m/8      bit array, bit i is (byte i >> 3) & (1 << (i & 7))
+
+Bit positions for a word are ((h1 + i * h2) mod 2**32) mod m for i in 0..k-1,
+where h1 and h2 are 32-bit FNV-1a hashes of the UTF-8 word with offset bases
+FNV_OFFSET and SECOND_OFFSET (h2 forced odd). frontend/src/lexicon.ts mirrors this.
+"""
+import hashlib
+import math
+import struct
+import threading
+
+import numpy as np
+from django.conf import settings
+
+from .lexicon import DEFAULT_DICTIONARY, get_lexicon
+
+MAGIC = b'GHBF'
+FORMAT_VERSION = 1
+FNV_PRIME = 0x01000193
+FNV_OFFSET = 0x811C9DC5
+SECOND_OFFSET = 0x050C5D1F
+
+_lock = threading.Lock()
+_artifacts = {}  # {dictionary id: (version, bytes)}
+
+
+def _fnv1a(byte_matrix, lengths, offset):
+    """Vectorized 32-bit FNV-1a over rows of a zero-padded byte matrix"""
+    h = np.full(len(byte_matrix), offset, dtype=np.uint64)
+    for col in range(byte_matrix.shape[1]):
+        active = lengths > col
+        mixed = ((h ^ byte_matrix[:, col]) * FNV_PRIME) & 0xFFFFFFFF
+        h = np.where(active, mixed, h)
+    return h
+
+
+def bloom_parameters(n, fp_rate):
+    """Optimal (bits, hashes) for n items at the given false-positive rate"""
+    bits = max(8, math.ceil(-n * math.log(fp_rate) / (math.log(2) ** 2)))
+    bits = (bits + 7) // 8 * 8
+    hashes = max(1, round(bits / max(n, 1) * math.log(2)))
+    return bits, hashes
+
+
+def build_bloom(words, fp_rate):
+    """Serialize `words` as a Bloom filter in the layout described above"""
+    encoded = [w.encode('utf-8') for w in words]
+    bits, hashes = bloom_parameters(len(encoded), fp_rate)
+    array = np.zeros(bits // 8, dtype=np.uint8)
+
+    if encoded:
+        width = max(len(w) for w in encoded)
+        matrix = np.zeros((len(encoded), width), dtype=np.uint64)
+        for row, w in enumerate(encoded):
+            matrix[row, :len(w)] = np.frombuffer(w, dtype=np.uint8)
+        lengths = np.array([len(w) for w in encoded])
+
+        h1 = _fnv1a(matrix, lengths, FNV_OFFSET)
+        h2 = _fnv1a(matrix, lengths, SECOND_OFFSET) | 1
+        for i in range(hashes):
+            positions = ((h1 + np.uint64(i) * h2) & 0xFFFFFFFF) % np.uint64(bits)
+            np.bitwise_or.at(array, (positions >> 3).astype(np.int64), (1 << (positions & 7)).astype(np.uint8))
+
+    header = MAGIC + struct.pack('>BBI', FORMAT_VERSION, hashes, bits)
+    return header + array.tobytes()
+
+
+def lexicon_artifact(dictionary_id=DEFAULT_DICTIONARY):
+    """Return (version, bytes) for a dictionary, built once per process"""
+    artifact = _artifacts.get(dictionary_id)
+    if artifact is None:
+        with _lock:
+            artifact = _artifacts.get(dictionary_id)
+            if artifact is None:
+                words = get_lexicon(dictionary_id)
+                data = build_bloom(sorted(words), settings.LEXICON_BLOOM_FP_RATE)
+                version = hashlib.sha256(data).hexdigest()[:16]
+                if not words:
+                    return version, data
+                artifact = _artifacts[dictionary_id] = (version, data)
+    return artifact
+
+
+def clear_artifact(dictionary_id=None):
+    with _lock:
+        if dictionary_id is None:
+            _artifacts.clear()
+        else:
+            _artifacts.pop(dictionary_id, None)
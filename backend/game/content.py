@@ -0,0 +1,233 @@
+"""
+Portable puzzle content: PhoneticPattern, Word and PhoneticComponent rows as a
+single stream of records, used by the export_content / import_content commands.
+
+Records come in dependency order - every pattern, then every word, then every
+component, grouped by word - so an import can remap ids as it goes:
+
+    {"type": "pattern", "id": 7, "letters": "gh", "sound": "f", "reference": "enough"}
+    {"type": "word", "id": 3, "secret": "fish", "phonetic": "ghoti", "date": "2024-01-01", "dictionary": "en"}
+    {"type": "component", "word": 3, "pattern": 7, "position": 0, "no_change": false}
+
+NDJSON has one record per line; CSV has one row per record with a `type`
+column and the union of the fields above. Ids are only meaningful within one
+file. On import patterns match on (letters, sound, reference) and words on
+date, so running the same import twice changes nothing.
+"""
+import csv
+import json
+from datetime import date
+
+from django.db import transaction
+
+from .models import PhoneticComponent, PhoneticPattern, Word
+from .sounds import canonical_names, sound_ids_for
+
+PATTERN_FIELDS = ['letters', 'sound', 'reference']
+WORD_FIELDS = ['secret', 'phonetic', 'date', 'dictionary']
+COMPONENT_FIELDS = ['word', 'pattern', 'position', 'no_change']
+CSV_COLUMNS = ['type', 'id'] + PATTERN_FIELDS + WORD_FIELDS + COMPONENT_FIELDS
+INT_FIELDS = {'id', 'word', 'pattern', 'position'}
+
+
+def export_records(since=None, until=None, chunk_size=2000):
+    """Yield content records, reading each table with a server-side cursor"""
+    words = Word.objects.order_by('date')
+    if since:
+        words = words.filter(date__gte=since)
+    if until:
+        words = words.filter(date__lte=until)
+    patterns = PhoneticPattern.objects.order_by('id')
+    components = PhoneticComponent.objects.order_by('word__date', 'position')
+    if since or until:
+        patterns = patterns.filter(phoneticcomponent__word__in=words).distinct()
+        components = components.filter(word__in=words)
+
+    for pk, letters, sound, reference in patterns.values_list('id', 'letters', 'sound__name', 'reference').iterator(chunk_size):
+        yield {'type': 'pattern', 'id': pk, 'letters': letters, 'sound': sound, 'reference': reference}
+    for pk, secret, phonetic, day, dictionary in words.values_list('id', *WORD_FIELDS).iterator(chunk_size):
+        yield {
+            'type': 'word', 'id': pk, 'secret': secret, 'phonetic': phonetic,
+            'date': day.isoformat(), 'dictionary': dictionary,
+        }
+    rows = components.values_list('word_id', 'pattern_id', 'position', 'no_change').iterator(chunk_size)
+    for word_id, pattern_id, position, no_change in rows:
+        yield {'type': 'component', 'word': word_id, 'pattern': pattern_id, 'position': position, 'no_change': no_change}
+
+
+def write_records(records, stream, fmt):
+    """Write records to a text stream as 'ndjson' or 'csv'. Returns the count."""
+    count = 0
+    if fmt == 'csv':
+        writer = csv.DictWriter(stream, fieldnames=CSV_COLUMNS)
+        writer.writeheader()
+        for record in records:
+            writer.writerow(record)
+            count += 1
+    else:
+        for record in records:
+            stream.write(json.dumps(record, separators=(',', ':')) + '\n')
+            count += 1
+    return count
+
+
+def read_records(stream, fmt):
+    """Parse records from a text stream written by write_records"""
+    if fmt == 'csv':
+        for row in csv.DictReader(stream):
+            record = {'type': row['type']}
+            for key, value in row.items():
+                if key == 'type' or value == '':
+                    continue
+                if key in INT_FIELDS:
+                    value = int(value)
+                elif key == 'no_change':
+                    value = value == 'True'
+                record[key] = value
+            yield record
+    else:
+        for line in stream:
+            if line.strip():
+                yield json.loads(line)
+
+
+class ContentImporter:
+    """
+    Upsert content records in chunks. Only the old-id -> new-id maps for
+    patterns and words are held in memory, never the records themselves.
+
+    Counts of created / updated / unchanged rows per type end up in `summary`;
+    with `dry_run` nothing is written and `on_change` still sees every change.
+    """
+
+    def __init__(self, chunk_size=2000, dry_run=False, on_change=None):
+        self.chunk_size = chunk_size
+        self.dry_run = dry_run
+        self.on_change = on_change or (lambda kind, action, label: None)
+        self.pattern_ids = {}
+        self.word_ids = {}
+        self.summary = {kind: {'created': 0, 'updated': 0, 'unchanged': 0} for kind in ('pattern', 'word', 'component')}
+
+    def run(self, records):
+        handlers = {'pattern': self._patterns, 'word': self._words, 'component': self._components}
+        with transaction.atomic():
+            chunk, kind = [], None
+            for record in records:
+                if record['type'] not in handlers:
+                    raise ValueError(f'Unknown record type "{record["type"]}"')
+                if chunk and (record['type'] != kind or len(chunk) >= self.chunk_size):
+                    # Never split one word's components across chunks
+                    if kind != 'component' or record['type'] != kind or record['word'] != chunk[-1]['word']:
+                        handlers[kind](chunk)
+                        chunk = []
+                kind = record['type']
+                chunk.append(record)
+            if chunk:
+                handlers[kind](chunk)
+        return self.summary
+
+    def _count(self, kind, action, label):
+        self.summary[kind][action] += 1
+        if action != 'unchanged':
+            self.on_change(kind, action, label)
+
+    def _patterns(self, chunk):
+        # Sounds match on their canonical name, so an aliased spelling finds the same pattern
+        canonical = canonical_names({r['sound'] for r in chunk})
+        for record in chunk:
+            record['sound'] = canonical[record['sound']]
+        existing = {}
+        rows = PhoneticPattern.objects.filter(letters__in={r['letters'] for r in chunk})
+        for pk, *key in rows.values_list('id', 'letters', 'sound__name', 'reference'):
+            existing.setdefault(tuple(key), pk)
+
+        missing, pending = [], set()
+        for record in chunk:
+            key = tuple(record[f] for f in PATTERN_FIELDS)
+            if key in existing:
+                self._count('pattern', 'unchanged', key)
+            elif key not in pending:
+                self._count('pattern', 'created', '/'.join(key))
+                pending.add(key)
+                missing.append(record)
+
+        if missing and not self.dry_run:
+            sound_ids = sound_ids_for({r['sound'] for r in missing})
+            created = PhoneticPattern.objects.bulk_create([
+                PhoneticPattern(letters=r['letters'], sound_id=sound_ids[r['sound']], reference=r['reference'])
+                for r in missing
+            ])
+            for pattern, record in zip(created, missing):
+                existing[(pattern.letters, record['sound'], pattern.reference)] = pattern.pk
+        for record in chunk:
+            # Dry runs map new patterns to None
+            self.pattern_ids[record['id']] = existing.get(tuple(record[f] for f in PATTERN_FIELDS))
+
+    def _words(self, chunk):
+        for record in chunk:
+            record['date'] = date.fromisoformat(record['date'])
+            record.setdefault('dictionary', 'en')
+        existing = {
+            w['date']: w for w in Word.objects.filter(date__in=[r['date'] for r in chunk]).values('id', *WORD_FIELDS)
+        }
+
+        changed = []
+        for record in chunk:
+            current = existing.get(record['date'])
+            if current is None:
+                self._count('word', 'created', f"{record['date']} {record['secret']}")
+                changed.append(record)
+            elif any(current[f] != record[f] for f in WORD_FIELDS):
+                self._count('word', 'updated', f"{record['date']} {current['secret']} -> {record['secret']}")
+                changed.append(record)
+            else:
+                self._count('word', 'unchanged', record['date'])
+
+        if changed and not self.dry_run:
+            Word.objects.bulk_create(
+                [Word(**{f: r[f] for f in WORD_FIELDS}) for r in changed],
+                update_conflicts=True, unique_fields=['date'], update_fields=['secret', 'phonetic', 'dictionary'],
+            )
+            # Upserts don't report ids on every backend, so look them up
+            existing.update({
+                day: {'id': pk} for day, pk in Word.objects.filter(date__in=[r['date'] for r in changed]).values_list('date', 'id')
+            })
+        for record in chunk:
+            current = existing.get(record['date'])
+            self.word_ids[record['id']] = current['id'] if current else None
+
+    def _components(self, chunk):
+        incoming = {}
+        for record in chunk:
+            incoming.setdefault(record['word'], []).append(
+                (record['position'], self.pattern_ids[record['pattern']], bool(record.get('no_change', False)))
+            )
+
+        word_ids = [self.word_ids[w] for w in incoming if self.word_ids[w] is not None]
+        current = {}
+        for word_id, position, pattern_id, no_change in (
+            PhoneticComponent.objects.filter(word_id__in=word_ids)
+            .order_by('position').values_list('word_id', 'position', 'pattern_id', 'no_change')
+        ):
+            current.setdefault(word_id, []).append((position, pattern_id, no_change))
+
+        replace = []
+        for old_word_id, components in incoming.items():
+            word_id = self.word_ids[old_word_id]
+            components.sort()
+            have = current.get(word_id)
+            if have == components:
+                self.summary['component']['unchanged'] += len(components)
+                continue
+            action = 'updated' if have else 'created'
+            self.summary['component'][action] += len(components)
+            self.on_change('component', action, f'word {word_id or "(new)"}: {len(components)} components')
+            replace.append((word_id, components))
+
+        if replace and not self.dry_run:
+            PhoneticComponent.objects.filter(word_id__in=[word_id for word_id, _ in replace]).delete()
+            PhoneticComponent.objects.bulk_create([
+                PhoneticComponent(word_id=word_id, pattern_id=pattern_id, position=position, no_change=no_change)
+                for word_id, components in replace
+                for position, pattern_id, no_change in components
+            ])
@@ -0,0 +1,113 @@
+"""
+Which dictionary words can be spelled from the PhoneticPattern inventory.
+
+Every word is segmented into pattern `letters` groups ("nation" -> n-a-ti-o-n)
+with a trie over the distinct groups and a DP over the word: best[i] is the
+cheapest segmentation of word[:i] as (letters not covered by any group,
+segments). Letters no group covers are kept as one-letter gap segments, so
+every word gets a segmentation; adjacent gap letters make up the word's
+missing groups. A word is covered when it has no gaps.
+
+Words are mined in chunks across a process pool; each worker builds its own
+trie (microseconds for a few hundred groups).
+"""
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+END = '$'  # Trie key marking the end of a group
+MAX_GROUP_LETTERS = 4  # Longest run worth suggesting as a new pattern ("eigh", "ough")
+
+
+def pattern_groups(letters):
+    """Distinct usable letters groups - the identity pattern ('*') and anything non-alphabetic is skipped"""
+    return sorted({g.lower() for g in letters if g.isascii() and g.isalpha()})
+
+
+def build_trie(groups):
+    root = {}
+    for group in groups:
+        node = root
+        for char in group:
+            node = node.setdefault(char, {})
+        node[END] = True
+    return root
+
+
+def segment(word, trie):
+    """
+    Return (segments, missing) for one word: the segmentation with the fewest
+    uncovered letters, then the fewest segments, and the uncovered runs.
+    """
+    n = len(word)
+    best = [None] * (n + 1)
+    back = [None] * (n + 1)  # (start of the last segment, whether it's a known group)
+    best[0] = (0, 0)
+
+    def relax(j, cost, step):
+        if best[j] is None or cost < best[j]:
+            best[j] = cost
+            back[j] = step
+
+    for i in range(n):
+        gaps, count = best[i]
+        node = trie
+        for j in range(i, n):
+            node = node.get(word[j])
+            if node is None:
+                break
+            if END in node:
+                relax(j + 1, (gaps, count + 1), (i, True))
+        relax(i + 1, (gaps + 1, count + 1), (i, False))
+
+    segments, missing = [], []
+    j, run = n, ''
+    while j:
+        i, known = back[j]
+        if known:
+            if run:
+                missing.append(run)
+                run = ''
+        else:
+            run = word[i] + run
+        segments.append(word[i:j])
+        j = i
+    if run:
+        missing.append(run)
+    return segments[::-1], missing[::-1]
+
+
+def _mine_chunk(args):
+    words, groups = args
+    trie = build_trie(groups)
+    return [(word, *segment(word, trie)) for word in words]
+
+
+def mine(words, groups, workers=None, chunk_size=5000):
+    """Yield (word, segments, missing) for every word, in chunks across a process pool"""
+    jobs = [(words[i:i + chunk_size], groups) for i in range(0, len(words), chunk_size)]
+    if workers == 1 or len(jobs) < 2:
+        for chunk in map(_mine_chunk, jobs):
+            yield from chunk
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for chunk in pool.map(_mine_chunk, jobs):
+            yield from chunk
+
+
+def rank_missing(missing_by_word, max_letters=MAX_GROUP_LETTERS):
+    """
+    Rank letters groups a new pattern could add, from {word: [missing groups]}.
+    Returns [(group, words it alone would unlock, words it appears missing in)],
+    best first. Runs longer than `max_letters` aren't plausible patterns.
+    """
+    unlocks, appears = Counter(), Counter()
+    for missing in missing_by_word.values():
+        distinct = {group for group in missing if len(group) <= max_letters}
+        for group in distinct:
+            appears[group] += 1
+        if len(set(missing)) == 1 and distinct:
+            unlocks[missing[0]] += 1
+    return sorted(
+        ((group, unlocks[group], count) for group, count in appears.items()),
+        key=lambda row: (-row[1], -row[2], row[0]),
+    )
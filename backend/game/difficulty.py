@@ -0,0 +1,162 @@
+"""
+Puzzle difficulty metrics computed over the whole lexicon.
+
+For each word length:
+1. Pick the opener: among the OPENER_POOL words with the best letter coverage,
+   the guess that minimizes the expected number of remaining candidates.
+2. Partition every word of that length by the feedback it gives to the opener.
+   A word's `expected_remaining` is the size of its partition.
+3. Solve each partition with a greedy strategy (guess the member covering the
+   most common letters in the partition, split again, repeat). A word's
+   `solve_depth` is the guess it is found on; `worst_case_depth` is the deepest
+   word in its first partition, i.e. what a player facing the same feedback
+   may need in the worst case.
+4. `rarity` is the mean surprisal (-log2 frequency) of the word's letters
+   within its length group.
+
+Feedback is encoded as a base-3 integer per guess (0 absent, 1 present,
+2 correct per position) and computed with NumPy for all words at once.
+"""
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .solver import get_tables
+
+OPENER_POOL = 100
+ABSENT, PRESENT, CORRECT = 0, 1, 2
+
+
+def feedback_codes(codes, counts, guess):
+    """
+    Feedback of `guess` (array of letter codes) against every row of `codes`,
+    encoded as one base-3 integer per row. Matches `puzzles.letter_feedback`
+    for same-length words.
+    """
+    green = codes == guess[None, :]
+    pattern = np.zeros(len(codes), dtype=np.int32)
+    remaining = {}
+    seen = {}
+    for letter in np.unique(guess):
+        at = guess == letter
+        remaining[letter] = counts[:, letter].astype(np.int16) - green[:, at].sum(axis=1)
+        seen[letter] = np.zeros(len(codes), dtype=np.int16)
+
+    place = 1
+    for i, letter in enumerate(guess):
+        not_green = ~green[:, i]
+        present = not_green & (seen[letter] < remaining[letter])
+        seen[letter] += not_green
+        pattern += place * np.where(green[:, i], CORRECT, np.where(present, PRESENT, ABSENT))
+        place *= 3
+    return pattern
+
+
+def _solved_pattern(length):
+    """Feedback code of an all-green guess"""
+    return sum(CORRECT * 3 ** i for i in range(length))
+
+
+def _coverage_scores(counts):
+    """Sum of letter frequencies over each word's distinct letters"""
+    presence = counts > 0
+    return presence @ presence.sum(axis=0)
+
+
+def choose_opener(codes, counts):
+    """Row index of the best opening guess for this word group"""
+    pool = np.argsort(-_coverage_scores(counts), kind='stable')[:OPENER_POOL]
+    best, best_score = pool[0], None
+    for row in pool:
+        _, sizes = np.unique(feedback_codes(codes, counts, codes[row]), return_counts=True)
+        # Expected remaining candidates if the target is uniformly random
+        score = (sizes.astype(np.int64) ** 2).sum()
+        if best_score is None or score < best_score:
+            best, best_score = row, score
+    return best
+
+
+def solve_depths(codes, counts):
+    """
+    Number of guesses a greedy solver needs for each row, starting from
+    no information about which row is the target.
+    """
+    depths = np.zeros(len(codes), dtype=np.int16)
+    solved_pattern = _solved_pattern(codes.shape[1])
+    stack = [(np.arange(len(codes)), 1)]
+    while stack:
+        rows, depth = stack.pop()
+        if len(rows) == 1:
+            depths[rows[0]] = depth
+            continue
+        guess_row = rows[np.argmax(_coverage_scores(counts[rows]))]
+        patterns = feedback_codes(codes[rows], counts[rows], codes[guess_row])
+        order = np.argsort(patterns, kind='stable')
+        keys, starts = np.unique(patterns[order], return_index=True)
+        for key, group in zip(keys, np.split(rows[order], starts[1:])):
+            if key == solved_pattern:
+                depths[group] = depth
+            else:
+                stack.append((group, depth + 1))
+    return depths
+
+
+def _score_partition(args):
+    codes, counts = args
+    return solve_depths(codes, counts)
+
+
+def score_length(table, workers=None):
+    """
+    Score every word in a solver WordTable. Returns a dict of NumPy arrays
+    aligned with `table.words` plus the chosen opener.
+    """
+    codes, counts = table.codes, table.counts
+    length = codes.shape[1]
+
+    freq = counts.sum(axis=0).astype(np.float64)
+    surprisal = -np.log2(np.where(freq > 0, freq / freq.sum(), 1.0))
+    rarity = (counts @ surprisal) / length
+
+    opener = choose_opener(codes, counts)
+    patterns = feedback_codes(codes, counts, codes[opener])
+    order = np.argsort(patterns, kind='stable')
+    keys, starts, sizes = np.unique(patterns[order], return_index=True, return_counts=True)
+    expected_remaining = np.empty(len(codes), dtype=np.int32)
+    expected_remaining[order] = np.repeat(sizes, sizes)
+
+    solved = _solved_pattern(length)
+    partitions = [
+        rows for key, rows in zip(keys, np.split(order, starts[1:]))
+        if key != solved
+    ]
+    jobs = [(codes[rows], counts[rows]) for rows in partitions]
+    if workers == 1 or len(jobs) < 2:
+        results = list(map(_score_partition, jobs))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_score_partition, jobs, chunksize=max(len(jobs) // 64, 1)))
+
+    # The opener itself is solved on guess 1; everyone else needs the opener
+    # plus however deep their partition goes
+    solve_depth = np.ones(len(codes), dtype=np.int16)
+    worst_case_depth = np.ones(len(codes), dtype=np.int16)
+    for rows, depths in zip(partitions, results):
+        solve_depth[rows] = depths + 1
+        worst_case_depth[rows] = depths.max() + 1
+
+    return {
+        'opener': str(table.words[opener]),
+        'expected_remaining': expected_remaining,
+        'solve_depth': solve_depth,
+        'worst_case_depth': worst_case_depth,
+        'rarity': rarity,
+    }
+
+
+def score_lexicon(lengths=None, workers=None):
+    """Yield (length, table, scores) for every word length in the lexicon"""
+    for length, table in sorted(get_tables().items()):
+        if lengths and length not in lengths:
+            continue
+        yield length, table, score_length(table, workers=workers)
@@ -0,0 +1,137 @@
+"""
+Buffered guess-event logging.
+
+Views call `log_guess()`, which only appends to a per-process list - no query
+runs in the request. A background thread per worker writes the buffer out as
+one COPY (PostgreSQL) or multi-row INSERT whenever GUESS_EVENT_FLUSH_EVENTS
+events are waiting or GUESS_EVENT_FLUSH_MS has passed, and `flush()` runs once
+more on worker exit (gunicorn `worker_exit`, or atexit elsewhere).
+
+On PostgreSQL guessEvent is partitioned by puzzle_date; the daily partition a
+batch needs is created on first use. If the database is unreachable events
+stay buffered up to GUESS_EVENT_MAX_BUFFER, after which the oldest are dropped.
+"""
+import atexit
+import csv
+import io
+import logging
+import os
+import threading
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection
+from django.utils import timezone
+
+from .models import GuessEvent
+
+logger = logging.getLogger(__name__)
+
+FIELDS = ['puzzle_date', 'player_key', 'guess', 'result', 'created_at']
+
+
+def partition_name(day):
+    return f'guessEvent_{day:%Y%m%d}'
+
+
+def create_partition(cursor, day):
+    """Create the guessEvent partition holding `day` if it doesn't exist (PostgreSQL)"""
+    cursor.execute(
+        f'CREATE TABLE IF NOT EXISTS "{partition_name(day)}" PARTITION OF "guessEvent" '
+        f"FOR VALUES FROM ('{day.isoformat()}') TO ('{(day + timedelta(days=1)).isoformat()}')"
+    )
+
+
+class EventBuffer:
+    """Per-process event buffer drained by a daemon thread"""
+
+    def __init__(self, flush_events, flush_ms, max_buffer):
+        self.flush_events = flush_events
+        self.flush_seconds = flush_ms / 1000
+        self.max_buffer = max_buffer
+        self.dropped = 0
+        self._events = []
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._pid = None
+        self._partitions = set()
+
+    def add(self, event):
+        with self._lock:
+            if self._pid != os.getpid():
+                # First event in this process (or first after a fork) - the
+                # parent's thread and buffer don't carry over
+                self._pid = os.getpid()
+                self._events = []
+                self._partitions = set()
+                threading.Thread(target=self._run, name='guess-event-flusher', daemon=True).start()
+            self._events.append(event)
+            if len(self._events) > self.max_buffer:
+                overflow = len(self._events) - self.max_buffer
+                del self._events[:overflow]
+                self.dropped += overflow
+            if len(self._events) >= self.flush_events:
+                self._wake.set()
+
+    def _run(self):
+        while True:
+            self._wake.wait(self.flush_seconds)
+            self._wake.clear()
+            self.flush()
+
+    def flush(self):
+        """Write out everything buffered so far. Returns the number of events written."""
+        with self._flush_lock:
+            with self._lock:
+                batch, self._events = self._events, []
+            if not batch:
+                return 0
+            try:
+                connection.close_if_unusable_or_obsolete()
+                self._write(batch)
+            except Exception:
+                logger.exception('Writing %d guess events failed; keeping them for the next flush', len(batch))
+                with self._lock:
+                    self._events[:0] = batch
+                    del self._events[:max(0, len(self._events) - self.max_buffer)]
+                return 0
+            return len(batch)
+
+    def _write(self, batch):
+        if connection.vendor != 'postgresql':
+            GuessEvent.objects.bulk_create([GuessEvent(**dict(zip(FIELDS, row))) for row in batch])
+            return
+
+        data = io.StringIO()
+        # Quote everything so an empty string isn't read back as NULL
+        csv.writer(data, quoting=csv.QUOTE_ALL).writerows(
+            (puzzle_date.isoformat(), player_key, guess, result, created_at.isoformat())
+            for puzzle_date, player_key, guess, result, created_at in batch
+        )
+        data.seek(0)
+        with connection.cursor() as cursor:
+            for day in {row[0] for row in batch} - self._partitions:
+                create_partition(cursor, day)
+                self._partitions.add(day)
+            cursor.cursor.copy_expert(
+                f'COPY "guessEvent" ({", ".join(FIELDS)}) FROM STDIN WITH (FORMAT csv)', data,
+            )
+
+
+buffer = EventBuffer(
+    settings.GUESS_EVENT_FLUSH_EVENTS,
+    settings.GUESS_EVENT_FLUSH_MS,
+    settings.GUESS_EVENT_MAX_BUFFER,
+)
+atexit.register(buffer.flush)
+
+
+def log_guess(puzzle_date, player_key, guess, result):
+    """Queue one guess for the analytics table"""
+    if settings.GUESS_EVENTS_ENABLED:
+        buffer.add((puzzle_date, player_key, guess[:50], result, timezone.now()))
+
+
+def flush():
+    return buffer.flush()
@@ -0,0 +1,129 @@
+"""
+In-process dictionaries, keyed by dictionary ID.
+
+Each dictionary is loaded on first use - 'en' from the ValidWord table, the
+others from word-list files (see LEXICON_DICTIONARIES in settings) - and kept
+as a frozenset for O(1) membership checks. When the loaded dictionaries exceed
+LEXICON_MEMORY_BUDGET_MB, the least recently used ones are evicted and simply
+reload on their next use.
+
+Under gunicorn with `preload_app` the default dictionary is built in the master
+and shared copy-on-write with the workers.
+"""
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+
+from .models import ValidWord
+
+DEFAULT_DICTIONARY = 'en'
+
+
+class UnknownDictionary(KeyError):
+    pass
+
+
+class LexiconRegistry:
+    """Lazily loaded dictionaries with LRU eviction beyond a memory budget"""
+
+    def __init__(self, budget_bytes):
+        self.budget_bytes = budget_bytes
+        self._lock = threading.Lock()
+        self._loaded = OrderedDict()  # id -> {'words', 'bytes', 'load_seconds', 'loaded_at'}
+
+    def get(self, dictionary_id):
+        """Return the frozenset of words for `dictionary_id`, loading it if needed"""
+        entry = self._loaded.get(dictionary_id)
+        if entry is None:
+            with self._lock:
+                entry = self._loaded.get(dictionary_id)
+                if entry is None:
+                    entry = self._load(dictionary_id)
+                    if not entry['words']:
+                        # Not populated yet - don't pin an empty set for the process lifetime
+                        return entry['words']
+                    self._loaded[dictionary_id] = entry
+                    self._evict(keep=dictionary_id)
+        with self._lock:
+            if dictionary_id in self._loaded:
+                self._loaded.move_to_end(dictionary_id)
+        return entry['words']
+
+    def _load(self, dictionary_id):
+        config = settings.LEXICON_DICTIONARIES.get(dictionary_id)
+        if config is None:
+            raise UnknownDictionary(dictionary_id)
+
+        start = time.perf_counter()
+        if 'path' in config:
+            with open(config['path'], encoding='utf-8') as f:
+                words = frozenset(line.strip().lower() for line in f if line.strip())
+        else:
+            words = frozenset(ValidWord.objects.values_list('word', flat=True).iterator(chunk_size=10000))
+        return {
+            'words': words,
+            'bytes': sys.getsizeof(words) + sum(sys.getsizeof(w) for w in words),
+            'load_seconds': time.perf_counter() - start,
+            'loaded_at': time.time(),
+        }
+
+    def _evict(self, keep):
+        total = sum(e['bytes'] for e in self._loaded.values())
+        for dictionary_id in list(self._loaded):
+            if total <= self.budget_bytes:
+                break
+            if dictionary_id == keep:
+                continue
+            total -= self._loaded.pop(dictionary_id)['bytes']
+
+    def clear(self, dictionary_id=None):
+        """Drop one (or every) loaded dictionary"""
+        with self._lock:
+            if dictionary_id is None:
+                self._loaded.clear()
+            else:
+                self._loaded.pop(dictionary_id, None)
+
+    def stats(self):
+        """Per-dictionary load state, size and load time"""
+        with self._lock:
+            loaded = dict(self._loaded)
+        return [
+            {
+                'id': dictionary_id,
+                'loaded': dictionary_id in loaded,
+                'words': len(loaded[dictionary_id]['words']) if dictionary_id in loaded else None,
+                'bytes': loaded[dictionary_id]['bytes'] if dictionary_id in loaded else None,
+                'load_seconds': loaded[dictionary_id]['load_seconds'] if dictionary_id in loaded else None,
+            }
+            for dictionary_id in settings.LEXICON_DICTIONARIES
+        ]
+
+
+registry = LexiconRegistry(settings.LEXICON_MEMORY_BUDGET_MB * 1024 * 1024)
+
+
+def known_dictionary(dictionary_id):
+    """
+    `dictionary_id` if it's configured, else DEFAULT_DICTIONARY - a puzzle
+    whose dictionary was removed from settings still has to be playable.
+    """
+    return dictionary_id if dictionary_id in settings.LEXICON_DICTIONARIES else DEFAULT_DICTIONARY
+
+
+def get_lexicon(dictionary_id=DEFAULT_DICTIONARY):
+    """Return the set of valid words in a dictionary, loading it on first use."""
+    return registry.get(dictionary_id)
+
+
+def is_valid_word(word, dictionary_id=DEFAULT_DICTIONARY):
+    """True if `word` is in the dictionary"""
+    return word in registry.get(dictionary_id)
+
+
+def clear_lexicon(dictionary_id=None):
+    """Drop cached dictionaries so the next lookup reloads them"""
+    registry.clear(dictionary_id)
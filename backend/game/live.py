@@ -0,0 +1,118 @@
+"""
+Live solve counts and leaderboard over Server-Sent Events.
+
+One Broadcaster per worker process fans a single change feed out to every
+connected client. While anyone is connected, one asyncio task checks the
+cheap change signal - the `players` counter on today's PuzzleStats row, which
+record_result() bumps for every finished game - every LIVE_POLL_SECONDS.
+Only when it moves does it build the new payloads (one more indexed top-5
+query), encode them once and drop the bytes into each client's queue. Idle
+connections are just a parked coroutine and a small queue.
+
+Events:
+    solves       {"date": "...", "players": N, "solved": N}
+    leaderboard  {"top_5": [...]}   same entries as leaderboard/
+
+Needs the ASGI server (ghotidle_backend.asgi). Django 4.2 doesn't notice a
+client going away mid-stream, so each stream ends after LIVE_MAX_SECONDS and
+EventSource reconnects on its own.
+"""
+import asyncio
+import json
+import logging
+import time
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.utils import timezone
+
+from .models import PuzzleStats
+from .puzzles import current_puzzle
+from .stats import LEADERBOARD_RANKING, leaderboard_entry, leaderboard_rows
+
+logger = logging.getLogger(__name__)
+
+QUEUE_SIZE = 8
+HEARTBEAT = b': ping\n\n'
+
+
+def encode(event, data):
+    return f'event: {event}\ndata: {json.dumps(data, default=str)}\n\n'.encode()
+
+
+def _changes(last_signal):
+    """Return (signal, [(event, encoded message)]) - messages only if the signal moved"""
+    word_obj, _ = current_puzzle()
+    puzzle_date = word_obj.date if word_obj else timezone.now().date()
+    stats = PuzzleStats.objects.filter(date=puzzle_date).first() or PuzzleStats(date=puzzle_date)
+    signal = (puzzle_date, stats.players)
+    if signal == last_signal:
+        return signal, []
+
+    top = leaderboard_rows('all', puzzle_date).order_by(*LEADERBOARD_RANKING)[:5]
+    return signal, [
+        ('solves', encode('solves', {
+            'date': puzzle_date.isoformat(),
+            'players': stats.players,
+            'solved': sum(stats.distribution.values()),
+        })),
+        ('leaderboard', encode('leaderboard', {
+            'top_5': [leaderboard_entry(rank, stat) for rank, stat in enumerate(top, start=1)],
+        })),
+    ]
+
+
+class Broadcaster:
+
+    def __init__(self):
+        self._subscribers = set()
+        self._latest = {}  # event name -> encoded message, replayed to new clients
+        self._task = None
+
+    def _publish(self, message):
+        for queue in self._subscribers:
+            if queue.full():
+                # Slow client: drop its oldest update rather than buffer without bound
+                queue.get_nowait()
+            queue.put_nowait(message)
+
+    async def _poll(self):
+        signal = None
+        while self._subscribers:
+            try:
+                signal, events = await sync_to_async(_changes)(signal)
+            except Exception:
+                logger.exception('Live feed poll failed')
+                events = []
+            for name, message in events:
+                if self._latest.get(name) != message:
+                    self._latest[name] = message
+                    self._publish(message)
+            await asyncio.sleep(settings.LIVE_POLL_SECONDS)
+        self._latest.clear()
+
+    async def stream(self):
+        """Async iterator of SSE bytes for one client"""
+        queue = asyncio.Queue(QUEUE_SIZE)
+        self._subscribers.add(queue)
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._poll())
+        deadline = time.monotonic() + settings.LIVE_MAX_SECONDS
+        try:
+            yield b'retry: 3000\n\n'
+            for message in list(self._latest.values()):
+                yield message
+            while (remaining := deadline - time.monotonic()) > 0:
+                try:
+                    yield await asyncio.wait_for(queue.get(), min(settings.LIVE_HEARTBEAT_SECONDS, remaining))
+                except asyncio.TimeoutError:
+                    yield HEARTBEAT
+        finally:
+            self._subscribers.discard(queue)
+
+    @property
+    def clients(self):
+        return len(self._subscribers)
+
+
+broadcaster = Broadcaster()
@@ -0,0 +1,115 @@
+"""
+DB-backed outbox for outgoing email.
+
+Views call `queue_mail()`, which is a single INSERT, so request latency never
+depends on the mail server. `manage.py run_mail_worker` drains the outbox with
+`drain_outbox()` over one reused backend connection, retrying failures with
+exponential backoff.
+"""
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage
+from django.db import connection as db_connection, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import OutboundEmail
+
+MAX_ATTEMPTS = 5
+BACKOFF_BASE = 30        # seconds; doubles on every failed attempt
+BACKOFF_MAX = 60 * 60    # cap retries at one per hour
+CLAIM_LEASE = 5 * 60     # a claimed row becomes due again if its worker dies
+
+
+def queue_mail(subject, message, recipient, from_email=None):
+    """Add an email to the outbox and return the row"""
+    return OutboundEmail.objects.create(
+        subject=subject,
+        body=message,
+        from_email=from_email or settings.DEFAULT_FROM_EMAIL,
+        to_email=recipient,
+    )
+
+
+def backoff_delay(attempts):
+    """Seconds to wait before retry number `attempts`"""
+    return min(BACKOFF_BASE * 2 ** (attempts - 1), BACKOFF_MAX)
+
+
+def claim_batch(batch_size):
+    """
+    Claim up to `batch_size` due emails. Claimed rows get their attempt counted
+    and their next_attempt_at pushed out by CLAIM_LEASE, so concurrent workers
+    skip them and a crashed worker's rows are retried later.
+    """
+    now = timezone.now()
+    lease = now + timedelta(seconds=CLAIM_LEASE)
+    with transaction.atomic():
+        due = OutboundEmail.objects.filter(
+            status=OutboundEmail.PENDING, next_attempt_at__lte=now,
+        ).order_by('next_attempt_at')
+        if db_connection.features.has_select_for_update_skip_locked:
+            due = due.select_for_update(skip_locked=True)
+        batch = list(due[:batch_size])
+        if batch:
+            OutboundEmail.objects.filter(pk__in=[e.pk for e in batch]).update(
+                attempts=F('attempts') + 1,
+                next_attempt_at=lease,
+            )
+            for email in batch:
+                email.attempts += 1
+                email.next_attempt_at = lease
+    return batch
+
+
+def renew_lease(email):
+    """
+    Push the claim on `email` out by another CLAIM_LEASE before sending it.
+    Returns False if the lease already lapsed and another worker re-claimed the
+    row, in which case it must not be sent again from here.
+    """
+    lease = timezone.now() + timedelta(seconds=CLAIM_LEASE)
+    renewed = OutboundEmail.objects.filter(
+        pk=email.pk, status=OutboundEmail.PENDING, next_attempt_at=email.next_attempt_at,
+    ).update(next_attempt_at=lease)
+    email.next_attempt_at = lease
+    return bool(renewed)
+
+
+def drain_outbox(connection, batch_size=50, max_attempts=MAX_ATTEMPTS):
+    """
+    Send one batch of due emails over an open mail backend connection.
+    Returns (sent, failed) counts for the batch. Each email's lease is renewed
+    just before it's sent, so a slow batch never outlives its claim.
+    """
+    batch = claim_batch(batch_size)
+    sent = failed = 0
+    for email in batch:
+        if not renew_lease(email):
+            continue
+        message = EmailMessage(
+            subject=email.subject,
+            body=email.body,
+            from_email=email.from_email,
+            to=[email.to_email],
+            connection=connection,
+        )
+        try:
+            message.send(fail_silently=False)
+        except Exception as e:
+            failed += 1
+            email.last_error = str(e)
+            if email.attempts >= max_attempts:
+                email.status = OutboundEmail.FAILED
+            else:
+                email.next_attempt_at = timezone.now() + timedelta(seconds=backoff_delay(email.attempts))
+            email.save(update_fields=['status', 'next_attempt_at', 'last_error'])
+            continue
+
+        sent += 1
+        email.status = OutboundEmail.SENT
+        email.sent_at = timezone.now()
+        email.last_error = ''
+        email.save(update_fields=['status', 'sent_at', 'last_error'])
+    return sent, failed
@@ -0,0 +1,58 @@
+import time
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError
+
+from game.scheduling import autoschedule
+
+
+def parse_date(value):
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise CommandError(f'Invalid date "{value}". Use YYYY-MM-DD.')
+
+
+class Command(BaseCommand):
+    help = 'Fill every empty puzzle date in a range with reused library words, respecting scheduling constraints'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--start', help='First date to fill (default: today)')
+        parser.add_argument('--end', help='Last date to fill (default: --days after --start)')
+        parser.add_argument('--days', type=int, default=365, help='Range length when --end is not given')
+        parser.add_argument('--min-gap', type=int, default=180, help='Days before the same word may appear again')
+        parser.add_argument('--max-overlap', type=int, default=3, help='Max distinct letters shared by adjacent days')
+        parser.add_argument('--seed', type=int, default=None, help='Random seed for a reproducible schedule')
+        parser.add_argument('--dry-run', action='store_true', help='Print the assignment without saving it')
+
+    def handle(self, *args, **options):
+        start = parse_date(options['start']) if options['start'] else date.today()
+        end = parse_date(options['end']) if options['end'] else start + timedelta(days=options['days'] - 1)
+        if end < start:
+            raise CommandError('--end must not be before --start')
+
+        began = time.perf_counter()
+        try:
+            result = autoschedule(
+                start, end,
+                min_gap=options['min_gap'],
+                max_overlap=options['max_overlap'],
+                seed=options['seed'],
+                dry_run=options['dry_run'],
+            )
+        except IntegrityError as e:
+            raise CommandError(f'A date in the range was scheduled concurrently, nothing saved: {e}')
+
+        if options['dry_run'] or options['verbosity'] > 1:
+            for day, secret, difficulty in result.assigned:
+                self.stdout.write(f'  {day}  {secret}  {difficulty or "-"}')
+        if result.unfilled:
+            self.stdout.write(self.style.WARNING(
+                f'No candidate fit {len(result.unfilled)} dates: ' + ', '.join(str(d) for d in result.unfilled[:10])
+                + (' ...' if len(result.unfilled) > 10 else '')
+            ))
+        verb = 'Would fill' if options['dry_run'] else 'Filled'
+        self.stdout.write(self.style.SUCCESS(
+            f'{verb} {len(result.assigned)} dates from {start} to {end} in {time.perf_counter() - began:.2f}s'
+        ))
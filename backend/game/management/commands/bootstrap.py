@@ -0,0 +1,117 @@
+import hashlib
+import io
+import subprocess
+import sys
+import time
+
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db import DatabaseError
+from django.db.migrations.loader import MigrationLoader
+
+from game.models import BootstrapState
+from .load_sample_data import SAMPLE_DATA_VERSION
+from .load_valid_words import WORDS_FILE
+
+IMPORT_PROBE = (
+    'import time; t = time.perf_counter(); '
+    'from ghotidle_backend.wsgi import application; '
+    'print(time.perf_counter() - t)'
+)
+
+
+def migrations_hash():
+    """Hash of the latest migration of every app, read from disk (no DB access)"""
+    loader = MigrationLoader(None, ignore_no_migrations=True)
+    leaves = sorted(f'{app}.{name}' for app, name in loader.graph.leaf_nodes())
+    return hashlib.sha256('\n'.join(leaves).encode()).hexdigest()
+
+
+def lexicon_checksum():
+    """SHA-256 of the word list file"""
+    digest = hashlib.sha256()
+    with open(WORDS_FILE, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class Command(BaseCommand):
+    help = (
+        'Prepare the database for serving: migrate, load valid words, load sample data '
+        'and create the admin user, skipping any step whose fingerprint is unchanged'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--force', action='store_true', help='Run every step regardless of the fingerprint')
+        parser.add_argument('--skip-sample-data', action='store_true', help='Do not load sample puzzle words')
+        parser.add_argument(
+            '--measure-import', action='store_true',
+            help='Time a cold import of the Django app in a fresh interpreter',
+        )
+
+    def handle(self, *args, **options):
+        total_start = time.perf_counter()
+        force = options['force']
+
+        try:
+            state = BootstrapState.objects.first()
+        except DatabaseError:
+            # Fresh database - the fingerprint table itself hasn't been migrated yet
+            state = None
+        state = state or BootstrapState(migrations_hash='', lexicon_checksum='')
+
+        current = {
+            'migrations': migrations_hash(),
+            'lexicon': lexicon_checksum(),
+            'sample_data': SAMPLE_DATA_VERSION,
+        }
+
+        steps = [
+            ('migrate', force or state.migrations_hash != current['migrations'],
+             lambda: call_command('migrate', interactive=False, verbosity=0)),
+            ('load_valid_words', force or state.lexicon_checksum != current['lexicon'],
+             lambda: call_command('load_valid_words', force=True, verbosity=0, stdout=io.StringIO())),
+            ('load_sample_data',
+             not options['skip_sample_data'] and (force or state.sample_data_version != current['sample_data']),
+             lambda: call_command('load_sample_data', verbosity=0, stdout=io.StringIO())),
+            # Cheap idempotent check that depends on env vars, so it always runs
+            ('create_admin', True, lambda: call_command('create_admin', stdout=io.StringIO())),
+        ]
+
+        for name, stale, run in steps:
+            if not stale:
+                self.stdout.write(f'  {name:<18} up to date')
+                continue
+            start = time.perf_counter()
+            run()
+            self.stdout.write(f'  {name:<18} ran in {(time.perf_counter() - start) * 1000:.0f} ms')
+
+        if options['measure_import']:
+            try:
+                state.import_seconds = self._measure_import()
+                self.stdout.write(f'  {"import time":<18} {state.import_seconds * 1000:.0f} ms')
+            except subprocess.CalledProcessError as e:
+                # Only a measurement - don't block the server start the steps above just prepared
+                self.stderr.write(self.style.WARNING(
+                    f'  {"import time":<18} probe failed (exit {e.returncode}): {e.stderr.strip()[-500:]}'
+                ))
+
+        state.migrations_hash = current['migrations']
+        state.lexicon_checksum = current['lexicon']
+        if not options['skip_sample_data']:
+            state.sample_data_version = current['sample_data']
+        state.save()
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Bootstrap finished in {(time.perf_counter() - total_start) * 1000:.0f} ms'
+        ))
+
+    def _measure_import(self):
+        result = subprocess.run(
+            [sys.executable, '-c', IMPORT_PROBE],
+            cwd=settings.BASE_DIR, capture_output=True, text=True, check=True,
+        )
+        return float(result.stdout.strip().splitlines()[-1])
+
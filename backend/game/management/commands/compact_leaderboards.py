@@ -0,0 +1,32 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from game.stats import compact_rollups, rebuild_rollups
+
+
+class Command(BaseCommand):
+    help = (
+        'Drop day/week/month leaderboard rollups older than LEADERBOARD_RETENTION. '
+        'Run after each day boundary (e.g. from cron).'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rebuild-since', metavar='YYYY-MM-DD',
+            help='First recompute rollups from recorded results for periods from this date on',
+        )
+
+    def handle(self, *args, **options):
+        if options['rebuild_since']:
+            try:
+                since = date.fromisoformat(options['rebuild_since'])
+            except ValueError:
+                raise CommandError('--rebuild-since must be YYYY-MM-DD')
+            rows = rebuild_rollups(since)
+            self.stdout.write(f'Rebuilt {rows} rollup rows')
+
+        deleted = compact_rollups(timezone.now().date())
+        summary = ', '.join(f'{count} {period}' for period, count in deleted.items())
+        self.stdout.write(self.style.SUCCESS(f'Deleted expired rollups: {summary}'))
@@ -0,0 +1,34 @@
+import sys
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from game.content import export_records, write_records
+
+
+class Command(BaseCommand):
+    help = 'Stream phonetic patterns, words and components to NDJSON or CSV (see game/content.py)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('output', nargs='?', default='-', help='Output file (default: stdout)')
+        parser.add_argument('--format', choices=['ndjson', 'csv'], help='Default: from the file extension, else ndjson')
+        parser.add_argument('--since', help='Only words dated on or after YYYY-MM-DD (and what they use)')
+        parser.add_argument('--until', help='Only words dated on or before YYYY-MM-DD (and what they use)')
+        parser.add_argument('--chunk-size', type=int, default=2000, help='Rows fetched per cursor round trip')
+
+    def handle(self, *args, **options):
+        output = options['output']
+        fmt = options['format'] or ('csv' if output.endswith('.csv') else 'ndjson')
+        try:
+            since = date.fromisoformat(options['since']) if options['since'] else None
+            until = date.fromisoformat(options['until']) if options['until'] else None
+        except ValueError:
+            raise CommandError('--since/--until must be YYYY-MM-DD')
+
+        records = export_records(since, until, options['chunk_size'])
+        if output == '-':
+            count = write_records(records, sys.stdout, fmt)
+        else:
+            with open(output, 'w', encoding='utf-8', newline='') as f:
+                count = write_records(records, f, fmt)
+            self.stdout.write(self.style.SUCCESS(f'Exported {count} records to {output}'))
@@ -0,0 +1,254 @@
+import csv
+import io
+import re
+import string
+import time
+from datetime import date, timedelta
+
+import numpy as np
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.core.management.color import no_style
+from django.db import connection, models, transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from game.lexicon import get_lexicon
+from game.models import Word, PhoneticPattern, PhoneticComponent, UserStats
+from game.sounds import sound_ids_for
+
+SOUNDS = [
+    'a', 'ay', 'aw', 'b', 'ch', 'd', 'e', 'ee', 'f', 'g', 'h', 'i', 'j', 'k', 'ks', 'kw', 'l', 'm', 'n',
+    'ng', 'o', 'oh', 'oo', 'p', 'r', 's', 'sh', 't', 'th', 'u', 'uh', 'v', 'w', 'y', 'z', 'zh',
+]
+CLEAR_BATCH = 5000  # Rows per DELETE statement with --clear
+
+
+class Command(BaseCommand):
+    help = (
+        'Bulk-generate synthetic users, stats, patterns and years of scheduled puzzles for scale testing. '
+        'Uses COPY on PostgreSQL and chunked bulk_create elsewhere; output is deterministic for a given --seed.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=100000, help='Users (with UserStats) to create')
+        parser.add_argument('--days', type=int, default=3 * 365, help='Consecutive days of puzzles to schedule')
+        parser.add_argument('--patterns', type=int, default=5000, help='Phonetic patterns to create')
+        parser.add_argument('--seed', type=int, default=0, help='Random seed')
+        parser.add_argument('--prefix', default='load', help='Prefix for generated usernames and pattern references')
+        parser.add_argument('--chunk-size', type=int, default=50000, help='Rows per COPY / bulk_create chunk')
+        parser.add_argument('--clear', action='store_true', help='Delete previously generated data with this prefix and exit')
+
+    def handle(self, *args, **options):
+        self.prefix = options['prefix']
+        self.chunk_size = options['chunk_size']
+        self.use_copy = connection.vendor == 'postgresql'
+
+        if options['clear']:
+            self._clear()
+            return
+
+        rng = np.random.default_rng(options['seed'])
+        total_start = time.perf_counter()
+        with transaction.atomic():
+            pattern_ids = self._timed('patterns', self._patterns, rng, options['patterns'])
+            self._timed('users', self._users, rng, options['users'])
+            self._timed('puzzles', self._puzzles, rng, options['days'], pattern_ids)
+            if self.use_copy:
+                # Explicit ids were inserted, so move the serial sequences past them
+                with connection.cursor() as cursor:
+                    for sql in connection.ops.sequence_reset_sql(no_style(), [User, Word, PhoneticPattern, PhoneticComponent]):
+                        cursor.execute(sql)
+
+        self.stdout.write(self.style.SUCCESS(f'Done in {time.perf_counter() - total_start:.1f}s'))
+
+    def _timed(self, name, func, *args):
+        start = time.perf_counter()
+        result = func(*args)
+        self.stdout.write(f'  {name:<10} {time.perf_counter() - start:.1f}s')
+        return result
+
+    def _next_id(self, model):
+        return (model.objects.aggregate(m=Max('pk'))['m'] or 0) + 1
+
+    def _write(self, model, fields, rows):
+        """Insert an iterable of tuples (values for `fields`, by attname) in chunks"""
+        count = 0
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= self.chunk_size:
+                self._flush(model, fields, chunk)
+                count += len(chunk)
+                chunk = []
+        if chunk:
+            self._flush(model, fields, chunk)
+            count += len(chunk)
+        return count
+
+    def _flush(self, model, fields, chunk):
+        if not self.use_copy:
+            model.objects.bulk_create([model(**dict(zip(fields, row))) for row in chunk])
+            return
+
+        columns = ', '.join(connection.ops.quote_name(model._meta.get_field(f).column) for f in fields)
+        buffer = io.StringIO()
+        # Quote strings so '' stays an empty string; unquoted empty fields are NULL
+        writer = csv.writer(buffer, quoting=csv.QUOTE_NONNUMERIC)
+        writer.writerows(chunk)
+        buffer.seek(0)
+        with connection.cursor() as cursor:
+            cursor.cursor.copy_expert(
+                f'COPY {connection.ops.quote_name(model._meta.db_table)} ({columns}) FROM STDIN WITH (FORMAT csv)',
+                buffer,
+            )
+
+    def _patterns(self, rng, count):
+        first_id = self._next_id(PhoneticPattern)
+        letters = np.array(list(string.ascii_lowercase))
+        lengths = rng.integers(1, 5, size=count)
+        picks = rng.integers(0, 26, size=(count, 4))
+        sounds = rng.integers(0, len(SOUNDS), size=count)
+        sound_ids = sound_ids_for(SOUNDS)
+        rows = (
+            (
+                first_id + i,
+                ''.join(letters[picks[i, :lengths[i]]]),
+                sound_ids[SOUNDS[sounds[i]]],
+                f'{self.prefix}-{i}',
+            )
+            for i in range(count)
+        )
+        self._write(PhoneticPattern, ['id', 'letters', 'sound_id', 'reference'], rows)
+        return np.arange(first_id, first_id + count)
+
+    def _users(self, rng, count):
+        first_id = self._next_id(User)
+        now = timezone.now()
+
+        # Games played is long-tailed; skill (win rate) clusters around 75%
+        games = np.minimum(rng.geometric(1 / 40, size=count) - 1, 3 * 365)
+        wins = rng.binomial(games, rng.beta(8, 3, size=count))
+        streaks = np.minimum(rng.geometric(1 / 4, size=count) - 1, wins)
+        # Sign-up times ascend with id, matching real auto-increment order
+        joined_offsets = np.sort(rng.uniform(0, 3 * 365 * 86400, size=count))[::-1]
+
+        user_rows = (
+            (
+                first_id + i, '!', False, f'{self.prefix}{i}', '', '', '', False, True,
+                (now - timedelta(seconds=float(joined_offsets[i]))).isoformat(),
+            )
+            for i in range(count)
+        )
+        self._write(User, [
+            'id', 'password', 'is_superuser', 'username', 'first_name', 'last_name', 'email',
+            'is_staff', 'is_active', 'date_joined',
+        ], user_rows)
+
+        stats_rows = (
+            (first_id + i, int(wins[i]), int(games[i] - wins[i]), int(streaks[i]))
+            for i in range(count)
+        )
+        self._write(UserStats, ['user_id', 'correctGuesses', 'wrongGuesses', 'streak'], stats_rows)
+
+    def _puzzles(self, rng, days, pattern_ids):
+        latest = Word.objects.aggregate(m=Max('date'))['m']
+        start = latest + timedelta(days=1) if latest else date.today()
+        first_id = self._next_id(Word)
+
+        lexicon = sorted(w for w in get_lexicon() if 4 <= len(w) <= 7)
+        if not lexicon:
+            self.stderr.write('Lexicon is empty; run load_valid_words first')
+            return
+        secrets = rng.choice(len(lexicon), size=days, replace=days > len(lexicon))
+        component_counts = rng.integers(2, 6, size=days)
+        patterns = rng.choice(pattern_ids, size=int(component_counts.sum()))
+        letters = dict(PhoneticPattern.objects.filter(pk__in=patterns.tolist()).values_list('pk', 'letters'))
+
+        word_rows = []
+        component_rows = []
+        offset = 0
+        for i in range(days):
+            picked = patterns[offset:offset + component_counts[i]].tolist()
+            offset += component_counts[i]
+            word_id = first_id + i
+            word_rows.append((
+                word_id, lexicon[secrets[i]], ''.join(letters[p] for p in picked)[:50],
+                (start + timedelta(days=i)).isoformat(), 'en',
+            ))
+            component_rows.extend((word_id, p, pos, False) for pos, p in enumerate(picked))
+
+        self._write(Word, ['id', 'secret', 'phonetic', 'date', 'dictionary'], word_rows)
+        self._write(PhoneticComponent, ['word_id', 'pattern_id', 'position', 'no_change'], component_rows)
+
+    def _clear(self):
+        # Only the exact names _users / _patterns generate: 'load' must not match a real 'loader'
+        prefix = re.escape(self.prefix)
+        patterns = PhoneticPattern.objects.filter(reference__regex=rf'^{prefix}-[0-9]+$')
+        words = Word.objects.filter(
+            pk__in=PhoneticComponent.objects.filter(pattern__in=patterns).values('word_id'),
+        )
+        users = User.objects.filter(username__regex=rf'^{prefix}[0-9]+$', password='!')
+
+        counts = [
+            self._timed(name, self._delete_in_batches, queryset)
+            for name, queryset in (('words', words), ('patterns', patterns), ('users', users))
+        ]
+        self.stdout.write(self.style.SUCCESS(
+            'Deleted generated data: {} word rows, {} pattern rows, {} user rows'.format(*counts)
+        ))
+
+    def _delete_in_batches(self, queryset):
+        """
+        Delete every row of `queryset` with raw DELETEs of CLEAR_BATCH primary
+        keys at a time, walking the primary key so each batch starts where the
+        last one stopped. Avoids the ORM collector loading millions of rows.
+        """
+        deleted = last = 0
+        while True:
+            ids = list(queryset.filter(pk__gt=last).order_by('pk').values_list('pk', flat=True)[:CLEAR_BATCH])
+            if not ids:
+                return deleted
+            with transaction.atomic(), connection.cursor() as cursor:
+                self._raw_delete(cursor, queryset.model, ids)
+            deleted += len(ids)
+            last = ids[-1]
+
+    def _raw_delete(self, cursor, model, ids):
+        """DELETE `model` rows by primary key, applying each reverse relation's on_delete in SQL first"""
+        quote = connection.ops.quote_name
+        placeholders = ', '.join(['%s'] * len(ids))
+        dependents = [
+            (rel.related_model, rel.field.column, rel.on_delete)
+            for rel in model._meta.related_objects if not rel.many_to_many
+        ] + [
+            # Auto-created M2M tables (e.g. auth_user_groups) rows just go
+            (field.remote_field.through, field.m2m_column_name(), models.CASCADE)
+            for field in model._meta.many_to_many if field.remote_field.through._meta.auto_created
+        ]
+
+        for related, column, on_delete in dependents:
+            table = quote(related._meta.db_table)
+            where = f'{quote(column)} IN ({placeholders})'
+            if on_delete is models.SET_NULL:
+                cursor.execute(f'UPDATE {table} SET {quote(column)} = NULL WHERE {where}', ids)
+            elif on_delete is models.CASCADE:
+                if related._meta.related_objects:
+                    cursor.execute(f'SELECT {quote(related._meta.pk.column)} FROM {table} WHERE {where}', ids)
+                    child_ids = [row[0] for row in cursor.fetchall()]
+                    for start in range(0, len(child_ids), CLEAR_BATCH):
+                        self._raw_delete(cursor, related, child_ids[start:start + CLEAR_BATCH])
+                else:
+                    cursor.execute(f'DELETE FROM {table} WHERE {where}', ids)
+            else:
+                cursor.execute(f'SELECT COUNT(*) FROM {table} WHERE {where}', ids)
+                blocking = cursor.fetchone()[0]
+                if blocking:
+                    raise CommandError(
+                        f'{blocking} {related._meta.verbose_name_plural} rows still use generated '
+                        f'{model._meta.verbose_name_plural}; remove them first'
+                    )
+
+        cursor.execute(
+            f'DELETE FROM {quote(model._meta.db_table)} WHERE {quote(model._meta.pk.column)} IN ({placeholders})', ids,
+        )
@@ -0,0 +1,53 @@
+import json
+import sys
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError
+
+from game.content import ContentImporter, read_records
+from game.puzzles import invalidate as invalidate_puzzles
+
+
+class Command(BaseCommand):
+    help = (
+        'Upsert phonetic patterns, words and components from an export_content file. '
+        'Patterns match on letters/sound/reference and words on date; ids are remapped.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('input', help='File written by export_content ("-" for stdin)')
+        parser.add_argument('--format', choices=['ndjson', 'csv'], help='Default: from the file extension, else ndjson')
+        parser.add_argument('--chunk-size', type=int, default=2000, help='Records per bulk upsert')
+        parser.add_argument('--dry-run', action='store_true', help='Show what would change without writing')
+
+    def handle(self, *args, **options):
+        source = options['input']
+        fmt = options['format'] or ('csv' if source.endswith('.csv') else 'ndjson')
+        show = options['dry_run'] or options['verbosity'] > 1
+
+        def on_change(kind, action, label):
+            if show:
+                marker = '+' if action == 'created' else '~'
+                self.stdout.write(f'{marker} {kind} {label}')
+
+        importer = ContentImporter(options['chunk_size'], options['dry_run'], on_change)
+        start = time.perf_counter()
+        stream = sys.stdin if source == '-' else open(source, encoding='utf-8', newline='')
+        try:
+            summary = importer.run(read_records(stream, fmt))
+        except (KeyError, ValueError, json.JSONDecodeError) as e:
+            raise CommandError(f'Malformed content file: {e!r}')
+        except IntegrityError as e:
+            raise CommandError(f'Import rolled back: {e}')
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+
+        if not options['dry_run']:
+            invalidate_puzzles()
+        for kind, counts in summary.items():
+            self.stdout.write(f"  {kind:<10} {counts['created']} created, {counts['updated']} updated, "
+                              f"{counts['unchanged']} unchanged")
+        verb = 'Dry run finished' if options['dry_run'] else 'Imported'
+        self.stdout.write(self.style.SUCCESS(f'{verb} in {time.perf_counter() - start:.1f}s'))
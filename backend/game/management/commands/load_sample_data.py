@@ -1,8 +1,12 @@
 from django.core.management.base import BaseCommand
 from django.utils import timezone
 from game.models import Word, PhoneticPattern, PhoneticComponent
+from game.sounds import sound_for
 
 
+# Bump when SAMPLE_WORDS changes so `bootstrap` reloads it
+SAMPLE_DATA_VERSION = 1
+
 SAMPLE_WORDS = [
     {
         'secret': 'fish',
@@ -63,7 +67,7 @@ class Command(BaseCommand):
             for idx, pattern_data in enumerate(entry['patterns']):
                 pattern, _ = PhoneticPattern.objects.get_or_create(
                     letters=pattern_data['letters'],
-                    sound=pattern_data['sound'],
+                    sound=sound_for(pattern_data['sound']),
                     defaults={'reference': pattern_data['reference']},
                 )
                 PhoneticComponent.objects.get_or_create(
@@ -2,21 +2,28 @@ import os
 from django.core.management.base import BaseCommand
 from game.models import ValidWord
 
+WORDS_FILE = os.path.abspath(os.path.join(
+    os.path.dirname(__file__),  # commands/
+    '..', '..', '..', 'data', 'words_filtered.txt'
+))
+
 
 class Command(BaseCommand):
     help = 'Load valid words from words_filtered.txt into the database'
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--force', action='store_true',
+            help='Insert missing words even if the table is already populated',
+        )
+
     def handle(self, *args, **kwargs):
         # Check if already loaded
-        if ValidWord.objects.exists():
+        if not kwargs.get('force') and ValidWord.objects.exists():
             self.stdout.write('Valid words already loaded, skipping.')
             return
 
-        words_file = os.path.join(
-            os.path.dirname(__file__),  # commands/
-            '..', '..', '..', 'data', 'words_filtered.txt'
-        )
-        words_file = os.path.abspath(words_file)
+        words_file = WORDS_FILE
 
         if not os.path.exists(words_file):
             self.stdout.write(self.style.ERROR(f'Words file not found at: {words_file}'))
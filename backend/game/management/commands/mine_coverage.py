@@ -0,0 +1,67 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from game.coverage import mine, pattern_groups, rank_missing
+from game.models import PhoneticPattern, ValidWord, WordCoverage
+
+COVERAGE_FIELDS = ['covered', 'segments', 'missing']
+
+
+class Command(BaseCommand):
+    help = (
+        'Segment every dictionary word into known pattern letters, store the result in wordCoverage '
+        'and rank the letter groups that new patterns would unlock the most words with'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=None, help='Process pool size (default: CPU count)')
+        parser.add_argument('--chunk-size', type=int, default=5000, help='Words per worker task (default 5000)')
+        parser.add_argument('--batch-size', type=int, default=5000, help='Rows per upsert (default 5000)')
+        parser.add_argument('--top', type=int, default=20, help='Missing groups to list (default 20)')
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        groups = pattern_groups(PhoneticPattern.objects.values_list('letters', flat=True).distinct())
+        words = list(ValidWord.objects.values_list('word', flat=True).iterator(chunk_size=10000))
+        stored = {
+            word: (covered, segments, missing)
+            for word, covered, segments, missing in
+            WordCoverage.objects.values_list('word', *COVERAGE_FIELDS).iterator(chunk_size=10000)
+        }
+        self.stdout.write(f'{len(words)} words, {len(groups)} letter groups, {len(stored)} stored results')
+
+        # Only rows whose result changed since the last run are written
+        changed, covered, missing_by_word = [], 0, {}
+        for word, segments, missing in mine(words, groups, options['workers'], options['chunk_size']):
+            result = (not missing, '-'.join(segments)[:100], ','.join(missing)[:100])
+            if result[0]:
+                covered += 1
+            else:
+                missing_by_word[word] = missing
+            if stored.get(word) != result:
+                changed.append(WordCoverage(word_id=word, **dict(zip(COVERAGE_FIELDS, result))))
+        mined = time.perf_counter()
+
+        with transaction.atomic():
+            for i in range(0, len(changed), options['batch_size']):
+                WordCoverage.objects.bulk_create(
+                    changed[i:i + options['batch_size']],
+                    update_conflicts=True,
+                    unique_fields=['word'],
+                    update_fields=COVERAGE_FIELDS + ['mined_at'],
+                )
+
+        self.stdout.write(
+            f'Mined in {mined - start:.1f}s, wrote {len(changed)} changed rows in {time.perf_counter() - mined:.1f}s'
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f'{covered} of {len(words)} words ({covered / max(len(words), 1):.1%}) are spellable from known patterns'
+        ))
+
+        ranking = rank_missing(missing_by_word)[:options['top']]
+        if ranking:
+            self.stdout.write('Letter groups a new pattern would unlock the most words with:')
+            for group, unlocks, appears in ranking:
+                self.stdout.write(f'  {group:<8} unlocks {unlocks:>6}   missing in {appears:>6}')
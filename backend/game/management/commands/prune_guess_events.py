@@ -0,0 +1,61 @@
+import re
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.utils import timezone
+
+from game.events import create_partition
+from game.models import GuessEvent
+
+PARTITION_RE = re.compile(r'^guessEvent_(\d{8})$')
+
+
+class Command(BaseCommand):
+    help = (
+        'Drop guess events older than GUESS_EVENT_RETENTION_DAYS. On PostgreSQL whole daily '
+        'partitions are dropped (no DELETE) and upcoming partitions are created ahead of time.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=None, help='Days to keep (default GUESS_EVENT_RETENTION_DAYS)')
+        parser.add_argument('--ahead', type=int, default=7, help='Future daily partitions to create (PostgreSQL)')
+        parser.add_argument('--dry-run', action='store_true', help='Only report what would be dropped')
+
+    def handle(self, *args, **options):
+        today = timezone.now().date()
+        keep = options['days'] if options['days'] is not None else settings.GUESS_EVENT_RETENTION_DAYS
+        cutoff = today - timedelta(days=keep)
+
+        if connection.vendor != 'postgresql':
+            if options['dry_run']:
+                count = GuessEvent.objects.filter(puzzle_date__lt=cutoff).count()
+            else:
+                count, _ = GuessEvent.objects.filter(puzzle_date__lt=cutoff).delete()
+            self.stdout.write(self.style.SUCCESS(f'Deleted {count} guess events before {cutoff}'))
+            return
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT child.relname FROM pg_inherits '
+                'JOIN pg_class parent ON parent.oid = pg_inherits.inhparent '
+                'JOIN pg_class child ON child.oid = pg_inherits.inhrelid '
+                "WHERE parent.relname = 'guessEvent'"
+            )
+            expired = []
+            for (name,) in cursor.fetchall():
+                match = PARTITION_RE.match(name)
+                if match and datetime.strptime(match.group(1), '%Y%m%d').date() < cutoff:
+                    expired.append(name)
+
+            for name in sorted(expired):
+                self.stdout.write(f'  dropping {name}')
+                if not options['dry_run']:
+                    cursor.execute(f'DROP TABLE "{name}"')
+
+            if not options['dry_run']:
+                for offset in range(options['ahead'] + 1):
+                    create_partition(cursor, today + timedelta(days=offset))
+
+        self.stdout.write(self.style.SUCCESS(f'Dropped {len(expired)} partitions before {cutoff}'))
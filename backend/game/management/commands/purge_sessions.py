@@ -0,0 +1,86 @@
+import os
+import time
+from importlib import import_module
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections
+from django.utils import timezone
+
+
+class Command(BaseCommand):
+    help = (
+        'Delete expired sessions in small batches walking the expire_date index, sleeping between '
+        'batches so the session table is never locked for long. --continuous keeps purging as a '
+        'low-priority worker.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='Sessions deleted per statement (default 1000)')
+        parser.add_argument('--sleep', type=float, default=0.1, help='Seconds to sleep between batches (default 0.1)')
+        parser.add_argument('--continuous', action='store_true', help='Keep running, starting a new pass every --interval')
+        parser.add_argument('--interval', type=float, default=300.0, help='Seconds between passes with --continuous')
+        parser.add_argument('--nice', type=int, default=10, help='Lower the process CPU priority by this much (0 to skip)')
+
+    def handle(self, *args, **options):
+        self.verbosity = options['verbosity']
+        store = import_module(settings.SESSION_ENGINE).SessionStore
+        if not hasattr(store, 'get_model_class'):
+            raise CommandError(f'{settings.SESSION_ENGINE} does not keep sessions in the database; nothing to purge')
+        self.session_model = store.get_model_class()
+
+        if options['nice'] and hasattr(os, 'nice'):
+            os.nice(options['nice'])
+
+        total = passes = 0
+        try:
+            while True:
+                close_old_connections()
+                total += self.purge(options['batch_size'], options['sleep'])
+                passes += 1
+                if not options['continuous']:
+                    break
+                time.sleep(options['interval'])
+        except KeyboardInterrupt:
+            pass
+
+        self.stdout.write(self.style.SUCCESS(f'Session purge stopped: {total} deleted in {passes} passes'))
+
+    def purge(self, batch_size, pause):
+        """Delete sessions that had expired when the pass started. Returns the number deleted."""
+        cutoff = timezone.now()
+        expired = self.session_model.objects.filter(expire_date__lt=cutoff)
+        start = time.perf_counter()
+        deleted = batches = 0
+        slowest = 0.0
+        last = None
+
+        while True:
+            batch_start = time.perf_counter()
+            # Oldest first along the expire_date index, starting where the last batch stopped, so
+            # dead index entries left by earlier batches (until vacuum) aren't walked again.
+            # >= since expire_date isn't unique; rows already deleted don't come back.
+            batch = expired if last is None else expired.filter(expire_date__gte=last)
+            rows = list(batch.order_by('expire_date').values_list('session_key', 'expire_date')[:batch_size])
+            if not rows:
+                break
+            keys = [key for key, _ in rows]
+            last = rows[-1][1]
+            count, _ = self.session_model.objects.filter(session_key__in=keys).delete()
+            elapsed = time.perf_counter() - batch_start
+            slowest = max(slowest, elapsed)
+            deleted += count
+            batches += 1
+            if self.verbosity >= 2:
+                self.stdout.write(f'  batch {batches}: {count} deleted in {elapsed * 1000:.0f} ms ({deleted} so far)')
+            if len(keys) < batch_size:
+                break
+            time.sleep(pause)
+
+        seconds = time.perf_counter() - start
+        if deleted or self.verbosity >= 2:
+            self.stdout.write(
+                f'Deleted {deleted} sessions expired before {cutoff:%Y-%m-%d %H:%M:%S} in {batches} batches, '
+                f'{seconds:.1f}s ({deleted / max(seconds, 1e-9):.0f}/s, slowest batch {slowest * 1000:.0f} ms)'
+            )
+        return deleted
@@ -0,0 +1,61 @@
+import time
+
+from django.core.mail import get_connection
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from game.mail import MAX_ATTEMPTS, drain_outbox
+
+
+class Command(BaseCommand):
+    help = 'Send queued emails from the outbox in batches over one reused mail connection'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=50, help='Emails claimed per batch (default 50)')
+        parser.add_argument('--poll-interval', type=float, default=2.0, help='Seconds to sleep when the outbox is empty')
+        parser.add_argument('--max-attempts', type=int, default=MAX_ATTEMPTS, help='Give up on an email after this many tries')
+        parser.add_argument('--once', action='store_true', help='Drain everything currently due, then exit')
+
+    def handle(self, *args, **options):
+        connection = get_connection(fail_silently=False)
+        total_sent = total_failed = 0
+        self.stdout.write('Mail worker started')
+
+        try:
+            while True:
+                close_old_connections()
+                start = time.perf_counter()
+                try:
+                    # No-op if already open; SMTP reconnects after a dropped session
+                    connection.open()
+                except Exception as e:
+                    self.stderr.write(f'Could not open mail connection: {e}')
+                    if options['once']:
+                        break
+                    time.sleep(options['poll_interval'])
+                    continue
+
+                sent, failed = drain_outbox(connection, options['batch_size'], options['max_attempts'])
+                total_sent += sent
+                total_failed += failed
+
+                if sent or failed:
+                    self.stdout.write(
+                        f'Batch: {sent} sent, {failed} failed in {(time.perf_counter() - start) * 1000:.0f} ms'
+                    )
+                    if failed:
+                        # Force a fresh session next batch in case the server dropped us
+                        connection.close()
+                    continue
+
+                # Outbox empty - release the mail server connection while idle
+                connection.close()
+                if options['once']:
+                    break
+                time.sleep(options['poll_interval'])
+        except KeyboardInterrupt:
+            pass
+        finally:
+            connection.close()
+
+        self.stdout.write(self.style.SUCCESS(f'Mail worker stopped: {total_sent} sent, {total_failed} failed'))
@@ -0,0 +1,62 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from game.difficulty import score_lexicon
+from game.models import PuzzleScore, Word
+
+SCORE_FIELDS = ['expected_remaining', 'solve_depth', 'worst_case_depth', 'rarity', 'opener']
+
+
+class Command(BaseCommand):
+    help = 'Compute difficulty metrics for every dictionary word and store them in puzzleScore'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--length', type=int, action='append', dest='lengths',
+            help='Only score words of this length (repeatable)',
+        )
+        parser.add_argument('--workers', type=int, default=None, help='Process pool size (default: CPU count)')
+        parser.add_argument('--batch-size', type=int, default=5000, help='Rows per upsert (default 5000)')
+
+    def handle(self, *args, **options):
+        total_start = time.perf_counter()
+        total = 0
+
+        for length, table, scores in score_lexicon(options['lengths'], options['workers']):
+            scored = time.perf_counter()
+            rows = [
+                PuzzleScore(
+                    word_id=str(word),
+                    expected_remaining=int(scores['expected_remaining'][i]),
+                    solve_depth=int(scores['solve_depth'][i]),
+                    worst_case_depth=int(scores['worst_case_depth'][i]),
+                    rarity=float(scores['rarity'][i]),
+                    opener=scores['opener'],
+                )
+                for i, word in enumerate(table.words)
+            ]
+            with transaction.atomic():
+                for i in range(0, len(rows), options['batch_size']):
+                    PuzzleScore.objects.bulk_create(
+                        rows[i:i + options['batch_size']],
+                        update_conflicts=True,
+                        unique_fields=['word'],
+                        update_fields=SCORE_FIELDS + ['scored_at'],
+                    )
+            total += len(rows)
+            self.stdout.write(
+                f'  length {length}: {len(rows)} words, opener "{scores["opener"]}", '
+                f'written in {(time.perf_counter() - scored):.1f}s'
+            )
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Scored {total} words in {time.perf_counter() - total_start:.1f}s'
+        ))
+
+        scheduled = (
+            Word.objects.filter(secret__in=PuzzleScore.objects.values('word'))
+            .count()
+        )
+        self.stdout.write(f'{scheduled} of {Word.objects.count()} scheduled puzzles have a score')
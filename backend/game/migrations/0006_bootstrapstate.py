@@ -0,0 +1,29 @@
+# Generated by Django 4.2.30 on 2026-10-19 07:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0005_alter_phoneticcomponent_options_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BootstrapState',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('migrations_hash', models.CharField(max_length=64)),
+                ('lexicon_checksum', models.CharField(max_length=64)),
+                ('sample_data_version', models.IntegerField(default=0)),
+                ('import_seconds', models.FloatField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Bootstrap State',
+                'verbose_name_plural': 'Bootstrap State',
+                'db_table': 'bootstrapState',
+            },
+        ),
+    ]
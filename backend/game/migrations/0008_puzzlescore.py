@@ -0,0 +1,32 @@
+# Generated by Django 4.2.30 on 2026-10-19 07:05
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0007_outboundemail'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PuzzleScore',
+            fields=[
+                ('word', models.OneToOneField(db_column='word', on_delete=django.db.models.deletion.CASCADE, primary_key=True, serialize=False, to='game.validword')),
+                ('expected_remaining', models.IntegerField()),
+                ('solve_depth', models.SmallIntegerField()),
+                ('worst_case_depth', models.SmallIntegerField()),
+                ('rarity', models.FloatField()),
+                ('opener', models.CharField(max_length=50)),
+                ('scored_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Puzzle Score',
+                'verbose_name_plural': 'Puzzle Scores',
+                'db_table': 'puzzleScore',
+                'indexes': [models.Index(fields=['expected_remaining'], name='puzzleScore_expecte_c035f3_idx'), models.Index(fields=['worst_case_depth'], name='puzzleScore_worst_c_6467f3_idx'), models.Index(fields=['rarity'], name='puzzleScore_rarity_4dc0de_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 4.2.30 on 2026-10-19 07:06
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('game', '0008_puzzlescore'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PuzzleStats',
+            fields=[
+                ('date', models.DateField(primary_key=True, serialize=False)),
+                ('solved_1', models.IntegerField(default=0)),
+                ('solved_2', models.IntegerField(default=0)),
+                ('solved_3', models.IntegerField(default=0)),
+                ('solved_4', models.IntegerField(default=0)),
+                ('solved_5', models.IntegerField(default=0)),
+                ('solved_6', models.IntegerField(default=0)),
+                ('failed', models.IntegerField(default=0)),
+                ('players', models.IntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Puzzle Statistics',
+                'verbose_name_plural': 'Puzzle Statistics',
+                'db_table': 'puzzleStats',
+                'ordering': ['-date'],
+            },
+        ),
+        migrations.CreateModel(
+            name='PuzzleResult',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('puzzle_date', models.DateField()),
+                ('player_key', models.CharField(max_length=64)),
+                ('guesses', models.SmallIntegerField()),
+                ('solved', models.BooleanField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('user', models.ForeignKey(blank=True, db_column='userId', null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Puzzle Result',
+                'verbose_name_plural': 'Puzzle Results',
+                'db_table': 'puzzleResult',
+                'unique_together': {('puzzle_date', 'player_key')},
+            },
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.30 on 2026-10-19 07:07
+
+from django.db import migrations, models
+
+
+def create_trigram_index(apps, schema_editor):
+    # Substring search (LIKE '%ough%') needs pg_trgm; other databases just scan
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS validword_word_trgm_idx ON "validWord" USING gin (word gin_trgm_ops)'
+    )
+
+
+def drop_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS validword_word_trgm_idx')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0009_puzzleresult_puzzlestats'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='validword',
+            index=models.Index(fields=['word'], name='validword_word_prefix_idx', opclasses=['varchar_pattern_ops']),
+        ),
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 4.2.30 on 2026-10-19 07:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0010_validword_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='word',
+            name='secret',
+            field=models.CharField(db_index=True, max_length=50),
+        ),
+        migrations.AddIndex(
+            model_name='phoneticpattern',
+            index=models.Index(fields=['letters', 'sound', 'reference'], name='phoneticPat_letters_383a85_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='userstats',
+            index=models.Index(fields=['-correctGuesses', 'wrongGuesses', 'user'], name='userstats_leaderboard_idx'),
+        ),
+    ]
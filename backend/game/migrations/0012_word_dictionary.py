@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-19 07:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0011_hot_query_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='word',
+            name='dictionary',
+            field=models.CharField(default='en', max_length=20),
+        ),
+    ]
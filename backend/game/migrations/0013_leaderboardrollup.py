@@ -0,0 +1,34 @@
+# Generated by Django 4.2.30 on 2026-10-19 07:14
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('game', '0012_word_dictionary'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LeaderboardRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('period', models.CharField(choices=[('day', 'Day'), ('week', 'Week'), ('month', 'Month')], max_length=5)),
+                ('period_start', models.DateField()),
+                ('correctGuesses', models.IntegerField(db_column='correctGuesses', default=0)),
+                ('wrongGuesses', models.IntegerField(db_column='wrongGuesses', default=0)),
+                ('user', models.ForeignKey(db_column='userId', on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Leaderboard Rollup',
+                'verbose_name_plural': 'Leaderboard Rollups',
+                'db_table': 'leaderboardRollup',
+                'indexes': [models.Index(fields=['period', 'period_start', '-correctGuesses', 'wrongGuesses', 'user'], name='rollup_leaderboard_idx')],
+                'unique_together': {('period', 'period_start', 'user')},
+            },
+        ),
+    ]
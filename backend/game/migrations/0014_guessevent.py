@@ -0,0 +1,61 @@
+# Generated by Django 4.2.30 on 2026-10-19 07:31
+
+from django.db import migrations, models
+
+
+def create_guess_event_table(apps, schema_editor):
+    # PostgreSQL gets a table partitioned by day so retention can DROP whole
+    # partitions; partitions are created on demand by game.events and
+    # prune_guess_events. Other databases get a plain table.
+    if schema_editor.connection.vendor != 'postgresql':
+        schema_editor.create_model(apps.get_model('game', 'GuessEvent'))
+        return
+    schema_editor.execute('''
+        CREATE TABLE "guessEvent" (
+            "id" bigint GENERATED BY DEFAULT AS IDENTITY,
+            "puzzle_date" date NOT NULL,
+            "player_key" varchar(64) NOT NULL,
+            "guess" varchar(50) NOT NULL,
+            "result" varchar(7) NOT NULL,
+            "created_at" timestamp with time zone NOT NULL,
+            PRIMARY KEY ("id", "puzzle_date")
+        ) PARTITION BY RANGE ("puzzle_date")
+    ''')
+
+
+def drop_guess_event_table(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        schema_editor.delete_model(apps.get_model('game', 'GuessEvent'))
+        return
+    schema_editor.execute('DROP TABLE IF EXISTS "guessEvent" CASCADE')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0013_leaderboardrollup'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.CreateModel(
+                    name='GuessEvent',
+                    fields=[
+                        ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                        ('puzzle_date', models.DateField()),
+                        ('player_key', models.CharField(max_length=64)),
+                        ('guess', models.CharField(max_length=50)),
+                        ('result', models.CharField(choices=[('invalid', 'Not a word'), ('wrong', 'Wrong'), ('correct', 'Correct')], max_length=7)),
+                        ('created_at', models.DateTimeField()),
+                    ],
+                    options={
+                        'verbose_name': 'Guess Event',
+                        'verbose_name_plural': 'Guess Events',
+                        'db_table': 'guessEvent',
+                    },
+                ),
+            ],
+        ),
+        migrations.RunPython(create_guess_event_table, drop_guess_event_table),
+    ]
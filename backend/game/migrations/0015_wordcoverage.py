@@ -0,0 +1,30 @@
+# Generated by Django 4.2.30 on 2026-10-19 07:29
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0014_guessevent'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WordCoverage',
+            fields=[
+                ('word', models.OneToOneField(db_column='word', on_delete=django.db.models.deletion.CASCADE, primary_key=True, serialize=False, to='game.validword')),
+                ('covered', models.BooleanField()),
+                ('segments', models.CharField(max_length=100)),
+                ('missing', models.CharField(blank=True, default='', max_length=100)),
+                ('mined_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Word Coverage',
+                'verbose_name_plural': 'Word Coverage',
+                'db_table': 'wordCoverage',
+                'indexes': [models.Index(fields=['covered'], name='wordCoverag_covered_338fa6_idx')],
+            },
+        ),
+    ]
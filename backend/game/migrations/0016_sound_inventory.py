@@ -0,0 +1,93 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def normalize_sounds(apps, schema_editor):
+    """One Sound per distinct (trimmed, lowercased) pattern sound"""
+    Sound = apps.get_model('game', 'Sound')
+    PhoneticPattern = apps.get_model('game', 'PhoneticPattern')
+    ids = {}
+    for raw in PhoneticPattern.objects.values_list('sound', flat=True).distinct():
+        name = raw.strip().lower()
+        if name not in ids:
+            ids[name] = Sound.objects.get_or_create(name=name)[0].pk
+        PhoneticPattern.objects.filter(sound=raw).update(sound_ref_id=ids[name])
+
+
+def restore_sound_names(apps, schema_editor):
+    Sound = apps.get_model('game', 'Sound')
+    PhoneticPattern = apps.get_model('game', 'PhoneticPattern')
+    for pk, name in Sound.objects.values_list('pk', 'name'):
+        PhoneticPattern.objects.filter(sound_ref_id=pk).update(sound=name)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0015_wordcoverage'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Sound',
+            fields=[
+                ('id', models.SmallAutoField(primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=10, unique=True)),
+            ],
+            options={
+                'verbose_name': 'Sound',
+                'verbose_name_plural': 'Sounds',
+                'db_table': 'sound',
+            },
+        ),
+        migrations.CreateModel(
+            name='SoundAlias',
+            fields=[
+                ('alias', models.CharField(max_length=10, primary_key=True, serialize=False)),
+                ('sound', models.ForeignKey(db_column='soundId', on_delete=django.db.models.deletion.CASCADE, related_name='aliases', to='game.sound')),
+            ],
+            options={
+                'verbose_name': 'Sound Alias',
+                'verbose_name_plural': 'Sound Aliases',
+                'db_table': 'soundAlias',
+            },
+        ),
+        migrations.RemoveIndex(
+            model_name='phoneticpattern',
+            name='phoneticPat_sound_d29736_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='phoneticpattern',
+            name='phoneticPat_letters_383a85_idx',
+        ),
+        migrations.AddField(
+            model_name='phoneticpattern',
+            name='sound_ref',
+            field=models.ForeignKey(db_column='soundId', null=True, on_delete=django.db.models.deletion.RESTRICT, to='game.sound'),
+        ),
+        migrations.RunPython(normalize_sounds, restore_sound_names),
+        # A default lets the old column be re-added when migrating backwards
+        migrations.AlterField(
+            model_name='phoneticpattern',
+            name='sound',
+            field=models.CharField(default='', max_length=10),
+        ),
+        migrations.RemoveField(
+            model_name='phoneticpattern',
+            name='sound',
+        ),
+        migrations.RenameField(
+            model_name='phoneticpattern',
+            old_name='sound_ref',
+            new_name='sound',
+        ),
+        migrations.AlterField(
+            model_name='phoneticpattern',
+            name='sound',
+            field=models.ForeignKey(db_column='soundId', on_delete=django.db.models.deletion.RESTRICT, to='game.sound'),
+        ),
+        migrations.AddIndex(
+            model_name='phoneticpattern',
+            index=models.Index(fields=['letters', 'sound', 'reference'], name='phoneticPat_letters_fbb026_idx'),
+        ),
+    ]
@@ -0,0 +1,30 @@
+from django.db import migrations
+
+from game.sounds import merge_alias
+
+# Spellings of one sound that imported patterns use interchangeably
+# ('eigh' -> 'a' in neighbor, 'aigh' -> 'ay' in straight)
+KNOWN_ALIASES = {
+    'a': 'ay',
+}
+
+
+def add_known_aliases(apps, schema_editor):
+    Sound = apps.get_model('game', 'Sound')
+    SoundAlias = apps.get_model('game', 'SoundAlias')
+    PhoneticPattern = apps.get_model('game', 'PhoneticPattern')
+    for alias, name in KNOWN_ALIASES.items():
+        sound = Sound.objects.get_or_create(name=name)[0]
+        merge_alias(alias, sound, Sound, SoundAlias, PhoneticPattern)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0016_sound_inventory'),
+    ]
+
+    operations = [
+        # Merged patterns can't be told apart again, so backwards leaves them on the canonical sound
+        migrations.RunPython(add_known_aliases, migrations.RunPython.noop),
+    ]
@@ -1,5 +1,6 @@
 from django.db import models
 from django.contrib.auth.models import User
+from django.utils import timezone
 
 class ValidWord(models.Model):
     word = models.CharField(max_length=50, primary_key=True)
@@ -8,15 +9,47 @@ class ValidWord(models.Model):
         db_table = 'validWord'  # Match PostgreSQL table name
         verbose_name = 'Valid Word'
         verbose_name_plural = 'Valid Words'
+        indexes = [
+            # Lets LIKE 'abc%' use an index regardless of the database collation (PostgreSQL)
+            models.Index(fields=['word'], name='validword_word_prefix_idx', opclasses=['varchar_pattern_ops']),
+        ]
     
     def __str__(self):
         return self.word
 
 
+class Sound(models.Model):
+    """Canonical sound inventory: one row per distinct sound patterns can make"""
+    id = models.SmallAutoField(primary_key=True)  # A few hundred sounds at most; keeps pattern rows narrow
+    name = models.CharField(max_length=10, unique=True)  # e.g., "f", "ay", "sh"
+
+    class Meta:
+        db_table = 'sound'
+        verbose_name = 'Sound'
+        verbose_name_plural = 'Sounds'
+
+    def __str__(self):
+        return self.name
+
+
+class SoundAlias(models.Model):
+    """Another way of writing a sound, e.g. "a" for "ay" - resolved to the canonical Sound on input"""
+    alias = models.CharField(max_length=10, primary_key=True)
+    sound = models.ForeignKey(Sound, on_delete=models.CASCADE, db_column='soundId', related_name='aliases')
+
+    class Meta:
+        db_table = 'soundAlias'
+        verbose_name = 'Sound Alias'
+        verbose_name_plural = 'Sound Aliases'
+
+    def __str__(self):
+        return f"{self.alias} → {self.sound_id}"
+
+
 class PhoneticPattern(models.Model):
     """Phonetic patterns: letter combinations and their sounds"""
     letters = models.CharField(max_length=10)  # e.g., "gh", "o", "ti"
-    sound = models.CharField(max_length=10)    # e.g., "f", "i", "sh"
+    sound = models.ForeignKey(Sound, on_delete=models.RESTRICT, db_column='soundId')  # e.g., "f", "i", "sh"
     reference = models.CharField(max_length=50)  # e.g., "enough", "women", "nation"
     
     class Meta:
@@ -24,19 +57,20 @@ class PhoneticPattern(models.Model):
         verbose_name = 'Phonetic Pattern'
         verbose_name_plural = 'Phonetic Patterns'
         indexes = [
-            models.Index(fields=['sound']),
             models.Index(fields=['letters']),
+            models.Index(fields=['letters', 'sound', 'reference']),
         ]
     
     def __str__(self):
-        return f"{self.letters} → {self.sound} (from '{self.reference}')"
+        return f"{self.letters} → {self.sound.name} (from '{self.reference}')"
 
 
 class Word(models.Model):
     """Daily puzzle words"""
-    secret = models.CharField(max_length=50)  # e.g., "fish"
+    secret = models.CharField(max_length=50, db_index=True)  # e.g., "fish"
     phonetic = models.CharField(max_length=50)  # e.g., "ghoti"
     date = models.DateField(unique=True)
+    dictionary = models.CharField(max_length=20, default='en')  # Key into settings.LEXICON_DICTIONARIES
     phonetic_patterns = models.ManyToManyField(
         PhoneticPattern, 
         through='PhoneticComponent',
@@ -85,6 +119,10 @@ class UserStats(models.Model):
         db_table = 'userStats'  # camelCase to match your convention
         verbose_name = 'User Statistics'
         verbose_name_plural = 'User Statistics'
+        indexes = [
+            # Leaderboard order: most wins, least losses, oldest account
+            models.Index(fields=['-correctGuesses', 'wrongGuesses', 'user'], name='userstats_leaderboard_idx'),
+        ]
     
     def __str__(self):
         return f"{self.user.username}: {self.correctGuesses} correct, streak {self.streak}"
@@ -100,3 +138,213 @@ class UserStats(models.Model):
         if self.total_games == 0:
             return 0
         return (self.correctGuesses / self.total_games) * 100
+
+
+class BootstrapState(models.Model):
+    """Single-row fingerprint of what `manage.py bootstrap` last applied"""
+    migrations_hash = models.CharField(max_length=64)
+    lexicon_checksum = models.CharField(max_length=64)
+    sample_data_version = models.IntegerField(default=0)
+    import_seconds = models.FloatField(null=True, blank=True)  # Last measured cold import of the app
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'bootstrapState'
+        verbose_name = 'Bootstrap State'
+        verbose_name_plural = 'Bootstrap State'
+
+    def __str__(self):
+        return f"bootstrap @ {self.updated_at:%Y-%m-%d %H:%M}"
+
+
+class OutboundEmail(models.Model):
+    """Outbox row for mail sent by `manage.py run_mail_worker`"""
+    PENDING = 'pending'
+    SENT = 'sent'
+    FAILED = 'failed'
+    STATUS_CHOICES = [(PENDING, 'Pending'), (SENT, 'Sent'), (FAILED, 'Failed')]
+
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    from_email = models.CharField(max_length=254)
+    to_email = models.CharField(max_length=254)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=PENDING)
+    attempts = models.IntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)  # Also used as a claim lease while sending
+    last_error = models.TextField(blank=True, default='')
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = 'outboundEmail'
+        verbose_name = 'Outbound Email'
+        verbose_name_plural = 'Outbound Emails'
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.to_email}: {self.subject} ({self.status})"
+
+
+class PuzzleScore(models.Model):
+    """Difficulty metrics for a dictionary word, computed by `manage.py score_puzzles`"""
+    word = models.OneToOneField(ValidWord, on_delete=models.CASCADE, db_column='word', primary_key=True)
+    expected_remaining = models.IntegerField()  # Candidates left after the optimal opener
+    solve_depth = models.SmallIntegerField()  # Guesses a greedy solver needs for this word
+    worst_case_depth = models.SmallIntegerField()  # Deepest word sharing its opener feedback
+    rarity = models.FloatField()  # Mean letter surprisal (bits) within its length group
+    opener = models.CharField(max_length=50)
+    scored_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'puzzleScore'
+        verbose_name = 'Puzzle Score'
+        verbose_name_plural = 'Puzzle Scores'
+        indexes = [
+            models.Index(fields=['expected_remaining']),
+            models.Index(fields=['worst_case_depth']),
+            models.Index(fields=['rarity']),
+        ]
+
+    def __str__(self):
+        return f"{self.word_id}: {self.expected_remaining} left, depth {self.solve_depth}/{self.worst_case_depth}"
+
+
+class WordCoverage(models.Model):
+    """How a dictionary word segments into known pattern letters, computed by `manage.py mine_coverage`"""
+    word = models.OneToOneField(ValidWord, on_delete=models.CASCADE, db_column='word', primary_key=True)
+    covered = models.BooleanField()  # Every letter belongs to a known pattern's letters
+    segments = models.CharField(max_length=100)  # e.g. "n-a-ti-o-n"; gap letters are their own segments
+    missing = models.CharField(max_length=100, blank=True, default='')  # Uncovered runs, comma-separated
+    mined_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'wordCoverage'
+        verbose_name = 'Word Coverage'
+        verbose_name_plural = 'Word Coverage'
+        indexes = [
+            models.Index(fields=['covered']),
+        ]
+
+    def __str__(self):
+        return f"{self.word_id}: {self.segments}" + (f" (missing {self.missing})" if self.missing else '')
+
+
+class PuzzleResult(models.Model):
+    """One finished game per player per puzzle date"""
+    puzzle_date = models.DateField()
+    player_key = models.CharField(max_length=64)  # "u:<user id>" or "s:<session key>"
+    user = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, db_column='userId')
+    guesses = models.SmallIntegerField()
+    solved = models.BooleanField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'puzzleResult'
+        verbose_name = 'Puzzle Result'
+        verbose_name_plural = 'Puzzle Results'
+        unique_together = [['puzzle_date', 'player_key']]
+
+    def __str__(self):
+        outcome = f"solved in {self.guesses}" if self.solved else "failed"
+        return f"{self.puzzle_date} {self.player_key}: {outcome}"
+
+
+class PuzzleStats(models.Model):
+    """Guess distribution for one puzzle date, maintained with atomic increments"""
+    date = models.DateField(primary_key=True)
+    solved_1 = models.IntegerField(default=0)
+    solved_2 = models.IntegerField(default=0)
+    solved_3 = models.IntegerField(default=0)
+    solved_4 = models.IntegerField(default=0)
+    solved_5 = models.IntegerField(default=0)
+    solved_6 = models.IntegerField(default=0)
+    failed = models.IntegerField(default=0)
+    players = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = 'puzzleStats'
+        verbose_name = 'Puzzle Statistics'
+        verbose_name_plural = 'Puzzle Statistics'
+        ordering = ['-date']
+
+    def __str__(self):
+        return f"{self.date}: {self.players} players"
+
+    @property
+    def distribution(self):
+        """Solves keyed by guess count"""
+        return {n: getattr(self, f'solved_{n}') for n in range(1, 7)}
+
+    @property
+    def solve_rate(self):
+        """Percentage of players who solved the puzzle"""
+        if self.players == 0:
+            return 0
+        return (sum(self.distribution.values()) / self.players) * 100
+
+
+class LeaderboardRollup(models.Model):
+    """Per-user wins and losses within one day, week or month, maintained with atomic increments"""
+    DAY = 'day'
+    WEEK = 'week'
+    MONTH = 'month'
+    PERIOD_CHOICES = [
+        (DAY, 'Day'),
+        (WEEK, 'Week'),
+        (MONTH, 'Month'),
+    ]
+
+    period = models.CharField(max_length=5, choices=PERIOD_CHOICES)
+    period_start = models.DateField()  # The day, the Monday of the week, or the 1st of the month
+    user = models.ForeignKey(User, on_delete=models.CASCADE, db_column='userId')
+    correctGuesses = models.IntegerField(default=0, db_column='correctGuesses')
+    wrongGuesses = models.IntegerField(default=0, db_column='wrongGuesses')
+
+    class Meta:
+        db_table = 'leaderboardRollup'
+        verbose_name = 'Leaderboard Rollup'
+        verbose_name_plural = 'Leaderboard Rollups'
+        unique_together = [['period', 'period_start', 'user']]
+        indexes = [
+            # Same order as the lifetime leaderboard, within one period
+            models.Index(
+                fields=['period', 'period_start', '-correctGuesses', 'wrongGuesses', 'user'],
+                name='rollup_leaderboard_idx',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.period} {self.period_start} {self.user_id}: {self.correctGuesses} correct"
+
+
+class GuessEvent(models.Model):
+    """
+    One submitted guess, for analytics. Written in batches by game.events, never
+    per request. On PostgreSQL the table is range-partitioned by puzzle_date
+    with one partition per day (see migration 0014 and prune_guess_events).
+    """
+    INVALID = 'invalid'
+    WRONG = 'wrong'
+    CORRECT = 'correct'
+    RESULT_CHOICES = [
+        (INVALID, 'Not a word'),
+        (WRONG, 'Wrong'),
+        (CORRECT, 'Correct'),
+    ]
+
+    id = models.BigAutoField(primary_key=True)
+    puzzle_date = models.DateField()
+    player_key = models.CharField(max_length=64)  # "u:<user id>", "s:<session key>" or "anon"
+    guess = models.CharField(max_length=50)
+    result = models.CharField(max_length=7, choices=RESULT_CHOICES)
+    created_at = models.DateTimeField()
+
+    class Meta:
+        db_table = 'guessEvent'
+        verbose_name = 'Guess Event'
+        verbose_name_plural = 'Guess Events'
+
+    def __str__(self):
+        return f"{self.puzzle_date} {self.player_key}: {self.guess} ({self.result})"
@@ -0,0 +1,32 @@
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import QuerySet
+from django.utils.functional import cached_property
+
+# Below this many rows an exact COUNT(*) is cheap enough
+ESTIMATE_THRESHOLD = 10000
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that skips COUNT(*) on large unfiltered PostgreSQL tables and
+    uses the planner's row estimate from pg_class instead. Filtered querysets
+    and other databases get the exact count.
+    """
+
+    @cached_property
+    def count(self):
+        qs = self.object_list
+        if isinstance(qs, QuerySet) and not qs.query.where:
+            connection = connections[qs.db]
+            if connection.vendor == 'postgresql':
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        'SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass',
+                        [connection.ops.quote_name(qs.model._meta.db_table)],
+                    )
+                    row = cursor.fetchone()
+                # reltuples is -1 (or 0) until the table has been analyzed
+                if row and row[0] >= ESTIMATE_THRESHOLD:
+                    return row[0]
+        return super().count
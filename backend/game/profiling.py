@@ -0,0 +1,186 @@
+"""
+On-demand request profiling for superusers.
+
+A superuser adds `X-Profile: pstats` (or `speedscope`) to a request - or
+`?_profile=pstats` to the URL - and the request runs under a profiler:
+
+    pstats      cProfile (deterministic), saved as <id>.prof for `python -m pstats`
+                or snakeviz
+    speedscope  a sampling profiler walking this thread's stack every
+                PROFILE_SAMPLE_INTERVAL_MS, saved as <id>.speedscope.json for
+                https://www.speedscope.app
+
+Either way every SQL query is traced with its duration and the project stack
+frames that issued it, saved as <id>.sql.json. The response carries
+X-Profile-Url / X-Profile-Sql-Url headers pointing at `profiles/<file>/`.
+
+The middleware is only installed when PROFILING_ENABLED is set; otherwise
+Django drops it at startup and requests pay nothing.
+"""
+import cProfile
+import json
+import re
+import sys
+import threading
+import time
+import traceback
+import uuid
+from contextlib import ExitStack
+from pathlib import Path
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.urls import reverse
+
+FORMATS = {'pstats': '.prof', 'speedscope': '.speedscope.json'}
+FILENAME_RE = re.compile(r'^[0-9a-f]{32}\.(prof|speedscope\.json|sql\.json)$')
+PROJECT_ROOT = str(Path(settings.BASE_DIR).resolve())
+
+
+def profile_path(filename):
+    """Path of a stored profile file, or None if the name isn't one we write"""
+    if not FILENAME_RE.match(filename):
+        return None
+    return Path(settings.PROFILE_DIR) / filename
+
+
+class SqlTrace:
+    """Execute wrapper recording each query with the project frames that ran it"""
+
+    def __init__(self):
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            frames = [
+                f'{frame.filename[len(PROJECT_ROOT) + 1:]}:{frame.lineno} in {frame.name}'
+                for frame in traceback.extract_stack()[:-1]
+                if frame.filename.startswith(PROJECT_ROOT) and 'site-packages' not in frame.filename
+                and frame.filename != __file__
+            ]
+            self.queries.append({
+                'alias': context['connection'].alias,
+                'sql': sql,
+                'many': many,
+                'ms': round((time.perf_counter() - start) * 1000, 3),
+                'stack': frames,
+            })
+
+
+class StackSampler:
+    """Samples one thread's Python stack from a background thread (speedscope 'sampled' profile)"""
+
+    def __init__(self, interval):
+        self.interval = interval
+        self.frames = []
+        self.frame_index = {}
+        self.samples = []
+        self.weights = []
+        self._target = threading.get_ident()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='profile-sampler', daemon=True)
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.ended = time.perf_counter()
+
+    def _run(self):
+        last = time.perf_counter()
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._target)
+            now = time.perf_counter()
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                key = (code.co_filename, code.co_name, code.co_firstlineno)
+                if key not in self.frame_index:
+                    self.frame_index[key] = len(self.frames)
+                    self.frames.append({'name': code.co_name, 'file': code.co_filename, 'line': code.co_firstlineno})
+                stack.append(self.frame_index[key])
+                frame = frame.f_back
+            if stack:
+                self.samples.append(stack[::-1])
+                self.weights.append((now - last) * 1000)
+            last = now
+
+    def speedscope(self, name):
+        return {
+            '$schema': 'https://www.speedscope.app/file-format-schema.json',
+            'name': name,
+            'exporter': 'ghotidle',
+            'shared': {'frames': self.frames},
+            'profiles': [{
+                'type': 'sampled',
+                'name': name,
+                'unit': 'milliseconds',
+                'startValue': 0,
+                'endValue': (self.ended - self.started) * 1000,
+                'samples': self.samples,
+                'weights': self.weights,
+            }],
+        }
+
+
+class ProfilingMiddleware:
+
+    def __init__(self, get_response):
+        if not settings.PROFILING_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        Path(settings.PROFILE_DIR).mkdir(parents=True, exist_ok=True)
+
+    def __call__(self, request):
+        fmt = request.headers.get('X-Profile') or request.GET.get('_profile')
+        if not fmt or not request.user.is_superuser:
+            return self.get_response(request)
+        if fmt not in FORMATS:
+            fmt = 'pstats'
+
+        profile_id = uuid.uuid4().hex
+        trace = SqlTrace()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(trace))
+            if fmt == 'pstats':
+                profiler = cProfile.Profile()
+                response = profiler.runcall(self.get_response, request)
+            else:
+                sampler = stack.enter_context(StackSampler(settings.PROFILE_SAMPLE_INTERVAL_MS / 1000))
+                response = self.get_response(request)
+
+        profile_file = profile_id + FORMATS[fmt]
+        if fmt == 'pstats':
+            profiler.dump_stats(profile_path(profile_file))
+        else:
+            profile_path(profile_file).write_text(json.dumps(sampler.speedscope(f'{request.method} {request.path}')))
+        sql_file = f'{profile_id}.sql.json'
+        profile_path(sql_file).write_text(json.dumps({
+            'request': f'{request.method} {request.get_full_path()}',
+            'total_ms': round(sum(q['ms'] for q in trace.queries), 3),
+            'queries': trace.queries,
+        }, indent=1))
+        self._prune()
+
+        response['X-Profile-Url'] = request.build_absolute_uri(reverse('download_profile', args=[profile_file]))
+        response['X-Profile-Sql-Url'] = request.build_absolute_uri(reverse('download_profile', args=[sql_file]))
+        response['X-Profile-Queries'] = str(len(trace.queries))
+        return response
+
+    def _prune(self):
+        # Keep the newest PROFILE_KEEP requests (two files each)
+        files = sorted(
+            (p for p in Path(settings.PROFILE_DIR).iterdir() if FILENAME_RE.match(p.name)),
+            key=lambda p: p.stat().st_mtime, reverse=True,
+        )
+        for path in files[settings.PROFILE_KEEP * 2:]:
+            path.unlink(missing_ok=True)
@@ -0,0 +1,161 @@
+"""
+Puzzle lookups shared by the game views.
+
+Today's puzzle and the sound -> pattern index are read on nearly every request
+but change rarely, so both are cached per process with a short TTL. The
+pattern index is keyed on Sound ids; `sound_ids()` maps typed sound names and
+aliases onto them. Admin views
+call `invalidate()` after writes; other workers pick the change up when their
+TTL expires.
+"""
+import threading
+import time
+from collections import defaultdict
+
+from django.utils import timezone
+
+from .models import Word, PhoneticPattern, Sound, SoundAlias
+
+CACHE_TTL = 60  # seconds
+
+_lock = threading.Lock()
+_current = None   # (date, loaded_at, word, payload)
+_patterns = None  # (loaded_at, {sound id: [pattern dict, ...]}, {sound name or alias: sound id})
+
+FALLBACK_PAYLOAD = {
+    'word': 'fish',
+    'phonetic_spelling': 'gh,o,ti',
+    'length': 4,
+    'phonetic_patterns': [
+        {'letters': 'gh', 'sound': 'f', 'reference': 'enough'},
+        {'letters': 'o', 'sound': 'i', 'reference': 'women'},
+        {'letters': 'ti', 'sound': 'sh', 'reference': 'nation'},
+    ],
+}
+
+
+def serialize_word(word_obj, components):
+    """
+    Build the puzzle payload for a word from its ordered components.
+    For no_change components (sound keeps original spelling), the pattern
+    points to a generic placeholder ("*") — derive the actual letters from
+    the stored phonetic string instead.
+    """
+    phonetic_parts = list(word_obj.phonetic.split(',')) if ',' in word_obj.phonetic else []
+    phonetic_patterns = []
+    phonetic_letters = []
+
+    for i, c in enumerate(components):
+        if c.no_change and i < len(phonetic_parts):
+            # Use letters from the pre-stored phonetic field
+            letters = phonetic_parts[i]
+            sound = letters  # same sound — that's what no_change means
+            reference = ''   # self-referential, no example needed
+        else:
+            letters = c.pattern.letters
+            sound = c.pattern.sound.name
+            reference = c.pattern.reference
+
+        phonetic_letters.append(letters)
+        phonetic_patterns.append({
+            'letters': letters,
+            'sound': sound,
+            'reference': reference,
+            'no_change': c.no_change,
+        })
+
+    phonetic_spelling = ','.join(phonetic_letters)
+
+    return {
+        'word': word_obj.secret,
+        'phonetic_spelling': phonetic_spelling or word_obj.phonetic,
+        'length': len(word_obj.secret),
+        'phonetic_patterns': phonetic_patterns,
+    }
+
+
+def letter_feedback(guess, target):
+    """
+    Wordle-style status ('correct', 'present' or 'absent') for each letter of
+    `guess` against `target`. Lengths may differ.
+    """
+    statuses = []
+    remaining_target = list(target)
+
+    # First pass: mark correct positions (green)
+    for i, char in enumerate(guess):
+        if i < len(target) and char == target[i]:
+            statuses.append('correct')
+            remaining_target[i] = None  # Mark as used
+        else:
+            statuses.append('absent')
+
+    # Second pass: mark present letters (yellow)
+    for i, char in enumerate(guess):
+        if statuses[i] == 'absent' and char in remaining_target:
+            statuses[i] = 'present'
+            remaining_target[remaining_target.index(char)] = None  # Mark as used
+
+    return statuses
+
+
+def _load_current(today):
+    # Try to get today's word, then the most recent past word
+    word_obj = Word.objects.filter(date__lte=today).order_by('-date').first()
+    if not word_obj:
+        return None, FALLBACK_PAYLOAD
+    components = word_obj.phoneticcomponent_set.select_related('pattern__sound').order_by('position')
+    return word_obj, serialize_word(word_obj, components)
+
+
+def current_puzzle(today=None):
+    """
+    Return (word, payload) for today's puzzle, falling back to the most recent
+    past word. `word` is None (and payload is the 'fish' fallback) if no words exist.
+    """
+    global _current
+    today = today or timezone.now().date()
+    cached = _current
+    if cached and cached[0] == today and time.monotonic() - cached[1] < CACHE_TTL:
+        return cached[2], cached[3]
+
+    word_obj, payload = _load_current(today)
+    with _lock:
+        _current = (today, time.monotonic(), word_obj, payload)
+    return word_obj, payload
+
+
+def _load_patterns():
+    global _patterns
+    cached = _patterns
+    if cached and time.monotonic() - cached[0] < CACHE_TTL:
+        return cached
+
+    index = defaultdict(list)
+    rows = PhoneticPattern.objects.order_by('id').values_list('id', 'letters', 'sound_id', 'sound__name', 'reference')
+    for pk, letters, sound_id, sound, reference in rows:
+        index[sound_id].append({'id': pk, 'letters': letters, 'sound': sound, 'reference': reference})
+    names = dict(SoundAlias.objects.values_list('alias', 'sound_id'))
+    names.update(Sound.objects.values_list('name', 'id'))
+    loaded = (time.monotonic(), dict(index), names)
+    with _lock:
+        _patterns = loaded
+    return loaded
+
+
+def pattern_index():
+    """Return {sound id: [pattern dicts]} for every phonetic pattern"""
+    return _load_patterns()[1]
+
+
+def sound_ids():
+    """Return {sound name or alias: sound id}"""
+    return _load_patterns()[2]
+
+
+def invalidate():
+    """Drop cached puzzle and pattern data in this process"""
+    global _current, _patterns
+    with _lock:
+        _current = None
+        _patterns = None
@@ -0,0 +1,64 @@
+"""
+Read-replica routing.
+
+Views decorated with `@replica_reads` send their reads of game tables to a
+randomly chosen replica (the `replicaN` entries built from DATABASE_REPLICA_URLS).
+Everything else uses the primary:
+
+- writes, always;
+- every read after the first write in the same request (read-your-writes);
+- auth and session tables, so a just-created login is never missed because
+  of replication lag;
+- every view that isn't decorated.
+
+With no replicas configured the router always answers 'default'. To try it
+locally with SQLite, point DATABASE_REPLICA_URLS at a second file, run
+`migrate --database replica1`, and copy the data across (or just copy db.sqlite3).
+"""
+import random
+from contextvars import ContextVar
+from functools import wraps
+
+from django.conf import settings
+
+PRIMARY = 'default'
+REPLICA_APPS = {'game'}
+
+# None outside a @replica_reads view, else {'pinned': bool}
+_request_state = ContextVar('replica_request_state', default=None)
+
+
+def replica_aliases():
+    return [alias for alias in settings.DATABASES if alias != PRIMARY]
+
+
+def replica_reads(view):
+    """Let the view's reads go to a replica until it writes"""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        token = _request_state.set({'pinned': False})
+        try:
+            return view(*args, **kwargs)
+        finally:
+            _request_state.reset(token)
+    return wrapper
+
+
+class ReplicaRouter:
+
+    def db_for_read(self, model, **hints):
+        state = _request_state.get()
+        if state is None or state['pinned'] or model._meta.app_label not in REPLICA_APPS:
+            return PRIMARY
+        replicas = replica_aliases()
+        return random.choice(replicas) if replicas else PRIMARY
+
+    def db_for_write(self, model, **hints):
+        state = _request_state.get()
+        if state is not None:
+            state['pinned'] = True
+        return PRIMARY
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same data as the primary
+        return True
@@ -0,0 +1,151 @@
+"""
+Bulk auto-scheduling of the puzzle calendar.
+
+`autoschedule()` fills every date in a range that has no Word by reusing
+puzzles already in the library: each filled date gets a copy of a source Word
+(secret, phonetic spelling, dictionary and PhoneticComponents). Only words
+whose components are complete (positions 0..n-1 with no gaps) are candidates.
+
+Constraints, checked greedily date by date:
+- a secret is not used again within `min_gap` days of any other use,
+  scheduled or newly assigned, on either side;
+- puzzles on adjacent days share at most `max_overlap` distinct letters;
+- when PuzzleScore data exists, candidates are split into easy/medium/hard
+  thirds by solve depth and days rotate through them; unscored words are
+  only used when no scored word fits.
+
+All new rows are written in one transaction.
+"""
+import random
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Count, F, Max
+
+from .models import PhoneticComponent, PuzzleScore, Word
+from .puzzles import invalidate as invalidate_puzzles
+
+DIFFICULTY_ORDER = ['easy', 'medium', 'hard']
+
+
+@dataclass
+class ScheduleResult:
+    assigned: list = field(default_factory=list)  # (date, secret, difficulty)
+    unfilled: list = field(default_factory=list)  # dates no candidate fit
+
+
+def complete_words():
+    """{secret: source word id} for words with gap-free PhoneticComponents (latest copy wins)"""
+    rows = (
+        Word.objects.annotate(components=Count('phoneticcomponent'), last_position=Max('phoneticcomponent__position'))
+        .filter(components__gt=0, components=F('last_position') + 1)
+        .order_by('date')
+        .values_list('secret', 'id')
+    )
+    return dict(rows)
+
+
+def difficulty_buckets(secrets):
+    """{secret: 'easy'|'medium'|'hard'} by PuzzleScore solve depth, for scored secrets only"""
+    scores = sorted(
+        PuzzleScore.objects.filter(word_id__in=secrets).values_list('solve_depth', 'expected_remaining', 'word_id'),
+    )
+    return {
+        secret: DIFFICULTY_ORDER[min(i * 3 // len(scores), 2)]
+        for i, (_, _, secret) in enumerate(scores)
+    }
+
+
+def letter_overlap(a, b):
+    return len(set(a) & set(b))
+
+
+def autoschedule(start, end, min_gap=180, max_overlap=3, seed=None, dry_run=False):
+    """Fill every empty date from `start` to `end` (inclusive). Returns a ScheduleResult."""
+    rng = random.Random(seed)
+    result = ScheduleResult()
+
+    # Everything scheduled near the range, for the gap and overlap checks
+    window = Word.objects.filter(date__range=(start - timedelta(days=min_gap), end + timedelta(days=min_gap)))
+    by_date = dict(window.values_list('date', 'secret'))
+    uses = {}
+    for day, secret in sorted(by_date.items()):
+        uses.setdefault(secret, []).append(day)
+
+    sources = complete_words()
+    buckets = difficulty_buckets(list(sources))
+    pools = {name: [] for name in DIFFICULTY_ORDER + [None]}
+    for secret in sources:
+        pools[buckets.get(secret)].append(secret)
+    for pool in pools.values():
+        rng.shuffle(pool)
+    rotation = DIFFICULTY_ORDER if buckets else [None]
+
+    def fits(secret, day):
+        dates = uses.get(secret, [])
+        i = bisect_left(dates, day)
+        if i < len(dates) and (dates[i] - day).days < min_gap:
+            return False
+        if i > 0 and (day - dates[i - 1]).days < min_gap:
+            return False
+        for neighbour in (by_date.get(day - timedelta(days=1)), by_date.get(day + timedelta(days=1))):
+            if neighbour and letter_overlap(secret, neighbour) > max_overlap:
+                return False
+        return True
+
+    day = start
+    while day <= end:
+        if day not in by_date:
+            target = day.toordinal() % len(rotation)
+            order = rotation[target:] + rotation[:target] + ([None] if buckets else [])
+            choice = None
+            for bucket in order:
+                pool = pools[bucket]
+                for index, secret in enumerate(pool):
+                    if fits(secret, day):
+                        # Move it to the back so the pool cycles
+                        pool.append(pool.pop(index))
+                        choice = (secret, bucket)
+                        break
+                if choice:
+                    break
+            if choice:
+                secret, bucket = choice
+                by_date[day] = secret
+                dates = uses.setdefault(secret, [])
+                dates.insert(bisect_left(dates, day), day)
+                result.assigned.append((day, secret, bucket))
+            else:
+                result.unfilled.append(day)
+        day += timedelta(days=1)
+
+    if result.assigned and not dry_run:
+        _insert(result.assigned, sources)
+    return result
+
+
+def _insert(assigned, sources):
+    source_ids = {sources[secret] for _, secret, _ in assigned}
+    source_words = Word.objects.in_bulk(source_ids)
+    components = {}
+    for component in PhoneticComponent.objects.filter(word_id__in=source_ids).order_by('position'):
+        components.setdefault(component.word_id, []).append(component)
+
+    with transaction.atomic():
+        new_words = Word.objects.bulk_create([
+            Word(
+                secret=secret,
+                phonetic=source_words[sources[secret]].phonetic,
+                dictionary=source_words[sources[secret]].dictionary,
+                date=day,
+            )
+            for day, secret, _ in assigned
+        ])
+        PhoneticComponent.objects.bulk_create([
+            PhoneticComponent(word=word, pattern_id=c.pattern_id, position=c.position, no_change=c.no_change)
+            for word in new_words
+            for c in components[sources[word.secret]]
+        ])
+    invalidate_puzzles()
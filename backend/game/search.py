@@ -0,0 +1,138 @@
+"""
+Lexicon search for puzzle authors: wildcard shapes, substrings and excluded
+letters, answered from in-memory indexes instead of LIKE scans.
+
+Built on the solver's per-length tables (see solver.py):
+
+- positional index: `table.columns[i] == code` is the bitset of words with
+  that letter at position i, so a shape like `f?sh` is two or three vector
+  compares over one length's words;
+- n-gram index: for every length, each bigram and trigram maps to the sorted
+  rows containing it. `contains` intersects the postings of the substring's
+  n-grams and only the survivors are checked with a real substring test;
+- excluded letters come from the per-word letter counts.
+
+Shapes use `?` for exactly one letter and `*` for any run of letters
+(`ph*`, `*ough*`, `f?sh`).
+"""
+import re
+import threading
+
+import numpy as np
+
+from .solver import ALPHABET, get_tables
+
+_lock = threading.Lock()
+_ngrams = None  # (tables, {length: {n: NgramPostings}})
+
+SHAPE_RE = re.compile(r'^[a-z?*]+$')
+
+
+class NgramPostings:
+    """Rows of one length's table containing each n-gram, as slices of one sorted array"""
+
+    def __init__(self, table, n):
+        length = table.columns.shape[0]
+        grams = np.zeros((length - n + 1, len(table)), dtype=np.int64)
+        for offset in range(n):
+            grams = grams * ALPHABET + table.columns[offset:offset + length - n + 1]
+        rows = np.tile(np.arange(len(table), dtype=np.int32), length - n + 1)
+        order = np.argsort(grams.ravel(), kind='stable')
+        self.grams = grams.ravel()[order]
+        self.rows = rows[order]
+
+    def lookup(self, gram):
+        lo, hi = np.searchsorted(self.grams, [gram, gram + 1])
+        return np.unique(self.rows[lo:hi])
+
+
+def gram_id(text):
+    value = 0
+    for char in text:
+        value = value * ALPHABET + ord(char) - ord('a')
+    return value
+
+
+def get_ngrams():
+    """Return {length: {2: NgramPostings, 3: NgramPostings}}, rebuilt when the solver tables change"""
+    global _ngrams
+    tables = get_tables()
+    if _ngrams is None or _ngrams[0] is not tables:
+        with _lock:
+            if _ngrams is None or _ngrams[0] is not tables:
+                _ngrams = (tables, {
+                    length: {n: NgramPostings(table, n) for n in (2, 3) if length >= n}
+                    for length, table in tables.items()
+                })
+    return _ngrams[1]
+
+
+def _contains_mask(table, postings, text):
+    mask = np.zeros(len(table), dtype=bool)
+    if len(text) == 1:
+        return table.counts[:, ord(text) - ord('a')] > 0
+    n = min(len(text), 3)
+    if n not in postings:
+        return mask
+    rows = None
+    for start in range(len(text) - n + 1):
+        hits = postings[n].lookup(gram_id(text[start:start + n]))
+        rows = hits if rows is None else np.intersect1d(rows, hits, assume_unique=True)
+        if not len(rows):
+            return mask
+    if len(text) > 3:
+        # Every trigram present doesn't mean they're adjacent - confirm
+        rows = np.array([r for r in rows if text in table.words[r]], dtype=np.int64)
+    mask[rows] = True
+    return mask
+
+
+def search_words(shape=None, length=None, contains=(), excludes=''):
+    """
+    Lexicon words matching every given constraint, ordered by length then
+    alphabetically. `shape` is a ?/* pattern, `contains` a list of substrings,
+    `excludes` a string of letters that must not appear.
+    """
+    tables = get_tables()
+    ngrams = get_ngrams()
+    parts = shape.split('*') if shape else ['']
+    prefix, suffix = parts[0], (parts[-1] if len(parts) > 1 else '')
+    middle = [p for p in parts[1:-1] if p]
+    fixed = len(''.join(parts))
+
+    if length:
+        lengths = [length]
+    elif shape and len(parts) == 1:
+        lengths = [len(shape)]
+    else:
+        lengths = sorted(tables)
+
+    results = []
+    for size in lengths:
+        table = tables.get(size)
+        if table is None or size < fixed or (len(parts) == 1 and shape and size != len(shape)):
+            continue
+        mask = np.ones(len(table), dtype=bool)
+        for i, char in enumerate(prefix):
+            if char != '?':
+                mask &= table.columns[i] == ord(char) - ord('a')
+        for i, char in enumerate(reversed(suffix)):
+            if char != '?':
+                mask &= table.columns[size - 1 - i] == ord(char) - ord('a')
+        for char in set(excludes):
+            mask &= table.counts[:, ord(char) - ord('a')] == 0
+        for text in contains:
+            if mask.any():
+                mask &= _contains_mask(table, ngrams[size], text)
+
+        words = table.words[mask].tolist()
+        if middle:
+            # Segments between stars, in order, inside the part the prefix and suffix don't cover
+            regex = re.compile(
+                re.escape(prefix).replace(r'\?', '.') + ''.join(
+                    '.*' + re.escape(m).replace(r'\?', '.') for m in middle
+                ) + '.*' + re.escape(suffix).replace(r'\?', '.') + '$'
+            )
+            words = [w for w in words if regex.match(w)]
+        results.extend(words)
+    return results
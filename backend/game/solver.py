@@ -0,0 +1,162 @@
+"""
+Vectorized candidate filtering over the lexicon.
+
+Words are grouped by length into NumPy matrices: `codes` holds one letter code
+(0-25) per position and `counts` holds per-word letter counts. Each guess's
+feedback becomes a handful of boolean masks over those matrices, so filtering
+the full dictionary takes milliseconds instead of a Python loop per word.
+
+Tables are built per dictionary (see lexicon.py) and rebuilt if the registry
+reloads that dictionary.
+
+Feedback follows `puzzles.letter_feedback`: position i is green when the guess
+letter matches the target there, and the remaining (non-green) guess letters
+are marked present left to right while unmatched copies are left in the target.
+"""
+import threading
+
+import numpy as np
+
+from .lexicon import DEFAULT_DICTIONARY, get_lexicon
+
+ALPHABET = 26
+
+_lock = threading.Lock()
+_tables = {}  # {dictionary id: (word set, {length: WordTable})}
+
+
+class WordTable:
+    """All lexicon words of one length as NumPy arrays"""
+
+    def __init__(self, words):
+        self.words = np.array(sorted(words))
+        length = len(self.words[0]) if len(self.words) else 0
+        raw = np.frombuffer(''.join(self.words.tolist()).encode('ascii'), dtype=np.uint8)
+        self.codes = (raw - ord('a')).reshape(len(self.words), length)
+        # Position-major copy: one contiguous array per letter position
+        self.columns = np.ascontiguousarray(self.codes.T)
+        self.counts = np.zeros((len(self.words), ALPHABET), dtype=np.uint8)
+        rows = np.repeat(np.arange(len(self.words)), length)
+        np.add.at(self.counts, (rows, self.codes.ravel()), 1)
+
+    def __len__(self):
+        return len(self.words)
+
+
+def get_tables(dictionary_id=DEFAULT_DICTIONARY):
+    """Return {length: WordTable} for a dictionary, building them from its lexicon on first use"""
+    words = get_lexicon(dictionary_id)
+    entry = _tables.get(dictionary_id)
+    if entry is None or entry[0] is not words:
+        with _lock:
+            entry = _tables.get(dictionary_id)
+            if entry is None or entry[0] is not words:
+                by_length = {}
+                for word in words:
+                    if word.isascii() and word.isalpha() and word.islower():
+                        by_length.setdefault(len(word), []).append(word)
+                if not by_length:
+                    return {}
+                entry = (words, {length: WordTable(group) for length, group in by_length.items()})
+                _tables[dictionary_id] = entry
+    return entry[1]
+
+
+def clear_tables(dictionary_id=None):
+    """Drop the cached matrices (of one dictionary, or all) so the next lookup rebuilds them"""
+    with _lock:
+        if dictionary_id is None:
+            _tables.clear()
+        else:
+            _tables.pop(dictionary_id, None)
+
+
+def feedback_mask(table, guess, statuses):
+    """
+    Boolean mask over `table` of the words that would produce `statuses`
+    ('correct' / 'present' / 'absent' per letter) for `guess`.
+    """
+    length = table.codes.shape[1]
+    mask = np.ones(len(table), dtype=bool)
+    green_counts = {}
+    grey_seen = {}
+    present_counts = {}
+
+    for i, (char, status) in enumerate(zip(guess, statuses)):
+        code = ord(char) - ord('a')
+        if not 0 <= code < ALPHABET:
+            return np.zeros(len(table), dtype=bool)
+        if status == 'correct':
+            if i >= length:
+                return np.zeros(len(table), dtype=bool)
+            mask &= table.codes[:, i] == code
+            green_counts[code] = green_counts.get(code, 0) + 1
+            continue
+        if i < length:
+            mask &= table.codes[:, i] != code
+        if status == 'present':
+            present_counts[code] = present_counts.get(code, 0) + 1
+        else:
+            grey_seen[code] = True
+
+    # Letters left over after greens: exactly `present` if a copy was greyed,
+    # otherwise at least `present`
+    for code in set(present_counts) | set(grey_seen):
+        remaining = table.counts[:, code].astype(np.int16) - green_counts.get(code, 0)
+        present = present_counts.get(code, 0)
+        if code in grey_seen:
+            mask &= remaining == present
+        else:
+            mask &= remaining >= present
+    return mask
+
+
+def candidates(length, constraints, dictionary_id=DEFAULT_DICTIONARY):
+    """
+    Return the dictionary's words of `length` consistent with every
+    (guess, statuses) pair in `constraints`, as a NumPy array.
+    """
+    table = get_tables(dictionary_id).get(length)
+    if table is None:
+        return np.array([], dtype=str)
+    mask = np.ones(len(table), dtype=bool)
+    for guess, statuses in constraints:
+        mask &= feedback_mask(table, guess, statuses)
+        if not mask.any():
+            break
+    return table.words[mask]
+
+
+def nearest_words(guess, limit=3, max_distance=2, dictionary_id=DEFAULT_DICTIONARY):
+    """
+    Up to `limit` dictionary words of the same length as `guess`, closest first.
+
+    Distance is the number of differing positions, with one swap of adjacent
+    letters counting as a single edit; ties go to the word sharing more of
+    the guess's letters. One vectorized pass over the length's matrix, so a
+    lookup stays well under a millisecond.
+    """
+    table = get_tables(dictionary_id).get(len(guess))
+    if table is None or not guess.isascii() or not guess.isalpha():
+        return []
+    codes = np.frombuffer(guess.encode('ascii'), dtype=np.uint8) - ord('a')
+
+    distance = np.zeros(len(table), dtype=np.uint8)
+    for i, code in enumerate(codes):
+        distance += table.columns[i] != code
+    # Only rows two substitutions away can be a single adjacent swap
+    two = np.flatnonzero(distance == 2)
+    if len(two):
+        rows = table.codes[two]
+        for i in range(len(guess) - 1):
+            swapped = codes.copy()
+            swapped[i], swapped[i + 1] = codes[i + 1], codes[i]
+            distance[two[(rows == swapped).all(axis=1)]] = 1
+
+    close = np.flatnonzero((distance > 0) & (distance <= max_distance))
+    if not len(close):
+        return []
+    guess_counts = np.bincount(codes, minlength=ALPHABET)
+    shared = np.minimum(table.counts[close], guess_counts).sum(axis=1)
+    order = np.lexsort((table.words[close], -shared, distance[close]))
+    return table.words[close[order[:limit]]].tolist()
@@ -0,0 +1,70 @@
+"""
+Writes to the canonical sound inventory.
+
+Sounds typed by admins go through `sound_for()`, which resolves aliases, so a
+new pattern always points at the canonical Sound. `add_alias()` folds one
+spelling of a sound into another: if the alias was a Sound of its own, its
+patterns and aliases move to the target and the old row is deleted.
+Read-side lookups (name or alias -> id, patterns by sound id) are cached in
+puzzles.py.
+"""
+from django.db import transaction
+
+from .models import PhoneticPattern, Sound, SoundAlias
+from .puzzles import invalidate as invalidate_puzzles
+
+
+def normalize(name):
+    return name.strip().lower()
+
+
+def sound_for(name):
+    """The canonical Sound for a typed sound name or alias, created if it's new"""
+    name = normalize(name)
+    alias = SoundAlias.objects.select_related('sound').filter(alias=name).first()
+    if alias:
+        return alias.sound
+    return Sound.objects.get_or_create(name=name)[0]
+
+
+def canonical_names(names):
+    """{typed name: canonical sound name}; names that aren't aliases map to themselves (normalized)"""
+    aliases = dict(
+        SoundAlias.objects.filter(alias__in={normalize(n) for n in names}).values_list('alias', 'sound__name')
+    )
+    return {name: aliases.get(normalize(name), normalize(name)) for name in names}
+
+
+def sound_ids_for(names):
+    """{name: sound id} for typed names, creating any new sounds. Used by bulk imports."""
+    names = {normalize(n) for n in names}
+    ids = dict(SoundAlias.objects.filter(alias__in=names).values_list('alias', 'sound_id'))
+    ids.update(Sound.objects.filter(name__in=names - ids.keys()).values_list('name', 'id'))
+    missing = names - ids.keys()
+    if missing:
+        Sound.objects.bulk_create([Sound(name=n) for n in missing], ignore_conflicts=True)
+        ids.update(Sound.objects.filter(name__in=missing).values_list('name', 'id'))
+    return ids
+
+
+def merge_alias(alias, sound, sound_model=Sound, alias_model=SoundAlias, pattern_model=PhoneticPattern):
+    """
+    The write behind add_alias(), on the given models so data migrations can
+    run it with historical ones. Call inside a transaction.
+    """
+    alias = normalize(alias)
+    if alias == sound.name:
+        return
+    duplicate = sound_model.objects.filter(name=alias).exclude(pk=sound.pk).first()
+    if duplicate:
+        pattern_model.objects.filter(sound=duplicate).update(sound=sound)
+        alias_model.objects.filter(sound=duplicate).update(sound=sound)
+        duplicate.delete()
+    alias_model.objects.update_or_create(alias=alias, defaults={'sound': sound})
+
+
+def add_alias(alias, sound):
+    """Make `alias` another name for `sound`, merging a Sound already called `alias` into it"""
+    with transaction.atomic():
+        merge_alias(alias, sound)
+    invalidate_puzzles()
@@ -0,0 +1,185 @@
+"""
+Recording finished games.
+
+`record_result()` is the single place a finished game is written. It stores one
+PuzzleResult per player per puzzle (duplicates are ignored) and bumps the
+per-date PuzzleStats counters, the player's UserStats and their day, week and
+month LeaderboardRollup rows with atomic F() increments, so neither the
+distribution nor the windowed leaderboards ever have to scan results.
+
+Rollup rows for periods older than LEADERBOARD_RETENTION are dropped by
+`compact_rollups()` (see the compact_leaderboards command).
+"""
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import F
+
+from .models import LeaderboardRollup, PuzzleResult, PuzzleStats, UserStats
+
+MAX_GUESSES = 6
+STATS_CACHE_TTL = 10  # seconds
+# Most wins, least losses, oldest account (user ids follow sign-up order)
+LEADERBOARD_RANKING = ('-correctGuesses', 'wrongGuesses', 'user_id')
+
+
+def record_result(puzzle_date, player_key, guesses, solved, user=None):
+    """
+    Record a finished game. Returns False (and changes nothing) if this player
+    already has a result for the puzzle.
+    """
+    try:
+        with transaction.atomic():
+            PuzzleResult.objects.create(
+                puzzle_date=puzzle_date,
+                player_key=player_key,
+                user=user,
+                guesses=guesses,
+                solved=solved,
+            )
+
+            PuzzleStats.objects.bulk_create([PuzzleStats(date=puzzle_date)], ignore_conflicts=True)
+            bucket = f'solved_{guesses}' if solved else 'failed'
+            PuzzleStats.objects.filter(date=puzzle_date).update(
+                **{bucket: F(bucket) + 1, 'players': F('players') + 1}
+            )
+
+            if user is not None:
+                UserStats.objects.get_or_create(user=user)
+                if solved:
+                    # The streak only carries on from a win on the previous day's puzzle
+                    previous = (
+                        PuzzleResult.objects.filter(user=user, puzzle_date__lt=puzzle_date)
+                        .order_by('-puzzle_date').values_list('puzzle_date', 'solved').first()
+                    )
+                    consecutive = previous == (puzzle_date - timedelta(days=1), True)
+                    UserStats.objects.filter(user=user).update(
+                        correctGuesses=F('correctGuesses') + 1, streak=F('streak') + 1 if consecutive else 1,
+                    )
+                else:
+                    UserStats.objects.filter(user=user).update(
+                        wrongGuesses=F('wrongGuesses') + 1, streak=0,
+                    )
+                _bump_rollups(user, puzzle_date, solved)
+    except IntegrityError:
+        return False
+
+    cache.delete(stats_cache_key(puzzle_date))
+    return True
+
+
+def period_start(period, day):
+    """First date of the day/week/month period containing `day` (weeks start on Monday)"""
+    if period == LeaderboardRollup.WEEK:
+        return day - timedelta(days=day.weekday())
+    if period == LeaderboardRollup.MONTH:
+        return day.replace(day=1)
+    return day
+
+
+def _bump_rollups(user, puzzle_date, solved):
+    rows = [
+        LeaderboardRollup(period=period, period_start=period_start(period, puzzle_date), user=user)
+        for period, _ in LeaderboardRollup.PERIOD_CHOICES
+    ]
+    LeaderboardRollup.objects.bulk_create(rows, ignore_conflicts=True)
+    field = 'correctGuesses' if solved else 'wrongGuesses'
+    for row in rows:
+        LeaderboardRollup.objects.filter(
+            period=row.period, period_start=row.period_start, user=user,
+        ).update(**{field: F(field) + 1})
+
+
+def leaderboard_rows(period, today):
+    """Rows ranked by LEADERBOARD_RANKING: lifetime UserStats for 'all', else the current period's rollups"""
+    if period == 'all':
+        return UserStats.objects.select_related('user')
+    return LeaderboardRollup.objects.select_related('user__userstats').filter(
+        period=period, period_start=period_start(period, today),
+    )
+
+
+def leaderboard_entry(rank, stat):
+    """Leaderboard JSON for a UserStats or LeaderboardRollup row; streak is always the lifetime one"""
+    if isinstance(stat, UserStats):
+        streak = stat.streak
+    else:
+        lifetime = getattr(stat.user, 'userstats', None)
+        streak = lifetime.streak if lifetime else 0
+    return {
+        'rank': rank,
+        'username': stat.user.username,
+        'correct': stat.correctGuesses,
+        'wrong': stat.wrongGuesses,
+        'streak': streak
+    }
+
+
+def compact_rollups(today):
+    """
+    Delete rollup rows for periods that ended more than LEADERBOARD_RETENTION
+    periods ago. Returns the number of rows deleted per period.
+    """
+    deleted = {}
+    for period, keep in settings.LEADERBOARD_RETENTION.items():
+        cutoff = period_start(period, today)
+        for _ in range(keep):
+            # Step back one whole period at a time
+            cutoff = period_start(period, cutoff - timedelta(days=1))
+        deleted[period], _ = LeaderboardRollup.objects.filter(period=period, period_start__lt=cutoff).delete()
+    return deleted
+
+
+def rebuild_rollups(since):
+    """Recompute every rollup for periods containing or after `since` from PuzzleResult rows"""
+    # Widen to whole periods, separately for each period: the week containing
+    # the 1st can start in the previous month
+    cutoffs = {period: period_start(period, since) for period, _ in LeaderboardRollup.PERIOD_CHOICES}
+    counts = {}
+    results = (
+        PuzzleResult.objects.filter(user__isnull=False, puzzle_date__gte=min(cutoffs.values()))
+        .values_list('user_id', 'puzzle_date', 'solved')
+        .iterator(chunk_size=10000)
+    )
+    for user_id, puzzle_date, solved in results:
+        for period, cutoff in cutoffs.items():
+            if puzzle_date < cutoff:
+                continue
+            key = (period, period_start(period, puzzle_date), user_id)
+            correct, wrong = counts.get(key, (0, 0))
+            counts[key] = (correct + 1, wrong) if solved else (correct, wrong + 1)
+
+    with transaction.atomic():
+        for period, cutoff in cutoffs.items():
+            LeaderboardRollup.objects.filter(period=period, period_start__gte=cutoff).delete()
+        LeaderboardRollup.objects.bulk_create(
+            [
+                LeaderboardRollup(
+                    period=period, period_start=start, user_id=user_id,
+                    correctGuesses=correct, wrongGuesses=wrong,
+                )
+                for (period, start, user_id), (correct, wrong) in counts.items()
+            ],
+            batch_size=5000,
+        )
+    return len(counts)
+
+
+def stats_cache_key(puzzle_date):
+    return f'puzzle-stats:{puzzle_date.isoformat()}'
+
+
+def puzzle_stats_payload(puzzle_date):
+    """Guess distribution for a puzzle date, cached for STATS_CACHE_TTL seconds"""
+    def build():
+        stats = PuzzleStats.objects.filter(date=puzzle_date).first() or PuzzleStats(date=puzzle_date)
+        return {
+            'date': puzzle_date.isoformat(),
+            'players': stats.players,
+            'distribution': stats.distribution,
+            'failed': stats.failed,
+            'solve_rate': round(stats.solve_rate, 1),
+        }
+    return cache.get_or_set(stats_cache_key(puzzle_date), build, STATS_CACHE_TTL)
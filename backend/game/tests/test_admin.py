@@ -0,0 +1,46 @@
+from datetime import date
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from game.models import PhoneticComponent, PhoneticPattern, Sound, Word
+
+
+class AdminQueryCountTests(TestCase):
+    """Admin pages run the same number of queries however many components a word has"""
+
+    def setUp(self):
+        self.client.force_login(User.objects.create_superuser('admin', 'admin@example.com', 'secret123'))
+
+    def seed(self, components):
+        word = Word.objects.create(secret='fish', phonetic=f'ghoti{components}', date=date(2026, 1, components))
+        for position in range(components):
+            pattern = PhoneticPattern.objects.create(
+                letters=f'p{components}x{position}', sound=Sound.objects.create(name=f's{components}x{position}'),
+                reference='ref',
+            )
+            PhoneticComponent.objects.create(word=word, pattern=pattern, position=position)
+        return word
+
+    def count_queries(self, url):
+        self.client.get(url)  # Fills the ContentType cache
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def test_word_change_page(self):
+        counts = [
+            self.count_queries(reverse('admin:game_word_change', args=[self.seed(n).pk])) for n in (3, 30)
+        ]
+        self.assertEqual(counts[0], counts[1])
+
+    def test_component_changelist(self):
+        url = reverse('admin:game_phoneticcomponent_changelist')
+        self.seed(3)
+        few = self.count_queries(url)
+        self.seed(30)
+        self.assertEqual(self.count_queries(url), few)
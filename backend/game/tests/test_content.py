@@ -0,0 +1,109 @@
+import tempfile
+from datetime import date
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from game.content import ContentImporter, export_records
+from game.models import PhoneticComponent, PhoneticPattern, Word
+from game.sounds import sound_for
+
+# (secret, phonetic, [(letters, sound, reference, no_change), ...])
+LIBRARY = [
+    ('fish', 'ghoti', [('gh', 'f', 'enough', False), ('o', 'i', 'women', False), ('ti', 'sh', 'nation', False)]),
+    ('fast', 'phast', [('ph', 'f', 'phone', False), ('a', 'a', 'cat', True), ('s', 's', 'sit', True), ('t', 't', 'top', True)]),
+    ('shin', 'tiin', [('ti', 'sh', 'nation', False), ('i', 'i', 'pin', True), ('n', 'n', 'nut', True)]),
+    ('tough', 'tuf', [
+        ('t', 't', 'top', True), ('u', 'uh', 'tough', False), ('f', 'f', 'fish', False),
+        ('gh', 'f', 'enough', False), ('o', 'i', 'women', False),
+    ]),
+]
+
+
+def snapshot():
+    """Everything an import should reproduce, without ids"""
+    return (
+        sorted(PhoneticPattern.objects.values_list('letters', 'sound__name', 'reference')),
+        list(Word.objects.order_by('date').values_list('date', 'secret', 'phonetic', 'dictionary')),
+        list(PhoneticComponent.objects.order_by('word__date', 'position').values_list(
+            'word__date', 'position', 'pattern__letters', 'pattern__sound__name', 'pattern__reference', 'no_change',
+        )),
+    )
+
+
+def clear_content():
+    PhoneticComponent.objects.all().delete()
+    Word.objects.all().delete()
+    PhoneticPattern.objects.all().delete()
+
+
+class ContentRoundTripTests(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+
+        patterns = {}
+        for day, (secret, phonetic, components) in enumerate(LIBRARY, start=1):
+            word = Word.objects.create(secret=secret, phonetic=phonetic, date=date(2026, 2, day))
+            for position, (letters, sound, reference, no_change) in enumerate(components):
+                key = (letters, sound, reference)
+                if key not in patterns:
+                    patterns[key] = PhoneticPattern.objects.create(
+                        letters=letters, sound=sound_for(sound), reference=reference,
+                    )
+                PhoneticComponent.objects.create(word=word, pattern=patterns[key], position=position, no_change=no_change)
+        self.expected = snapshot()
+
+    def export(self, fmt):
+        path = self.directory / f'content.{fmt}'
+        call_command('export_content', str(path), stdout=StringIO())
+        return path
+
+    def load(self, path, *args):
+        out = StringIO()
+        call_command('import_content', str(path), *args, stdout=out)
+        return out.getvalue()
+
+    def test_round_trip_into_an_empty_database(self):
+        for fmt in ('ndjson', 'csv'):
+            with self.subTest(fmt=fmt):
+                path = self.export(fmt)
+                clear_content()
+                self.load(path)
+                self.assertEqual(snapshot(), self.expected)
+
+    def test_reimport_changes_nothing(self):
+        for fmt in ('ndjson', 'csv'):
+            with self.subTest(fmt=fmt):
+                path = self.export(fmt)
+                ids = sorted(PhoneticComponent.objects.values_list('id', flat=True))
+                output = self.load(path, '--verbosity', '2')
+
+                self.assertEqual(snapshot(), self.expected)
+                self.assertEqual(sorted(PhoneticComponent.objects.values_list('id', flat=True)), ids)
+                self.assertNotIn('+ ', output)
+                self.assertNotIn('~ ', output)
+                self.assertIn('0 created, 0 updated', output)
+
+    def test_dry_run_writes_nothing(self):
+        path = self.export('ndjson')
+        clear_content()
+        output = self.load(path, '--dry-run')
+
+        self.assertEqual(snapshot(), ([], [], []))
+        self.assertIn(f'  word       {len(LIBRARY)} created, 0 updated, 0 unchanged', output)
+        self.assertIn('+ word 2026-02-01 fish', output)
+
+    def test_chunks_smaller_than_one_word(self):
+        records = list(export_records())
+        clear_content()
+        changes = []
+        summary = ContentImporter(chunk_size=2, on_change=lambda *change: changes.append(change)).run(records)
+
+        self.assertEqual(snapshot(), self.expected)
+        self.assertEqual(summary['component']['created'], sum(len(c) for _, _, c in LIBRARY))
+        # Each word's components were replaced in one piece
+        self.assertEqual(len([c for c in changes if c[0] == 'component']), len(LIBRARY))
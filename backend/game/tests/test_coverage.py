@@ -0,0 +1,27 @@
+from django.test import SimpleTestCase
+
+from game.coverage import build_trie, mine, rank_missing, segment
+
+
+class SegmentTests(SimpleTestCase):
+
+    def setUp(self):
+        self.trie = build_trie(['gh', 'o', 'ti', 'n', 'a', 'ough', 't', 'e', 'i', 'sh'])
+
+    def test_prefers_fewest_segments(self):
+        self.assertEqual(segment('tough', self.trie), (['t', 'ough'], []))
+        self.assertEqual(segment('nation', self.trie), (['n', 'a', 'ti', 'o', 'n'], []))
+
+    def test_uncovered_runs_are_missing_groups(self):
+        self.assertEqual(segment('fish', self.trie), (['f', 'i', 'sh'], ['f']))
+        self.assertEqual(segment('plain', self.trie), (['p', 'l', 'a', 'i', 'n'], ['pl']))
+
+    def test_pool_matches_single_process(self):
+        words = ['tough', 'nation', 'fish', 'plain', 'xyz'] * 3
+        groups = ['gh', 'o', 'ti', 'n', 'a', 'ough', 't']
+        self.assertEqual(list(mine(words, groups, workers=2, chunk_size=4)), list(mine(words, groups, workers=1)))
+
+    def test_ranking(self):
+        ranking = rank_missing({'fish': ['f'], 'fifth': ['f', 'f', 'h'], 'quiz': ['q', 'z'], 'xyzzyx': ['xyzzyx']})
+        self.assertEqual(ranking[0], ('f', 1, 2))
+        self.assertNotIn('xyzzyx', [group for group, _, _ in ranking])
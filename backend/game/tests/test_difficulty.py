@@ -0,0 +1,62 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase
+
+from game.difficulty import CORRECT, PRESENT, feedback_codes, score_length, solve_depths
+from game.lexicon import clear_lexicon
+from game.models import PuzzleScore, ValidWord
+from game.puzzles import letter_feedback
+from game.solver import WordTable, clear_tables
+
+WORDS = ['fish', 'dish', 'wish', 'fash', 'shif', 'fiss', 'siss', 'eels', 'else', 'lees', 'sees', 'ease', 'epee']
+STATUS_CODES = {'absent': 0, 'present': PRESENT, 'correct': CORRECT}
+
+
+def encode(statuses):
+    return sum(STATUS_CODES[s] * 3 ** i for i, s in enumerate(statuses))
+
+
+class FeedbackCodesTests(SimpleTestCase):
+    def test_matches_letter_feedback(self):
+        table = WordTable(WORDS)
+        for row, guess in enumerate(table.words):
+            codes = feedback_codes(table.codes, table.counts, table.codes[row])
+            for target, code in zip(table.words, codes):
+                with self.subTest(guess=guess, target=target):
+                    self.assertEqual(code, encode(letter_feedback(str(guess), str(target))))
+
+    def test_every_word_is_solved(self):
+        table = WordTable(WORDS)
+        depths = solve_depths(table.codes, table.counts)
+        self.assertTrue((depths >= 1).all())
+        self.assertEqual((depths == 1).sum(), 1)  # Only the first guess itself
+
+    def test_score_length(self):
+        table = WordTable(WORDS)
+        scores = score_length(table, workers=1)
+        opener = list(table.words).index(scores['opener'])
+        self.assertEqual(scores['solve_depth'][opener], 1)
+        self.assertTrue((scores['worst_case_depth'] >= scores['solve_depth']).all())
+        # Each word's partition holds exactly the words giving the opener the same feedback
+        for word, remaining in zip(table.words, scores['expected_remaining']):
+            feedback = letter_feedback(scores['opener'], str(word))
+            self.assertEqual(remaining, sum(letter_feedback(scores['opener'], w) == feedback for w in WORDS))
+
+
+class ScorePuzzlesCommandTests(TestCase):
+    def setUp(self):
+        ValidWord.objects.bulk_create([ValidWord(word=w) for w in WORDS + ['ghoti', 'tough']])
+        clear_lexicon()
+        clear_tables()
+        self.addCleanup(clear_lexicon)
+        self.addCleanup(clear_tables)
+
+    def test_scores_every_word_and_rescoring_updates_in_place(self):
+        call_command('score_puzzles', '--workers', '1', stdout=StringIO())
+        self.assertEqual(PuzzleScore.objects.count(), len(WORDS) + 2)
+
+        call_command('score_puzzles', '--workers', '1', '--length', '5', stdout=StringIO())
+        self.assertEqual(PuzzleScore.objects.count(), len(WORDS) + 2)
+        fives = PuzzleScore.objects.filter(word__in=['ghoti', 'tough'])
+        self.assertEqual(sorted(fives.values_list('solve_depth', flat=True)), [1, 2])
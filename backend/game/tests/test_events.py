@@ -0,0 +1,88 @@
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.db import DatabaseError, connection
+from django.test import TestCase
+from django.utils import timezone
+
+from game.events import FIELDS, EventBuffer
+from game.models import GuessEvent
+
+
+def event(guess, days_ago=0):
+    now = timezone.now()
+    return ((now - timedelta(days=days_ago)).date(), 'anon', guess, GuessEvent.WRONG, now)
+
+
+class EventBufferTests(TestCase):
+    def setUp(self):
+        # No background flusher: the tests call flush() themselves
+        patcher = mock.patch.object(EventBuffer, '_run')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.buffer = EventBuffer(flush_events=3, flush_ms=60000, max_buffer=5)
+
+    def written(self):
+        return list(GuessEvent.objects.order_by('id').values_list('guess', flat=True))
+
+    def test_wakes_the_flusher_at_the_threshold(self):
+        self.buffer.add(event('fish'))
+        self.buffer.add(event('dish'))
+        self.assertFalse(self.buffer._wake.is_set())
+        self.buffer.add(event('wish'))
+        self.assertTrue(self.buffer._wake.is_set())
+
+        self.assertEqual(self.buffer.flush(), 3)
+        self.assertEqual(self.written(), ['fish', 'dish', 'wish'])
+        self.assertEqual(self.buffer.flush(), 0)
+
+    def test_drops_the_oldest_events_past_the_limit(self):
+        for i in range(7):
+            self.buffer.add(event(f'guess{i}'))
+
+        self.assertEqual(self.buffer.dropped, 2)
+        self.assertEqual(self.buffer.flush(), 5)
+        self.assertEqual(self.written(), [f'guess{i}' for i in range(2, 7)])
+
+    def test_failed_writes_are_requeued(self):
+        for guess in ('fish', 'dish', 'wish'):
+            self.buffer.add(event(guess))
+        with mock.patch.object(self.buffer, '_write', side_effect=DatabaseError('down')):
+            with self.assertLogs('game.events', 'ERROR'):
+                self.assertEqual(self.buffer.flush(), 0)
+        self.assertEqual(self.written(), [])
+
+        # Requeued events go ahead of newer ones, still capped at max_buffer
+        for guess in ('ghoti', 'phish', 'tough'):
+            self.buffer.add(event(guess))
+        self.assertEqual(self.buffer.flush(), 5)
+        self.assertEqual(self.written(), ['dish', 'wish', 'ghoti', 'phish', 'tough'])
+
+
+class PruneGuessEventsTests(TestCase):
+    def setUp(self):
+        if connection.vendor == 'postgresql':
+            self.skipTest('PostgreSQL drops whole partitions instead of deleting rows')
+        GuessEvent.objects.bulk_create([
+            GuessEvent(**dict(zip(FIELDS, event(f'd{days}', days))))
+            for days in (0, 1, 29, 30, 31, 90)
+        ])
+
+    def prune(self, *args):
+        out = StringIO()
+        call_command('prune_guess_events', '--days', '30', *args, stdout=out)
+        return out.getvalue()
+
+    def kept(self):
+        return sorted(GuessEvent.objects.values_list('guess', flat=True))
+
+    def test_dry_run_deletes_nothing(self):
+        self.assertIn('Deleted 2 guess events', self.prune('--dry-run'))
+        self.assertEqual(GuessEvent.objects.count(), 6)
+
+    def test_deletes_events_before_the_cutoff(self):
+        self.assertIn('Deleted 2 guess events', self.prune())
+        self.assertEqual(self.kept(), ['d0', 'd1', 'd29', 'd30'])
+        self.assertIn('Deleted 0 guess events', self.prune())
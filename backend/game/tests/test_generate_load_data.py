@@ -0,0 +1,38 @@
+from datetime import date
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth.models import Group, User
+from django.core.management import call_command
+from django.test import TestCase
+
+from game.lexicon import clear_lexicon
+from game.models import LeaderboardRollup, PhoneticPattern, PuzzleResult, UserStats, ValidWord, Word
+from game.stats import record_result
+
+
+class ClearLoadDataTests(TestCase):
+    def setUp(self):
+        ValidWord.objects.bulk_create([ValidWord(word=w) for w in ('fish', 'dish', 'wish', 'ghoti')])
+        clear_lexicon()
+        self.addCleanup(clear_lexicon)
+        call_command('generate_load_data', users=30, days=5, patterns=20, chunk_size=7, stdout=StringIO())
+
+    def test_clear_removes_only_generated_rows(self):
+        real = [User.objects.create_user(name, f'{name}@example.com', 'secret123') for name in ('loader', 'load7x')]
+        PhoneticPattern.objects.create(letters='ph', sound=PhoneticPattern.objects.first().sound, reference='load-bearing')
+        generated = User.objects.get(username='load5')
+        generated.groups.add(Group.objects.create(name='testers'))
+        record_result(date(2026, 1, 1), f'u:{generated.pk}', 3, True, user=generated)
+
+        # Small batches, so the walk over several DELETEs is exercised
+        with mock.patch('game.management.commands.generate_load_data.CLEAR_BATCH', 7):
+            call_command('generate_load_data', clear=True, stdout=StringIO())
+
+        self.assertEqual(list(User.objects.order_by('username')), sorted(real, key=lambda u: u.username))
+        self.assertEqual(list(PhoneticPattern.objects.values_list('reference', flat=True)), ['load-bearing'])
+        self.assertFalse(Word.objects.exists())
+        self.assertFalse(UserStats.objects.exists())
+        self.assertFalse(LeaderboardRollup.objects.exists())
+        # Results outlive their player, as with an ORM delete
+        self.assertIsNone(PuzzleResult.objects.get().user_id)
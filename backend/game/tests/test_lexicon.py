@@ -0,0 +1,93 @@
+import tempfile
+from pathlib import Path
+
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from game.artifacts import clear_artifact
+from game.lexicon import clear_lexicon
+from game.models import ValidWord, Word
+from game.puzzles import invalidate as invalidate_puzzles
+from game.solver import clear_tables
+
+EN_WORDS = ['fish', 'dish', 'wish', 'ghoti']
+EXPERT_WORDS = ['fish', 'zorb', 'zarb', 'zerb', 'quux']
+
+
+class DictionaryTestCase(TestCase):
+    """Today's puzzle comes from a file-backed 'expert' dictionary; 'en' is the ValidWord table"""
+    dictionary = 'expert'
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = Path(directory.name) / 'expert.txt'
+        path.write_text('\n'.join(EXPERT_WORDS) + '\n')
+        settings = override_settings(
+            LEXICON_DICTIONARIES={'en': {}, 'expert': {'path': path}},
+            GUESS_EVENTS_ENABLED=False,
+        )
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+        ValidWord.objects.bulk_create([ValidWord(word=w) for w in EN_WORDS])
+        Word.objects.create(secret='zorb', phonetic='zawrb', date=timezone.now().date(), dictionary=self.dictionary)
+        for clear in (clear_lexicon, clear_tables, clear_artifact, invalidate_puzzles):
+            clear()
+            self.addCleanup(clear)
+
+    def post(self, name, **data):
+        return self.client.post(reverse(name), data, content_type='application/json')
+
+
+class PuzzleDictionaryTests(DictionaryTestCase):
+    def test_guesses_are_checked_against_the_puzzle_dictionary(self):
+        self.assertEqual(self.post('validate_guess', guess='quux').status_code, 200)
+        self.assertEqual(self.post('validate_guess', guess='dish').status_code, 400)
+
+    def test_suggestions_come_from_the_puzzle_dictionary(self):
+        response = self.post('validate_guess', guess='zirb')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['suggestions'], ['zarb', 'zerb', 'zorb'])
+        # 'en' would also offer 'dish' and 'wish'
+        self.assertEqual(self.post('validate_guess', guess='fosh').json()['suggestions'], ['fish'])
+
+    def test_hint_counts_the_puzzle_dictionary(self):
+        response = self.post('hint', guesses=['zarb'])
+        self.assertEqual(response.json()['remaining'], 2)  # 'zorb' and 'zerb'; 'en' has neither
+
+    def test_artifact_is_served_per_dictionary(self):
+        manifest = self.client.get(reverse('lexicon_manifest')).json()
+        self.assertEqual(manifest['dictionary'], 'expert')
+        self.assertEqual(self.client.get(manifest['url']).status_code, 200)
+
+        stale = reverse('lexicon_artifact', args=['en', manifest['version']])
+        self.assertEqual(self.client.get(stale).status_code, 404)
+        self.assertEqual(self.client.get(reverse('lexicon_artifact', args=['nope', 'v1'])).status_code, 404)
+
+
+class RemovedDictionaryTests(DictionaryTestCase):
+    dictionary = 'retired'
+
+    def test_falls_back_to_the_default_dictionary(self):
+        self.assertEqual(self.post('validate_guess', guess='dish').status_code, 200)
+        self.assertEqual(self.post('validate_guess', guess='quux').status_code, 400)
+        self.assertEqual(self.post('hint', guesses=['dish']).status_code, 200)
+        self.assertEqual(self.client.get(reverse('lexicon_manifest')).json()['dictionary'], 'en')
+
+
+class CreateWordDictionaryTests(DictionaryTestCase):
+    def setUp(self):
+        super().setUp()
+        self.client.force_login(User.objects.create_superuser('admin', 'admin@example.com', 'secret123'))
+
+    def test_null_dictionary_means_the_default(self):
+        response = self.post('create_word', secret='wish', phonetic='wysh', dictionary=None)
+        self.assertEqual(response.status_code, 201, response.content)
+        self.assertEqual(Word.objects.get(secret='wish').dictionary, 'en')
+
+    def test_unknown_dictionary_is_rejected(self):
+        response = self.post('create_word', secret='wish', phonetic='wysh', dictionary='nope')
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,92 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from game.mail import CLAIM_LEASE, backoff_delay, claim_batch, drain_outbox, queue_mail, renew_lease
+from game.models import OutboundEmail
+
+
+class BouncingBackend(EmailBackend):
+    """locmem backend that refuses anything addressed to a bounce@ mailbox"""
+    def send_messages(self, messages):
+        if any(to.startswith('bounce@') for message in messages for to in message.to):
+            raise ConnectionError('550 mailbox unavailable')
+        return super().send_messages(messages)
+
+
+class OutboxTests(TestCase):
+    def setUp(self):
+        self.connection = BouncingBackend()
+
+    def test_claim_leases_due_rows_once(self):
+        due = queue_mail('Reset', 'body', 'a@example.com')
+        later = queue_mail('Later', 'body', 'b@example.com')
+        OutboundEmail.objects.filter(pk=later.pk).update(next_attempt_at=timezone.now() + timedelta(hours=1))
+
+        batch = claim_batch(10)
+        self.assertEqual([e.pk for e in batch], [due.pk])
+        due.refresh_from_db()
+        self.assertEqual(due.attempts, 1)
+        self.assertGreater(due.next_attempt_at, timezone.now() + timedelta(seconds=CLAIM_LEASE - 5))
+        # Leased rows aren't due for anyone else
+        self.assertEqual(claim_batch(10), [])
+
+    def test_sends_and_marks_sent(self):
+        queue_mail('Reset', 'Your link', 'a@example.com')
+        queue_mail('Reset', 'Your link', 'b@example.com')
+
+        self.assertEqual(drain_outbox(self.connection), (2, 0))
+        self.assertEqual(sorted(m.to[0] for m in mail.outbox), ['a@example.com', 'b@example.com'])
+        self.assertEqual(OutboundEmail.objects.filter(status=OutboundEmail.SENT, sent_at__isnull=False).count(), 2)
+        self.assertEqual(drain_outbox(self.connection), (0, 0))
+
+    def test_failure_backs_off_then_gives_up(self):
+        email = queue_mail('Reset', 'Your link', 'bounce@example.com')
+
+        before = timezone.now()
+        self.assertEqual(drain_outbox(self.connection, max_attempts=2), (0, 1))
+        email.refresh_from_db()
+        self.assertEqual((email.status, email.attempts), (OutboundEmail.PENDING, 1))
+        self.assertIn('550', email.last_error)
+        self.assertGreaterEqual(email.next_attempt_at, before + timedelta(seconds=backoff_delay(1)))
+        # Not due again until the backoff has passed
+        self.assertEqual(drain_outbox(self.connection, max_attempts=2), (0, 0))
+
+        OutboundEmail.objects.filter(pk=email.pk).update(next_attempt_at=timezone.now())
+        self.assertEqual(drain_outbox(self.connection, max_attempts=2), (0, 1))
+        email.refresh_from_db()
+        self.assertEqual((email.status, email.attempts), (OutboundEmail.FAILED, 2))
+        self.assertEqual(mail.outbox, [])
+
+    def test_lapsed_lease_is_not_renewed_after_another_claim(self):
+        queue_mail('Reset', 'Your link', 'a@example.com')
+        [stale] = claim_batch(10)
+        # The first worker stalled past its lease and a second worker claimed the row
+        OutboundEmail.objects.update(next_attempt_at=timezone.now())
+        [current] = claim_batch(10)
+
+        self.assertFalse(renew_lease(stale))
+        self.assertTrue(renew_lease(current))
+
+    def test_backoff_doubles_up_to_the_cap(self):
+        self.assertEqual([backoff_delay(n) for n in (1, 2, 3)], [30, 60, 120])
+        self.assertEqual(backoff_delay(20), 60 * 60)
+
+
+@override_settings(EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend')
+class RunMailWorkerTests(TestCase):
+    def test_once_drains_the_outbox(self):
+        for i in range(3):
+            queue_mail('Reset', 'Your link', f'user{i}@example.com')
+
+        out = StringIO()
+        call_command('run_mail_worker', '--once', '--batch-size', '2', stdout=out)
+
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertFalse(OutboundEmail.objects.exclude(status=OutboundEmail.SENT).exists())
+        self.assertIn('3 sent, 0 failed', out.getvalue())
@@ -0,0 +1,43 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.sessions.models import Session
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+
+class PurgeSessionsTests(TestCase):
+    def setUp(self):
+        now = timezone.now()
+        # Batches of 3 split the four sessions sharing one expiry
+        expiries = [now - timedelta(days=d) for d in (9, 8, 5, 5, 5, 5, 1)] + [now - timedelta(seconds=1)]
+        Session.objects.bulk_create(
+            [Session(session_key=f'old{i}', session_data='', expire_date=e) for i, e in enumerate(expiries)]
+            + [Session(session_key=f'live{i}', session_data='', expire_date=now + timedelta(hours=i + 1)) for i in range(3)]
+        )
+
+    def purge(self, *args):
+        out = StringIO()
+        call_command('purge_sessions', '--batch-size', '3', '--sleep', '0', '--nice', '0', *args, stdout=out)
+        return out.getvalue()
+
+    def test_deletes_expired_sessions_in_batches(self):
+        output = self.purge('--verbosity', '2')
+
+        self.assertEqual(sorted(Session.objects.values_list('session_key', flat=True)), ['live0', 'live1', 'live2'])
+        self.assertEqual(output.count('  batch '), 3)
+        self.assertIn('Deleted 8 sessions', output)
+        self.assertIn('8 deleted in 1 passes', output)
+
+    def test_nothing_to_do(self):
+        Session.objects.filter(session_key__startswith='old').delete()
+        output = self.purge()
+        self.assertEqual(Session.objects.count(), 3)
+        self.assertIn('0 deleted in 1 passes', output)
+
+    @override_settings(SESSION_ENGINE='django.contrib.sessions.backends.signed_cookies')
+    def test_rejects_sessions_outside_the_database(self):
+        with self.assertRaises(CommandError):
+            self.purge()
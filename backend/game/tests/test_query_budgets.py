@@ -0,0 +1,251 @@
+"""
+Query-count and response-size budgets for every API endpoint.
+
+Each entry in BUDGETS requests one URL from game/urls.py with fixed inputs,
+against seeded data at every size in FIXTURE_SIZES, and records the SQL
+queries it ran and the bytes it returned. A case fails if it goes over its
+declared `max_queries` / `max_bytes` at any size, or if its query count
+differs between sizes - an N+1 over components, users or words shows up as
+a count that grows with the data long before it shows up in production.
+
+In-process caches (current puzzle, pattern index, lexicon, solver tables,
+Bloom artifact, stats cache) are dropped before every request, so the budget
+covers the cold path; warm requests only ever run fewer queries. Every
+request runs in a rolled-back savepoint, so writes don't leak into the next
+case.
+
+Adding a URL to game/urls.py without a budget here fails
+test_every_url_has_a_budget.
+"""
+from dataclasses import dataclass, field
+from datetime import timedelta
+from itertools import product
+from string import ascii_lowercase
+from typing import Callable, Optional
+
+from django.contrib.auth.models import User
+from django.contrib.auth.tokens import default_token_generator
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, reverse
+from django.utils import timezone
+
+from game import urls
+from game.artifacts import clear_artifact, lexicon_artifact
+from game.lexicon import clear_lexicon
+from game.models import (
+    LeaderboardRollup, PhoneticComponent, PhoneticPattern, PuzzleResult, PuzzleStats, Sound, SoundAlias, UserStats,
+    ValidWord, Word,
+)
+from game.puzzles import invalidate as invalidate_puzzles
+from game.solver import clear_tables
+from game.stats import period_start
+
+FIXTURE_SIZES = (10, 100, 400)  # Rows per table: words, patterns, users, ...
+REAL_WORDS = ['fish', 'fash', 'dish', 'wish', 'ghoti', 'enough', 'women', 'nation', 'phone', 'tough']
+
+
+@dataclass
+class Fixture:
+    """Handles on the seeded rows the request inputs refer to"""
+    size: int
+    today: object
+    player: User
+    admin: User
+    word: Word
+    patterns: list
+    spare_secret: str
+
+
+@dataclass
+class Budget:
+    url_name: str
+    label: str
+    method: str
+    max_queries: int
+    max_bytes: Optional[int]  # None: the response is meant to scale with the data
+    user: Optional[str] = None  # 'player' or 'admin'; anonymous otherwise
+    args: Callable = lambda fx: []
+    data: Callable = lambda fx: {}
+    params: dict = field(default_factory=dict)
+    status: Optional[int] = None  # Expected status; any non-5xx otherwise
+
+
+BUDGETS = [
+    Budget('get_word', 'today', 'GET', 2, 500),
+    Budget('validate_guess', 'valid', 'POST', 3, 400, data=lambda fx: {'guess': 'wish'}),
+    Budget('validate_guess', 'not a word', 'POST', 3, 200, data=lambda fx: {'guess': 'fizh'}),
+    Budget('hint', 'with sample', 'POST', 3, 100, data=lambda fx: {'guesses': ['dish', 'wish'], 'sample': 5}),
+    Budget('lexicon_manifest', 'manifest', 'GET', 3, 200),
+    # The Bloom filter grows with the lexicon by design
+    Budget('lexicon_artifact', 'current', 'GET', 1, None, args=lambda fx: ['en', lexicon_artifact()[0]]),
+    Budget('lexicon_stats', 'admin', 'GET', 2, 400, user='admin'),
+    Budget('record_result', 'player', 'POST', 17, 300, user='player', data=lambda fx: {'guesses': 3, 'solved': True}),
+    Budget('record_result', 'anonymous', 'POST', 15, 300, data=lambda fx: {'guesses': 6, 'solved': False}),
+    Budget('today_stats', 'today', 'GET', 3, 200),
+    # Under the test client (WSGI) the SSE view answers 503 without touching the database
+    Budget('live_feed', 'wsgi', 'GET', 0, 100, status=503),
+    Budget('register', 'new user', 'POST', 10, 100, data=lambda fx: {'username': 'newcomer', 'password': 'secret123'}),
+    Budget('login', 'player', 'POST', 9, 100, data=lambda fx: {'username': 'player', 'password': 'secret123'}),
+    Budget('logout', 'player', 'POST', 4, 100, user='player'),
+    Budget('current_user', 'player', 'GET', 2, 100, user='player'),
+    Budget('request_password_reset', 'known email', 'POST', 2, 100, data=lambda fx: {'email': fx.player.email}),
+    Budget('reset_password', 'valid token', 'POST', 2, 100, data=lambda fx: {
+        'uid': fx.player.pk, 'token': default_token_generator.make_token(fx.player), 'new_password': 'another123',
+    }),
+    Budget('change_email', 'player', 'POST', 4, 100, user='player', data=lambda fx: {'new_email': 'moved@example.com'}),
+    Budget('change_password', 'player', 'POST', 3, 100, user='player', data=lambda fx: {
+        'current_password': 'secret123', 'new_password': 'another123',
+    }),
+    Budget('create_word', 'three sounds', 'POST', 10, 300, user='admin', data=lambda fx: {
+        'secret': fx.spare_secret, 'phonetic': 'ghoti', 'sounds': 'f-i-sh',
+        'pattern_ids': [fx.patterns[0].pk, fx.patterns[1].pk], 'no_change_indexes': [2],
+    }),
+    Budget('random_word', 'random', 'GET', 1, 50),
+    Budget('word_archive', 'first page', 'GET', 2, 5000, params={'limit': 10}),
+    Budget('search_words', 'shape', 'GET', 3, 200, user='admin', params={'shape': 'f?sh'}),
+    Budget('create_pattern', 'new pattern', 'POST', 6, 200, user='admin', data=lambda fx: {
+        'letters': 'ph', 'sound': 'f', 'reference': 'phone',
+    }),
+    # Every pattern for each sound
+    Budget('suggest_patterns', 'three sounds', 'POST', 5, None, user='admin', data=lambda fx: {'sounds': 'f-i-sh'}),
+    Budget('suggest_patterns', 'alias', 'POST', 5, None, user='admin', data=lambda fx: {'sounds': 'ph-i-sh'}),
+    Budget('leaderboard', 'all time', 'GET', 5, 600, user='player'),
+    Budget('leaderboard', 'this week', 'GET', 5, 600, user='player', params={'period': 'week'}),
+    # The full calendar, one row per word
+    Budget('schedule', 'admin', 'GET', 3, None, user='admin'),
+    Budget('autoschedule', 'one week', 'POST', 11, 700, user='admin', data=lambda fx: {
+        'start': (fx.today + timedelta(days=30)).isoformat(),
+        'end': (fx.today + timedelta(days=36)).isoformat(),
+        'min_gap': 0, 'max_overlap': 5, 'seed': 1,
+    }),
+    Budget('reschedule_word', 'swap', 'PATCH', 9, 200, user='admin',
+           args=lambda fx: [fx.word.pk], data=lambda fx: {'date': (fx.today - timedelta(days=2)).isoformat()}),
+    Budget('download_profile', 'missing file', 'GET', 2, 100, user='admin', args=lambda fx: ['0' * 32 + '.prof']),
+]
+
+
+def seed(size):
+    """Seed `size` rows of each kind, with today's puzzle scheduled. Returns a Fixture."""
+    today = timezone.now().date()
+    generated = (''.join(letters) for letters in product(ascii_lowercase, repeat=5))
+    secrets = [next(generated) for _ in range(size)]
+    ValidWord.objects.bulk_create([ValidWord(word=w) for w in REAL_WORDS + secrets])
+
+    sounds = Sound.objects.bulk_create([Sound(name=name) for name in ('f', 'i', 'sh', 'o')])
+    SoundAlias.objects.create(alias='ph', sound=sounds[0])
+    # Keep-as-is components point here (created by the first create_word)
+    PhoneticPattern.objects.create(letters='*', sound=Sound.objects.create(name='*'), reference='identity')
+    patterns = PhoneticPattern.objects.bulk_create([
+        PhoneticPattern(letters=f'l{i}', sound=sounds[i % 4], reference=f'ref{i}')
+        for i in range(size)
+    ])
+    words = Word.objects.bulk_create(
+        [Word(secret='fish', phonetic='ghoti', date=today)]
+        + [Word(secret=w, phonetic=w, date=today - timedelta(days=i + 1)) for i, w in enumerate(secrets)]
+    )
+    PhoneticComponent.objects.bulk_create([
+        PhoneticComponent(word=word, pattern=patterns[(i + position) % size], position=position)
+        for i, word in enumerate(words)
+        for position in range(3)
+    ])
+
+    users = User.objects.bulk_create([
+        User(username=f'user{i}', email=f'user{i}@example.com', password='!') for i in range(size)
+    ])
+    UserStats.objects.bulk_create([
+        UserStats(user=u, correctGuesses=i % 50 + 1, wrongGuesses=i % 7, streak=i % 5) for i, u in enumerate(users)
+    ])
+    LeaderboardRollup.objects.bulk_create([
+        LeaderboardRollup(period=period, period_start=period_start(period, today), user=u, correctGuesses=i % 9 + 1)
+        for period in ('day', 'week', 'month')
+        for i, u in enumerate(users)
+    ])
+    PuzzleResult.objects.bulk_create([
+        PuzzleResult(puzzle_date=today, player_key=f'u:{u.pk}', user=u, guesses=i % 6 + 1, solved=True)
+        for i, u in enumerate(users)
+    ])
+    PuzzleStats.objects.create(date=today, solved_3=size, players=size)
+
+    # Ranked below everyone, so the leaderboard has to look up their position
+    player = User.objects.create_user('player', 'player@example.com', 'secret123')
+    UserStats.objects.create(user=player)
+    for period in ('day', 'week', 'month'):
+        LeaderboardRollup.objects.create(period=period, period_start=period_start(period, today), user=player)
+    admin = User.objects.create_superuser('admin', 'admin@example.com', 'secret123')
+
+    return Fixture(
+        size=size, today=today, player=player, admin=admin, word=words[1],
+        patterns=patterns, spare_secret='wish',
+    )
+
+
+def clear_caches():
+    invalidate_puzzles()
+    clear_lexicon()
+    clear_tables()
+    clear_artifact()
+    cache.clear()
+
+
+@override_settings(
+    PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'],
+    GUESS_EVENTS_ENABLED=False,  # Buffered and written off the request path
+)
+class QueryBudgetTests(TestCase):
+
+    def measure(self, budget, fx):
+        """Run one budgeted request. Returns (status, query count, response bytes, queries)."""
+        if budget.user:
+            self.client.force_login(getattr(fx, budget.user))
+        else:
+            self.client.logout()
+        url = reverse(budget.url_name, args=budget.args(fx))
+        data = budget.data(fx)
+        clear_caches()
+
+        with transaction.atomic():
+            with CaptureQueriesContext(connection) as queries:
+                if budget.method == 'GET':
+                    response = self.client.get(url, budget.params)
+                else:
+                    response = getattr(self.client, budget.method.lower())(
+                        url, data, content_type='application/json',
+                    )
+            transaction.set_rollback(True)
+        clear_caches()
+        return response.status_code, len(queries), len(response.content), queries.captured_queries
+
+    def test_every_url_has_a_budget(self):
+        names = {p.name for p in urls.urlpatterns if isinstance(p, URLPattern)}
+        self.assertEqual(names - {b.url_name for b in BUDGETS}, set(), 'URLs without a query budget')
+        self.assertEqual({b.url_name for b in BUDGETS} - names, set(), 'Budgets for URLs that no longer exist')
+
+    def test_budgets(self):
+        results = {}  # (url name, label) -> {size: (status, queries, bytes, sql)}
+        for size in FIXTURE_SIZES:
+            with transaction.atomic():
+                fx = seed(size)
+                for budget in BUDGETS:
+                    results.setdefault((budget.url_name, budget.label), {})[size] = self.measure(budget, fx)
+                transaction.set_rollback(True)
+
+        for budget in BUDGETS:
+            runs = results[(budget.url_name, budget.label)]
+            with self.subTest(endpoint=budget.url_name, case=budget.label):
+                for size, (status, count, size_bytes, sql) in runs.items():
+                    if budget.status:
+                        self.assertEqual(status, budget.status, f'Unexpected status at size {size}')
+                    else:
+                        self.assertLess(status, 500, f'{budget.url_name} failed at size {size}')
+                    self.assertLessEqual(
+                        count, budget.max_queries,
+                        f'{count} queries at size {size}, budget {budget.max_queries}:\n'
+                        + '\n'.join(q['sql'] for q in sql),
+                    )
+                    if budget.max_bytes is not None:
+                        self.assertLessEqual(size_bytes, budget.max_bytes, f'{size_bytes} bytes at size {size}')
+                counts = {size: run[1] for size, run in runs.items()}
+                self.assertEqual(len(set(counts.values())), 1, f'Query count grows with data: {counts}')
@@ -0,0 +1,202 @@
+"""
+Query-plan regression tests for hot lookups.
+
+Each test EXPLAINs the query a view (or command) runs and fails if the plan
+falls back to a full table scan on one of the large tables, or - for queries
+that read the top of an ordering - if the database has to sort the table
+instead of walking an index.
+
+Runs on SQLite (EXPLAIN QUERY PLAN) and PostgreSQL (EXPLAIN). On PostgreSQL
+the seeded tables are ANALYZEd and sequential scans are disabled for the test
+session, so a Seq Scan in the plan means no usable index exists.
+"""
+import json
+import re
+from datetime import date, datetime, timedelta, timezone
+
+from django.contrib.auth.models import User
+from django.contrib.sessions.models import Session
+from django.db import connection
+from django.db.models import Q
+from django.test import TestCase
+
+from game.models import ValidWord, Word, PhoneticPattern, PhoneticComponent, UserStats, LeaderboardRollup, Sound
+
+LARGE_TABLES = [
+    'validWord', 'word', 'phoneticPattern', 'phoneticComponent', 'userStats', 'auth_user', 'leaderboardRollup',
+    'django_session',
+]
+SEED_ROWS = 3000
+SESSIONS_START = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+
+def _postgres_nodes(plan):
+    yield plan
+    for child in plan.get('Plans', []):
+        yield from _postgres_nodes(child)
+
+
+def analyze_plan(queryset, ordered=False):
+    """
+    Return (plan text, large tables read in full, whether rows are sorted).
+    A full read is a sequential scan, or an index scan with no index condition
+    unless `ordered` (walking an index for ORDER BY ... LIMIT is what we want).
+    """
+    if connection.vendor == 'postgresql':
+        plan = json.loads(queryset.explain(format='json'))[0]['Plan']
+        scans, sort = [], False
+        for node in _postgres_nodes(plan):
+            table = node.get('Relation Name')
+            kind = node['Node Type']
+            sort = sort or kind in ('Sort', 'Incremental Sort')
+            if table not in LARGE_TABLES:
+                continue
+            if kind == 'Seq Scan' or (
+                kind in ('Index Scan', 'Index Only Scan') and 'Index Cond' not in node and not ordered
+            ):
+                scans.append(table)
+        return json.dumps(plan, indent=2), scans, sort
+
+    # SQLite: "SEARCH t USING INDEX ... (col=?)" is a lookup; "SCAN t" reads
+    # the whole table, "SCAN t USING INDEX ..." the whole index
+    plan = queryset.explain()
+    scans = [
+        table for table, using in re.findall(r'SCAN (?:TABLE )?(\w+)( USING)?', plan)
+        if table in LARGE_TABLES and (not using or not ordered)
+    ]
+    return plan, scans, 'USE TEMP B-TREE FOR ORDER BY' in plan
+
+
+class QueryPlanTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        start = date(2020, 1, 1)
+        ValidWord.objects.bulk_create([ValidWord(word=f'w{i:05d}') for i in range(SEED_ROWS)])
+        sounds = Sound.objects.bulk_create([Sound(name=f's{i}') for i in range(300)])
+        cls.sound = sounds[1]
+        patterns = PhoneticPattern.objects.bulk_create([
+            PhoneticPattern(letters=f'l{i % 500}', sound=sounds[i % 300], reference=f'r{i}')
+            for i in range(SEED_ROWS)
+        ])
+        words = Word.objects.bulk_create([
+            Word(secret=f'w{i:05d}', phonetic=f'p{i}', date=start + timedelta(days=i))
+            for i in range(SEED_ROWS)
+        ])
+        PhoneticComponent.objects.bulk_create([
+            PhoneticComponent(word=w, pattern=patterns[i], position=0)
+            for i, w in enumerate(words)
+        ])
+        users = User.objects.bulk_create([User(username=f'user{i}', password='!') for i in range(SEED_ROWS)])
+        UserStats.objects.bulk_create([
+            UserStats(user=u, correctGuesses=i % 97, wrongGuesses=i % 13, streak=i % 7)
+            for i, u in enumerate(users)
+        ])
+        LeaderboardRollup.objects.bulk_create([
+            LeaderboardRollup(
+                period='week', period_start=start + timedelta(weeks=week), user=u,
+                correctGuesses=(i + week) % 7, wrongGuesses=i % 3,
+            )
+            for week in range(4)
+            for i, u in enumerate(users)
+        ])
+        Session.objects.bulk_create([
+            Session(session_key=f's{i:08d}', session_data='', expire_date=SESSIONS_START + timedelta(hours=i))
+            for i in range(SEED_ROWS)
+        ])
+        cls.today = start + timedelta(days=SEED_ROWS // 2)
+
+    def setUp(self):
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                for table in LARGE_TABLES:
+                    cursor.execute(f'ANALYZE "{table}"')
+                cursor.execute('SET enable_seqscan = off')
+        else:
+            with connection.cursor() as cursor:
+                cursor.execute('ANALYZE')
+
+    def tearDown(self):
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute('RESET enable_seqscan')
+
+    def assertIndexed(self, queryset, ordered=False):
+        plan, scans, sort = analyze_plan(queryset, ordered)
+        self.assertEqual(scans, [], f'Full table scan in plan:\n{plan}')
+        if ordered:
+            self.assertFalse(sort, f'Sort instead of index order in plan:\n{plan}')
+
+    def test_valid_word_lookup(self):
+        # create_word: ValidWord.objects.filter(word=secret).exists()
+        self.assertIndexed(ValidWord.objects.filter(word='w00042'))
+
+    def test_valid_word_prefix_search(self):
+        # ValidWordAdmin search
+        if connection.vendor != 'postgresql':
+            self.skipTest('SQLite only uses an index for LIKE with case_sensitive_like')
+        self.assertIndexed(ValidWord.objects.filter(word__startswith='w001'))
+
+    def test_word_by_secret(self):
+        # create_word duplicate check, load_sample_data get_or_create
+        self.assertIndexed(Word.objects.filter(secret='w00042').order_by())
+
+    def test_pattern_exact_triple(self):
+        # create_phonetic_pattern / load_additional_patterns duplicate check
+        self.assertIndexed(PhoneticPattern.objects.filter(letters='l1', sound=self.sound, reference='r1'))
+
+    def test_patterns_by_sound(self):
+        # suggest_phonetic_patterns by sound id
+        self.assertIndexed(PhoneticPattern.objects.filter(sound=self.sound))
+
+    def test_todays_word(self):
+        self.assertIndexed(Word.objects.filter(date=self.today))
+
+    def test_latest_past_word(self):
+        # get_word / validate_guess fallback to the most recent past puzzle
+        self.assertIndexed(Word.objects.filter(date__lte=self.today).order_by('-date')[:1], ordered=True)
+
+    def test_word_components(self):
+        word = Word.objects.get(date=self.today)
+        self.assertIndexed(word.phoneticcomponent_set.select_related('pattern').order_by('position'))
+
+    def test_leaderboard_top(self):
+        self.assertIndexed(
+            UserStats.objects.select_related('user').order_by('-correctGuesses', 'wrongGuesses', 'user_id')[:5],
+            ordered=True,
+        )
+
+    def test_leaderboard_rank(self):
+        stat = UserStats.objects.order_by('user_id')[SEED_ROWS // 2]
+        self.assertIndexed(UserStats.objects.filter(
+            Q(correctGuesses__gt=stat.correctGuesses) |
+            Q(correctGuesses=stat.correctGuesses, wrongGuesses__lt=stat.wrongGuesses) |
+            Q(correctGuesses=stat.correctGuesses, wrongGuesses=stat.wrongGuesses, user_id__lt=stat.user_id)
+        ))
+
+    def test_windowed_leaderboard_top(self):
+        self.assertIndexed(
+            LeaderboardRollup.objects.select_related('user__userstats')
+            .filter(period='week', period_start=date(2020, 1, 8))
+            .order_by('-correctGuesses', 'wrongGuesses', 'user_id')[:5],
+            ordered=True,
+        )
+
+    def test_windowed_leaderboard_rank(self):
+        rows = LeaderboardRollup.objects.filter(period='week', period_start=date(2020, 1, 8))
+        stat = rows.order_by('user_id')[SEED_ROWS // 2]
+        self.assertIndexed(rows.filter(
+            Q(correctGuesses__gt=stat.correctGuesses) |
+            Q(correctGuesses=stat.correctGuesses, wrongGuesses__lt=stat.wrongGuesses) |
+            Q(correctGuesses=stat.correctGuesses, wrongGuesses=stat.wrongGuesses, user_id__lt=stat.user_id)
+        ))
+
+    def test_expired_sessions_batch(self):
+        # purge_sessions: oldest expired sessions first, each batch resuming at the last one's expire_date
+        cutoff = SESSIONS_START + timedelta(hours=SEED_ROWS // 2)
+        last = SESSIONS_START + timedelta(hours=SEED_ROWS // 4)
+        self.assertIndexed(
+            Session.objects.filter(expire_date__lt=cutoff, expire_date__gte=last).order_by('expire_date')
+            .values_list('session_key', 'expire_date')[:1000],
+            ordered=True,
+        )
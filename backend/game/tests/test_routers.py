@@ -0,0 +1,40 @@
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase
+
+from game.models import UserStats, Word
+from game.routers import ReplicaRouter, replica_reads
+
+
+@mock.patch('game.routers.replica_aliases', return_value=['replica1'])
+class ReplicaRouterTests(SimpleTestCase):
+
+    def setUp(self):
+        self.router = ReplicaRouter()
+
+    def test_undecorated_reads_use_primary(self, _):
+        self.assertEqual(self.router.db_for_read(Word), 'default')
+
+    def test_decorated_reads_use_replica(self, _):
+        view = replica_reads(lambda: self.router.db_for_read(Word))
+        self.assertEqual(view(), 'replica1')
+
+    def test_auth_reads_stay_on_primary(self, _):
+        view = replica_reads(lambda: self.router.db_for_read(User))
+        self.assertEqual(view(), 'default')
+
+    def test_reads_after_a_write_use_primary(self, _):
+        def view():
+            before = self.router.db_for_read(UserStats)
+            write = self.router.db_for_write(UserStats)
+            return before, write, self.router.db_for_read(UserStats)
+
+        self.assertEqual(replica_reads(view)(), ('replica1', 'default', 'default'))
+        # The pin ends with the request
+        self.assertEqual(replica_reads(lambda: self.router.db_for_read(Word))(), 'replica1')
+
+    def test_no_replicas_configured(self, aliases):
+        aliases.return_value = []
+        view = replica_reads(lambda: self.router.db_for_read(Word))
+        self.assertEqual(view(), 'default')
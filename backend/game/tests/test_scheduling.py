@@ -0,0 +1,121 @@
+from datetime import date, timedelta
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.urls import reverse
+
+from game.models import PhoneticComponent, PhoneticPattern, PuzzleScore, Sound, ValidWord, Word
+from game.scheduling import DIFFICULTY_ORDER, autoschedule
+
+D = date(2026, 3, 10)
+SEEDS = range(5)
+
+
+class AutoscheduleViewTests(TestCase):
+    def setUp(self):
+        pattern = PhoneticPattern.objects.create(letters='gh', sound=Sound.objects.create(name='f'), reference='tough')
+        word = Word.objects.create(secret='fish', phonetic='ghish', date=date(2026, 1, 1))
+        PhoneticComponent.objects.create(word=word, pattern=pattern, position=0)
+        self.client.force_login(User.objects.create_superuser('admin', 'admin@example.com', 'secret123'))
+
+    def post(self, **data):
+        data = {'start': '2026-03-01', 'end': '2026-03-01', 'min_gap': 0, **data}
+        return self.client.post(reverse('autoschedule'), data, content_type='application/json')
+
+    def test_dry_run_must_be_a_boolean(self):
+        for value in ('false', '0', 1):
+            with self.subTest(dry_run=value):
+                self.assertEqual(self.post(dry_run=value).status_code, 400)
+        self.assertEqual(Word.objects.count(), 1)
+
+    def test_dry_run_saves_nothing(self):
+        response = self.post(dry_run=True)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()['assigned']), 1)
+        self.assertEqual(Word.objects.count(), 1)
+
+        self.assertEqual(self.post(dry_run=False).status_code, 201)
+        self.assertEqual(Word.objects.count(), 2)
+
+
+class AutoscheduleTests(TestCase):
+    def setUp(self):
+        self.patterns = [
+            PhoneticPattern.objects.create(letters=letters, sound=Sound.objects.create(name=sound), reference='ref')
+            for letters, sound in (('gh', 'f'), ('o', 'i'), ('ti', 'sh'))
+        ]
+        self.source_day = date(2025, 1, 1)
+
+    def add_word(self, secret, day=None, positions=(0, 1, 2)):
+        """A library word (dated in 2025 unless `day` is given) with components at `positions`"""
+        if day is None:
+            day, self.source_day = self.source_day, self.source_day + timedelta(days=1)
+        word = Word.objects.create(secret=secret, phonetic=f'{secret}-ph', date=day, dictionary='en')
+        for position in positions:
+            PhoneticComponent.objects.create(
+                word=word, pattern=self.patterns[position % 3], position=position, no_change=position == 1,
+            )
+        return word
+
+    def schedule(self, start, end, **kwargs):
+        kwargs = {'min_gap': 0, 'max_overlap': 10, 'dry_run': True, **kwargs}
+        return [autoschedule(start, end, seed=seed, **kwargs) for seed in SEEDS]
+
+    def test_min_gap_on_both_sides(self):
+        self.add_word('fish', day=D)
+        # D-2 is only blocked by the later use on D, D+1 and D+2 by the earlier one
+        for result in self.schedule(D - timedelta(days=2), D + timedelta(days=3), min_gap=3):
+            self.assertEqual([day for day, _, _ in result.assigned], [D + timedelta(days=3)])
+            self.assertEqual(len(result.unfilled), 4)
+
+    def test_min_gap_between_new_assignments(self):
+        self.add_word('fish')
+        for result in self.schedule(D, D + timedelta(days=4), min_gap=2):
+            self.assertEqual([day for day, _, _ in result.assigned], [D, D + timedelta(days=2), D + timedelta(days=4)])
+
+    def test_max_overlap_with_existing_and_new_neighbours(self):
+        self.add_word('fish', day=D)
+        for secret in ('dish', 'zorb', 'zarb'):
+            self.add_word(secret)
+
+        for result in self.schedule(D + timedelta(days=1), D + timedelta(days=2), min_gap=3, max_overlap=2):
+            secrets = [secret for _, secret, _ in result.assigned]
+            # 'dish' shares 3 letters with 'fish' the day before; 'zorb' and 'zarb' share 3 with each other
+            self.assertIn(secrets[0], {'zorb', 'zarb'})
+            self.assertEqual(secrets[1], 'dish')
+
+    def test_skips_words_with_incomplete_components(self):
+        self.add_word('fish')
+        self.add_word('gaps', positions=(0, 2))
+        self.add_word('none', positions=())
+        for result in self.schedule(D, D + timedelta(days=5)):
+            self.assertEqual({secret for _, secret, _ in result.assigned}, {'fish'})
+
+    def test_rotates_through_difficulties(self):
+        for depth, secret in enumerate(('easy', 'okay', 'hard'), start=1):
+            self.add_word(secret)
+            PuzzleScore.objects.create(
+                word=ValidWord.objects.create(word=secret), expected_remaining=depth, solve_depth=depth,
+                worst_case_depth=depth, rarity=1.0, opener='fish',
+            )
+        self.add_word('zzzz')  # Unscored: only used when no scored word fits
+
+        for result in self.schedule(D, D + timedelta(days=5)):
+            for day, secret, difficulty in result.assigned:
+                self.assertEqual(difficulty, DIFFICULTY_ORDER[day.toordinal() % 3])
+                self.assertEqual(secret, {'easy': 'easy', 'medium': 'okay', 'hard': 'hard'}[difficulty])
+            self.assertEqual(len(result.assigned), 6)
+
+    def test_copies_the_source_components(self):
+        source = self.add_word('fish')
+        self.add_word('gaps', positions=(0, 2))
+
+        result = autoschedule(D, D + timedelta(days=2), min_gap=0, max_overlap=10, seed=0)
+        self.assertEqual(len(result.assigned), 3)
+
+        def components(word):
+            return list(word.phoneticcomponent_set.order_by('position').values_list('position', 'pattern_id', 'no_change'))
+
+        for word in Word.objects.filter(date__gte=D):
+            self.assertEqual((word.secret, word.phonetic, word.dictionary), ('fish', 'fish-ph', 'en'))
+            self.assertEqual(components(word), components(source))
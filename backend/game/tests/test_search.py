@@ -0,0 +1,75 @@
+import re
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.urls import reverse
+
+from game.lexicon import clear_lexicon
+from game.models import ValidWord
+from game.search import search_words
+from game.solver import clear_tables
+
+LEXICON = [
+    'a', 'an', 'fish', 'fash', 'dish', 'wish', 'phish', 'phone', 'phones', 'photo', 'graph', 'ghoti', 'tough',
+    'rough', 'dough', 'through', 'thorough', 'bough', 'cough', 'enough', 'women', 'nation', 'station', 'ration',
+    'ooze', 'oology', 'bookkeeper', 'kook', 'papaya', 'banana', 'ananas', 'shish', 'hashish',
+    'nanoana',  # Has both trigrams of 'anan' but not 'anan' itself
+]
+SHAPES = [
+    'f?sh', '????', '?', 'ph*', '*ough', '*ough*', '*o*o*', 't*h', '*', '**', '?*?', 'a*', '*a', 'p?p*a',
+    '*ana*', 'ana*s', '*sh*sh', 'sh?sh', '*oo*', '?h*', '*?h', 'zz*', '*ation', 'ration', '????????????',
+]
+CONTAINS = [
+    [], ['h'], ['sh'], ['ough'], ['ana'], ['anan'], ['oo', 'k'], ['ish', 'sh'], ['kee'], ['okk'], ['xyz'], ['ation'],
+]
+
+
+def brute_force(shape=None, length=None, contains=(), excludes=''):
+    regex = re.compile(re.escape(shape).replace(r'\?', '.').replace(r'\*', '.*') + '$') if shape else None
+    return sorted(
+        (
+            w for w in LEXICON
+            if (regex is None or regex.match(w))
+            and (not length or len(w) == length)
+            and all(c in w for c in contains)
+            and not set(excludes) & set(w)
+        ),
+        key=lambda w: (len(w), w),
+    )
+
+
+class SearchTests(TestCase):
+    def setUp(self):
+        ValidWord.objects.bulk_create([ValidWord(word=w) for w in LEXICON])
+        clear_lexicon()
+        clear_tables()
+        self.addCleanup(clear_lexicon)
+        self.addCleanup(clear_tables)
+
+    def test_shapes_match_brute_force(self):
+        for shape in SHAPES:
+            with self.subTest(shape=shape):
+                self.assertEqual(search_words(shape=shape), brute_force(shape=shape))
+
+    def test_substrings_match_brute_force(self):
+        for contains in CONTAINS:
+            for shape in (None, '*ough', '?????', 'b*'):
+                with self.subTest(contains=contains, shape=shape):
+                    self.assertEqual(
+                        search_words(shape=shape, contains=contains), brute_force(shape=shape, contains=contains),
+                    )
+
+    def test_length_and_excludes(self):
+        self.assertEqual(search_words(length=5, excludes='o'), brute_force(length=5, excludes='o'))
+        self.assertEqual(search_words(shape='*sh', excludes='af'), brute_force(shape='*sh', excludes='af'))
+        self.assertEqual(search_words(shape='f?sh', length=5), [])
+
+    def test_view_pages_and_validates(self):
+        self.client.force_login(User.objects.create_superuser('admin', 'admin@example.com', 'secret123'))
+        url = reverse('search_words')
+
+        response = self.client.get(url, {'shape': '*ough', 'page_size': 3, 'page': 2}).json()
+        self.assertEqual(response['count'], len(brute_force(shape='*ough')))
+        self.assertEqual(response['results'], brute_force(shape='*ough')[3:6])
+        self.assertEqual(self.client.get(url, {'shape': 'f.sh'}).status_code, 400)
+        self.assertEqual(self.client.get(url).status_code, 400)
@@ -0,0 +1,78 @@
+from itertools import product
+
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from game.lexicon import clear_lexicon
+from game.models import ValidWord, Word
+from game.puzzles import invalidate as invalidate_puzzles, letter_feedback
+from game.solver import candidates, clear_tables, nearest_words
+
+# Repeated letters on both sides exercise the present/absent counting
+LEXICON = [
+    'fish', 'dish', 'wish', 'fash', 'shif', 'hifs', 'fiss', 'siss', 'eels', 'else', 'lees', 'seel',
+    'sees', 'ease', 'peep', 'pope', 'epee', 'tough', 'dough', 'ghoti',
+]
+
+
+class SolverTestCase(TestCase):
+    def setUp(self):
+        ValidWord.objects.bulk_create([ValidWord(word=w) for w in LEXICON])
+        clear_lexicon()
+        clear_tables()
+        invalidate_puzzles()
+        self.addCleanup(clear_lexicon)
+        self.addCleanup(clear_tables)
+        self.addCleanup(invalidate_puzzles)
+
+
+class CandidatesTests(SolverTestCase):
+    def test_matches_letter_feedback_for_every_pair(self):
+        four = [w for w in LEXICON if len(w) == 4]
+        for guess, target in product(four, repeat=2):
+            with self.subTest(guess=guess, target=target):
+                expected = sorted(w for w in four if letter_feedback(guess, w) == letter_feedback(guess, target))
+                got = candidates(4, [(guess, letter_feedback(guess, target))]).tolist()
+                self.assertEqual(got, expected)
+
+    def test_constraints_combine(self):
+        constraints = [(g, letter_feedback(g, 'fish')) for g in ('dish', 'fash')]
+        self.assertEqual(candidates(4, constraints).tolist(), ['fish'])
+
+    def test_unknown_length_is_empty(self):
+        self.assertEqual(len(candidates(9, [])), 0)
+
+    def test_nearest_words(self):
+        self.assertEqual(nearest_words('fosh', limit=2), ['fash', 'fish'])
+        self.assertEqual(nearest_words('fihs', limit=1), ['fish'])  # Adjacent swap is one edit
+        self.assertEqual(nearest_words('qqqq'), [])
+
+
+class HintViewTests(SolverTestCase):
+    def setUp(self):
+        super().setUp()
+        Word.objects.create(secret='fish', phonetic='ghoti', date=timezone.now().date())
+
+    def hint(self, **data):
+        return self.client.post(reverse('hint'), data, content_type='application/json')
+
+    def test_counts_remaining_candidates(self):
+        response = self.hint(guesses=['dish'])
+        self.assertEqual(response.status_code, 200)
+        expected = sum(letter_feedback('dish', w) == letter_feedback('dish', 'fish') for w in LEXICON if len(w) == 4)
+        self.assertEqual(response.json(), {'length': 4, 'remaining': expected})
+
+    def test_rejects_invalid_guesses(self):
+        response = self.hint(guesses=['dish', 'zzzz'])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['guesses'], ['zzzz'])
+
+    def test_sample_never_gives_the_answer_away(self):
+        # 'dish' then 'fash' leaves only the answer
+        response = self.hint(guesses=['dish', 'fash'], sample=5).json()
+        self.assertEqual(response['remaining'], 1)
+        self.assertEqual(response['sample'], [])
+
+        response = self.hint(guesses=['dish'], sample=20).json()
+        self.assertLessEqual(len(response['sample']), response['remaining'] // 2)
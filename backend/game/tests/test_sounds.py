@@ -0,0 +1,120 @@
+from contextlib import redirect_stdout
+from io import StringIO
+
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TestCase, TransactionTestCase
+
+from game.models import PhoneticPattern, Sound, SoundAlias
+from game.puzzles import invalidate as invalidate_puzzles, pattern_index, sound_ids
+from game.sounds import add_alias, canonical_names, sound_for, sound_ids_for
+
+
+class SoundInventoryTests(TestCase):
+    def setUp(self):
+        invalidate_puzzles()
+        self.addCleanup(invalidate_puzzles)
+
+    def test_alias_merges_a_duplicate_sound(self):
+        uh = Sound.objects.create(name='uh')
+        u = Sound.objects.create(name='u')
+        SoundAlias.objects.create(alias='uu', sound=u)
+        ough = PhoneticPattern.objects.create(letters='ou', sound=uh, reference='touch')
+        oo = PhoneticPattern.objects.create(letters='oo', sound=u, reference='blood')
+
+        add_alias(' U ', uh)
+
+        self.assertFalse(Sound.objects.filter(name='u').exists())
+        self.assertEqual(
+            set(PhoneticPattern.objects.filter(pk__in=[ough.pk, oo.pk]).values_list('sound_id', flat=True)), {uh.pk},
+        )
+        self.assertEqual(dict(uh.aliases.values_list('alias', 'sound_id')), {'u': uh.pk, 'uu': uh.pk})
+        # Read-side caches were dropped and see the merge
+        self.assertEqual(sound_ids()['u'], uh.pk)
+        self.assertEqual({p['letters'] for p in pattern_index()[uh.pk]}, {'ou', 'oo'})
+
+    def test_alias_of_itself_is_a_no_op(self):
+        uh = Sound.objects.create(name='uh')
+        add_alias('UH', uh)
+        self.assertFalse(uh.aliases.exists())
+
+    def test_known_aliases_are_installed(self):
+        # 0017_known_sound_aliases: 'a' and 'ay' are one sound
+        ids = sound_ids_for(['a', 'ay'])
+        self.assertEqual(ids['a'], ids['ay'])
+        self.assertEqual(sound_for('a').name, 'ay')
+
+    def test_additional_patterns_loader_merges_a_and_ay(self):
+        from data.load_additional_patterns import load_additional_patterns
+
+        with redirect_stdout(StringIO()):
+            load_additional_patterns()
+            load_additional_patterns()  # Second run skips everything
+
+        sounds = dict(PhoneticPattern.objects.filter(letters__in=['eigh', 'aigh']).values_list('letters', 'sound_id'))
+        self.assertEqual(sounds['eigh'], sounds['aigh'])
+        self.assertEqual(PhoneticPattern.objects.filter(reference='neighbor').count(), 1)
+
+    def test_typed_names_resolve_through_aliases(self):
+        f = Sound.objects.create(name='f')
+        SoundAlias.objects.create(alias='ph', sound=f)
+
+        self.assertEqual(sound_for(' PH'), f)
+        self.assertEqual(sound_for('zh').name, 'zh')
+        self.assertEqual(canonical_names(['Ph', 'sh']), {'Ph': 'f', 'sh': 'sh'})
+
+        ids = sound_ids_for(['ph', 'F', 'oo'])
+        self.assertEqual(ids['ph'], f.pk)
+        self.assertEqual(ids['f'], f.pk)
+        self.assertEqual(ids['oo'], Sound.objects.get(name='oo').pk)
+        self.assertFalse(Sound.objects.filter(name='ph').exists())
+
+
+class NormalizeSoundsMigrationTests(TransactionTestCase):
+    before = [('game', '0015_wordcoverage')]
+    after = [('game', '0016_sound_inventory')]
+
+    def migrate(self, targets):
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(targets)
+        return executor.loader.project_state(targets).apps
+
+    def tearDown(self):
+        self.migrate(MigrationExecutor(connection).loader.graph.leaf_nodes())
+
+    def test_forwards_and_backwards(self):
+        apps = self.migrate(self.before)
+        OldPattern = apps.get_model('game', 'PhoneticPattern')
+        for letters, sound in (('ph', 'f'), ('gh', ' F '), ('ti', 'Sh'), ('o', 'i')):
+            OldPattern.objects.create(letters=letters, sound=sound, reference='ref')
+
+        apps = self.migrate(self.after)
+        Pattern = apps.get_model('game', 'PhoneticPattern')
+        self.assertEqual(sorted(apps.get_model('game', 'Sound').objects.values_list('name', flat=True)), ['f', 'i', 'sh'])
+        self.assertEqual(
+            dict(Pattern.objects.values_list('letters', 'sound__name')), {'ph': 'f', 'gh': 'f', 'ti': 'sh', 'o': 'i'},
+        )
+
+        apps = self.migrate(self.before)
+        OldPattern = apps.get_model('game', 'PhoneticPattern')
+        self.assertEqual(
+            dict(OldPattern.objects.values_list('letters', 'sound')), {'ph': 'f', 'gh': 'f', 'ti': 'sh', 'o': 'i'},
+        )
+
+    def test_known_aliases_merge_existing_sounds(self):
+        apps = self.migrate(self.before)
+        OldPattern = apps.get_model('game', 'PhoneticPattern')
+        for letters, sound in (('eigh', 'a'), ('aigh', 'ay'), ('ai', 'AY ')):
+            OldPattern.objects.create(letters=letters, sound=sound, reference='ref')
+
+        apps = self.migrate([('game', '0017_known_sound_aliases')])
+        Sound = apps.get_model('game', 'Sound')
+        self.assertFalse(Sound.objects.filter(name='a').exists())
+        self.assertEqual(
+            set(apps.get_model('game', 'PhoneticPattern').objects.values_list('sound_id', flat=True)),
+            {Sound.objects.get(name='ay').pk},
+        )
+        self.assertEqual(
+            list(apps.get_model('game', 'SoundAlias').objects.values_list('alias', 'sound__name')), [('a', 'ay')],
+        )
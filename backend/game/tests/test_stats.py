@@ -0,0 +1,89 @@
+from datetime import date, timedelta
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from game.models import LeaderboardRollup, PuzzleResult, UserStats
+from game.stats import rebuild_rollups, record_result
+
+
+class RecordResultTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('player', 'player@example.com', 'secret123')
+
+    def record(self, day, solved):
+        return record_result(day, f'u:{self.user.pk}', 3, solved, user=self.user)
+
+    def streak(self):
+        return UserStats.objects.get(user=self.user).streak
+
+    def test_streak_counts_consecutive_wins(self):
+        start = date(2026, 9, 28)
+        for offset in range(3):
+            self.record(start + timedelta(days=offset), True)
+        self.assertEqual(self.streak(), 3)
+
+    def test_streak_restarts_after_a_missed_day(self):
+        self.record(date(2026, 9, 28), True)
+        self.record(date(2026, 9, 29), True)
+        self.record(date(2026, 10, 1), True)
+        self.assertEqual(self.streak(), 1)
+
+    def test_streak_restarts_after_a_loss(self):
+        self.record(date(2026, 9, 28), True)
+        self.record(date(2026, 9, 29), False)
+        self.assertEqual(self.streak(), 0)
+        self.record(date(2026, 9, 30), True)
+        self.assertEqual(self.streak(), 1)
+
+    def test_one_result_per_puzzle(self):
+        self.assertTrue(self.record(date(2026, 9, 28), True))
+        self.assertFalse(self.record(date(2026, 9, 28), True))
+        self.assertEqual(UserStats.objects.get(user=self.user).correctGuesses, 1)
+
+
+class RebuildRollupsTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('player', 'player@example.com', 'secret123')
+
+    def rollups(self):
+        return {
+            (r.period, r.period_start): (r.correctGuesses, r.wrongGuesses)
+            for r in LeaderboardRollup.objects.filter(user=self.user)
+        }
+
+    def test_week_crossing_a_month_boundary(self):
+        # Week of Monday 2026-09-28 spans September and October
+        record_result(date(2026, 9, 29), 'u:player', 3, True, user=self.user)
+        record_result(date(2026, 10, 1), 'u:player', 4, False, user=self.user)
+        before = self.rollups()
+
+        rebuild_rollups(date(2026, 10, 15))
+        self.assertEqual(self.rollups(), before)
+
+        LeaderboardRollup.objects.all().delete()
+        rebuild_rollups(date(2026, 10, 1))
+        # The September month and the days before the cutoff aren't rebuilt
+        self.assertEqual(self.rollups(), {
+            ('day', date(2026, 10, 1)): (0, 1),
+            ('week', date(2026, 9, 28)): (1, 1),
+            ('month', date(2026, 10, 1)): (0, 1),
+        })
+
+
+class RecordResultViewTests(TestCase):
+    def post(self, **data):
+        return self.client.post(reverse('record_result'), data, content_type='application/json')
+
+    def test_solved_must_be_a_boolean(self):
+        for value in ('false', '0', 'true', 1, None):
+            with self.subTest(solved=value):
+                self.assertEqual(self.post(guesses=3, solved=value).status_code, 400)
+        self.assertFalse(PuzzleResult.objects.exists())
+
+    def test_records_a_loss(self):
+        self.assertEqual(self.post(guesses=6, solved=False).status_code, 201)
+        result = PuzzleResult.objects.get()
+        self.assertEqual((result.puzzle_date, result.solved), (timezone.now().date(), False))
@@ -4,6 +4,13 @@ from . import views
 urlpatterns = [
     path('word/', views.get_word, name='get_word'),
     path('validate/', views.validate_guess, name='validate_guess'),
+    path('hint/', views.get_hint, name='hint'),
+    path('lexicon/', views.get_lexicon_manifest, name='lexicon_manifest'),
+    path('lexicon/<str:dictionary>/<str:version>/', views.get_lexicon_artifact, name='lexicon_artifact'),
+    path('lexicons/', views.get_lexicon_stats, name='lexicon_stats'),
+    path('results/', views.record_game_result, name='record_result'),
+    path('stats/today/', views.get_today_stats, name='today_stats'),
+    path('live/', views.live_feed, name='live_feed'),
     path('auth/register/', views.register_user, name='register'),
     path('auth/login/', views.login_user, name='login'),
     path('auth/logout/', views.logout_user, name='logout'),
@@ -14,9 +21,13 @@ urlpatterns = [
     path('auth/change-password/', views.change_password, name='change_password'),
     path('words/', views.create_word, name='create_word'),
     path('words/random/', views.get_random_word, name='random_word'),
+    path('words/archive/', views.get_archive, name='word_archive'),
+    path('words/search/', views.search_words, name='search_words'),
     path('phonetic-patterns/', views.create_phonetic_pattern, name='create_pattern'),
     path('phonetic-patterns/suggest/', views.suggest_phonetic_patterns, name='suggest_patterns'),
     path('leaderboard/', views.get_leaderboard, name='leaderboard'),
     path('words/schedule/', views.get_schedule, name='schedule'),
+    path('words/autoschedule/', views.autoschedule_words, name='autoschedule'),
     path('words/<int:word_id>/reschedule/', views.reschedule_word, name='reschedule_word'),
+    path('profiles/<str:filename>/', views.download_profile, name='download_profile'),
 ]
@@ -1,77 +1,28 @@
-from rest_framework.decorators import api_view
+from rest_framework.decorators import api_view, authentication_classes, permission_classes
 from rest_framework.response import Response
 from rest_framework import status
 from django.contrib.auth import authenticate, login, logout
 from django.contrib.auth.models import User
 from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_GET
 from django.utils import timezone
-from .models import ValidWord, Word, PhoneticPattern
+from .models import ValidWord, Word, PhoneticPattern, GuessEvent
+from .events import log_guess
+from .lexicon import DEFAULT_DICTIONARY, UnknownDictionary, is_valid_word, known_dictionary, registry as lexicon_registry
+from .routers import replica_reads
+from .solver import nearest_words
+from .puzzles import current_puzzle, letter_feedback, pattern_index, sound_ids, invalidate as invalidate_puzzles
 
 
 @api_view(['GET'])
+@replica_reads
 def get_word(request):
     """
     GET endpoint: returns today's puzzle word with phonetic components and pattern details.
     Falls back to 'fish'/'ghoti' if no word is scheduled for today.
     """
-    today = timezone.now().date()
-
-    # Try to get today's word, then the most recent past word, then fallback
-    word_obj = (
-        Word.objects.filter(date=today).first() or
-        Word.objects.filter(date__lte=today).order_by('-date').first()
-    )
-
-    if word_obj:
-        components = word_obj.phoneticcomponent_set.select_related('pattern').order_by('position')
-
-        # Build phonetic breakdown from components.
-        # For no_change components (sound keeps original spelling), the pattern
-        # points to a generic placeholder ("*") — derive the actual letters from
-        # the stored phonetic string instead.
-        phonetic_parts = list(word_obj.phonetic.split(',')) if ',' in word_obj.phonetic else []
-        phonetic_patterns = []
-        phonetic_letters = []
-
-        for i, c in enumerate(components):
-            if c.no_change and i < len(phonetic_parts):
-                # Use letters from the pre-stored phonetic field
-                letters = phonetic_parts[i]
-                sound = letters  # same sound — that's what no_change means
-                reference = ''   # self-referential, no example needed
-            else:
-                letters = c.pattern.letters
-                sound = c.pattern.sound
-                reference = c.pattern.reference
-
-            phonetic_letters.append(letters)
-            phonetic_patterns.append({
-                'letters': letters,
-                'sound': sound,
-                'reference': reference,
-                'no_change': c.no_change,
-            })
-
-        phonetic_spelling = ','.join(phonetic_letters)
-
-        return Response({
-            'word': word_obj.secret,
-            'phonetic_spelling': phonetic_spelling or word_obj.phonetic,
-            'length': len(word_obj.secret),
-            'phonetic_patterns': phonetic_patterns,
-        })
-
-    # Hardcoded fallback if no words in database
-    return Response({
-        'word': 'fish',
-        'phonetic_spelling': 'gh,o,ti',
-        'length': 4,
-        'phonetic_patterns': [
-            {'letters': 'gh', 'sound': 'f', 'reference': 'enough'},
-            {'letters': 'o', 'sound': 'i', 'reference': 'women'},
-            {'letters': 'ti', 'sound': 'sh', 'reference': 'nation'},
-        ],
-    })
+    _, payload = current_puzzle()
+    return Response(payload)
 
 
 @api_view(['POST'])
@@ -80,51 +31,32 @@ def validate_guess(request):
     Validation: compare guess against today's word from the database.
     Falls back to 'fish' if no word is scheduled.
     """
-    today = timezone.now().date()
-    word_obj = (
-        Word.objects.filter(date=today).first() or
-        Word.objects.filter(date__lte=today).order_by('-date').first()
-    )
+    word_obj, _ = current_puzzle()
     TARGET_WORD = word_obj.secret if word_obj else 'fish'
+    dictionary = known_dictionary(word_obj.dictionary) if word_obj else DEFAULT_DICTIONARY
 
     guess = request.data.get('guess', '').lower()
+    puzzle_date = word_obj.date if word_obj else timezone.now().date()
+    if request.user.is_authenticated:
+        player_key = f'u:{request.user.pk}'
+    else:
+        player_key = f's:{request.session.session_key}' if request.session.session_key else 'anon'
 
     # Check if word is valid first
-    if not ValidWord.objects.filter(word=guess).exists():
+    if not is_valid_word(guess, dictionary):
+        log_guess(puzzle_date, player_key, guess, GuessEvent.INVALID)
         return Response({
             'error': 'Not a valid word',
-            'guess': guess
+            'guess': guess,
+            'suggestions': nearest_words(guess, dictionary_id=dictionary),
         }, status=400)
     
     # Calculate letter feedback
-    feedback = []
-    target_letters = list(TARGET_WORD)
-    guess_letters = list(guess)
-    
-    # First pass: mark correct positions (green)
-    remaining_target = target_letters.copy()
-    for i, char in enumerate(guess_letters):
-        if i < len(target_letters) and char == target_letters[i]:
-            feedback.append({
-                'letter': char,
-                'status': 'correct',
-                'position': i
-            })
-            remaining_target[i] = None  # Mark as used
-        else:
-            feedback.append({
-                'letter': char,
-                'status': 'absent',
-                'position': i
-            })
-    
-    # Second pass: mark present letters (yellow)
-    for i, item in enumerate(feedback):
-        if item['status'] == 'absent':
-            char = item['letter']
-            if char in remaining_target:
-                feedback[i]['status'] = 'present'
-                remaining_target[remaining_target.index(char)] = None  # Mark as used
+    feedback = [
+        {'letter': char, 'status': status, 'position': i}
+        for i, (char, status) in enumerate(zip(guess, letter_feedback(guess, TARGET_WORD)))
+    ]
+    log_guess(puzzle_date, player_key, guess, GuessEvent.CORRECT if guess == TARGET_WORD else GuessEvent.WRONG)
     
     return Response({
         'guess': guess,
@@ -134,6 +66,154 @@ def validate_guess(request):
     })
 
 
+@api_view(['POST'])
+def get_hint(request):
+    """
+    Hint: how many dictionary words are still possible after the given guesses.
+    Each guess is scored against today's word exactly as validate_guess would.
+    Pass `sample` (max 20) to also get that many random remaining candidates -
+    never more than half of them, so the sample can't give the answer away.
+    """
+    import numpy as np
+    from .solver import candidates
+
+    word_obj, _ = current_puzzle()
+    TARGET_WORD = word_obj.secret if word_obj else 'fish'
+    dictionary = known_dictionary(word_obj.dictionary) if word_obj else DEFAULT_DICTIONARY
+
+    guesses = request.data.get('guesses', [])
+    if not isinstance(guesses, list):
+        return Response({'error': 'guesses must be a list of words'}, status=400)
+    guesses = [str(g).lower().strip() for g in guesses]
+
+    invalid = [g for g in guesses if not is_valid_word(g, dictionary)]
+    if invalid:
+        return Response({'error': 'Not a valid word', 'guesses': invalid}, status=400)
+
+    try:
+        sample_size = min(max(int(request.data.get('sample', 0)), 0), 20)
+    except (TypeError, ValueError):
+        return Response({'error': 'sample must be an integer'}, status=400)
+
+    constraints = [(g, letter_feedback(g, TARGET_WORD)) for g in guesses]
+    remaining = candidates(len(TARGET_WORD), constraints, dictionary)
+
+    response = {
+        'length': len(TARGET_WORD),
+        'remaining': int(len(remaining)),
+    }
+    if sample_size:
+        picks = np.random.default_rng().choice(remaining, size=min(sample_size, len(remaining) // 2), replace=False)
+        response['sample'] = sorted(picks.tolist())
+    return Response(response)
+
+
+@api_view(['POST'])
+def record_game_result(request):
+    """
+    Record a finished game for today's puzzle: `guesses` (1-6) and `solved`.
+    Logged-in players also get their UserStats updated. Each player
+    (user, or session for anonymous players) is counted once per puzzle.
+    """
+    from .stats import MAX_GUESSES, puzzle_stats_payload, record_result
+
+    try:
+        guesses = int(request.data.get('guesses', 0))
+    except (TypeError, ValueError):
+        return Response({'error': 'guesses must be an integer'}, status=400)
+    solved = request.data.get('solved', False)
+    if not isinstance(solved, bool):
+        return Response({'error': 'solved must be true or false'}, status=400)
+
+    if not 1 <= guesses <= MAX_GUESSES:
+        return Response({'error': f'guesses must be between 1 and {MAX_GUESSES}'}, status=400)
+
+    word_obj, _ = current_puzzle()
+    puzzle_date = word_obj.date if word_obj else timezone.now().date()
+
+    if request.user.is_authenticated:
+        user = request.user
+        player_key = f'u:{user.pk}'
+    else:
+        user = None
+        if not request.session.session_key:
+            request.session.save()
+        player_key = f's:{request.session.session_key}'
+
+    recorded = record_result(puzzle_date, player_key, guesses, solved, user=user)
+
+    return Response({
+        'recorded': recorded,
+        'stats': puzzle_stats_payload(puzzle_date),
+    }, status=201 if recorded else 200)
+
+
+@api_view(['GET'])
+def get_today_stats(request):
+    """Guess distribution for today's puzzle, served from the puzzleStats counters"""
+    from django.utils.cache import patch_cache_control
+    from .stats import STATS_CACHE_TTL, puzzle_stats_payload
+
+    word_obj, _ = current_puzzle()
+    puzzle_date = word_obj.date if word_obj else timezone.now().date()
+
+    response = Response(puzzle_stats_payload(puzzle_date))
+    patch_cache_control(response, public=True, max_age=STATS_CACHE_TTL)
+    return response
+
+
+@api_view(['GET'])
+@authentication_classes([])
+@permission_classes([])
+def get_lexicon_manifest(request):
+    """
+    Describe the client-side lexicon artifact for today's puzzle dictionary.
+    The artifact URL contains its version, so clients can cache it forever and
+    only re-check this small manifest.
+    """
+    from django.conf import settings
+    from django.urls import reverse
+    from django.utils.cache import patch_cache_control
+    from .artifacts import lexicon_artifact
+
+    word_obj, _ = current_puzzle()
+    dictionary = known_dictionary(word_obj.dictionary) if word_obj else DEFAULT_DICTIONARY
+    version, data = lexicon_artifact(dictionary)
+    response = Response({
+        'dictionary': dictionary,
+        'version': version,
+        'format': 'bloom',
+        'fp_rate': settings.LEXICON_BLOOM_FP_RATE,
+        'size': len(data),
+        'url': reverse('lexicon_artifact', args=[dictionary, version]),
+    })
+    patch_cache_control(response, public=True, max_age=300)
+    return response
+
+
+@require_GET
+def get_lexicon_artifact(request, dictionary, version):
+    """Serve a dictionary's versioned Bloom filter bytes with a strong ETag and immutable caching"""
+    from django.http import HttpResponse, HttpResponseNotModified
+    from .artifacts import lexicon_artifact
+
+    if known_dictionary(dictionary) != dictionary:
+        return HttpResponse(status=404)
+    current, data = lexicon_artifact(dictionary)
+    if version != current:
+        # Stale URL - the client should re-read the manifest
+        return HttpResponse(status=404)
+
+    etag = f'"{current}"'
+    if etag in request.headers.get('If-None-Match', ''):
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(data, content_type='application/octet-stream')
+    response['ETag'] = etag
+    response['Cache-Control'] = 'public, max-age=31536000, immutable'
+    return response
+
+
 @api_view(['POST'])
 @csrf_exempt
 def register_user(request):
@@ -205,10 +285,10 @@ def get_current_user(request):
 @api_view(['POST'])
 @csrf_exempt
 def request_password_reset(request):
-    """Request password reset - sends email with reset token"""
+    """Request password reset - queues email with reset token"""
     from django.contrib.auth.tokens import default_token_generator
-    from django.core.mail import send_mail
     from django.conf import settings
+    from .mail import queue_mail
     
     email = request.data.get('email', '').strip().lower()
     
@@ -224,13 +304,12 @@ def request_password_reset(request):
         # In production, send this as a link to frontend
         reset_link = f"http://localhost:3000/reset-password?token={token}&uid={user.pk}"
         
-        # Send email
-        send_mail(
+        # Queue email - delivered by `manage.py run_mail_worker`
+        queue_mail(
             subject='Ghotidle - Password Reset Request',
             message=f'Click the link to reset your password:\n\n{reset_link}\n\nThis link expires in 1 hour.\n\nIf you did not request this, please ignore this email.',
             from_email=settings.DEFAULT_FROM_EMAIL if hasattr(settings, 'DEFAULT_FROM_EMAIL') else 'noreply@ghotidle.com',
-            recipient_list=[email],
-            fail_silently=False,
+            recipient=email,
         )
         return Response({'found': True, 'message': 'Password reset email sent successfully.'})
     except User.DoesNotExist:
@@ -327,8 +406,6 @@ def change_password(request):
 @csrf_exempt
 def suggest_phonetic_patterns(request):
     """Suggest phonetic patterns based on sound breakdown"""
-    from .models import PhoneticPattern
-    
     # Check if user is authenticated and is superuser
     if not request.user.is_authenticated or not request.user.is_superuser:
         return Response({'error': 'Permission denied. Admin access required.'}, status=403)
@@ -341,19 +418,12 @@ def suggest_phonetic_patterns(request):
     # Split sounds by hyphen (e.g., "f-i-sh" -> ["f", "i", "sh"])
     sound_list = [s.strip() for s in sounds.split('-') if s.strip()]
     
+    index = pattern_index()
+    ids = sound_ids()
     suggestions = []
     for sound in sound_list:
-        # Find all patterns that produce this sound
-        patterns = PhoneticPattern.objects.filter(sound=sound)
-        
-        pattern_data = []
-        for pattern in patterns:
-            pattern_data.append({
-                'id': pattern.id,
-                'letters': pattern.letters,
-                'sound': pattern.sound,
-                'reference': pattern.reference
-            })
+        # Find all patterns that produce this sound (or another spelling of it)
+        pattern_data = index.get(ids.get(sound), [])
         
         suggestions.append({
             'sound': sound,
@@ -368,6 +438,7 @@ def suggest_phonetic_patterns(request):
 def create_phonetic_pattern(request):
     """Create a new phonetic pattern - admin only"""
     from .models import PhoneticPattern
+    from .sounds import sound_for
     
     # Check if user is authenticated and is superuser
     if not request.user.is_authenticated or not request.user.is_superuser:
@@ -387,24 +458,28 @@ def create_phonetic_pattern(request):
     if len(reference) > 50:
         return Response({'error': 'Reference word must be 50 characters or less'}, status=400)
     
+    # Aliases resolve to the canonical sound
+    sound_obj = sound_for(sound)
+
     # Check if this exact pattern already exists
-    if PhoneticPattern.objects.filter(letters=letters, sound=sound, reference=reference).exists():
+    if PhoneticPattern.objects.filter(letters=letters, sound=sound_obj, reference=reference).exists():
         return Response({'error': f'This pattern already exists'}, status=400)
     
     try:
         # Create the pattern
         pattern = PhoneticPattern.objects.create(
             letters=letters,
-            sound=sound,
+            sound=sound_obj,
             reference=reference
         )
+        invalidate_puzzles()
         
         return Response({
             'message': 'Pattern created successfully',
             'pattern': {
                 'id': pattern.id,
                 'letters': pattern.letters,
-                'sound': pattern.sound,
+                'sound': sound_obj.name,
                 'reference': pattern.reference
             }
         }, status=201)
@@ -420,6 +495,7 @@ def create_phonetic_pattern(request):
 def create_word(request):
     """Create a new puzzle word - admin only"""
     from .models import Word, PhoneticComponent, PhoneticPattern
+    from .sounds import sound_for
     from datetime import date, timedelta
     
     # Check if user is authenticated and is superuser
@@ -431,6 +507,7 @@ def create_word(request):
     sounds = request.data.get('sounds', '').lower().strip()
     pattern_ids = request.data.get('pattern_ids', [])
     no_change_indexes = request.data.get('no_change_indexes', [])
+    dictionary = (request.data.get('dictionary') or DEFAULT_DICTIONARY).strip()
     
     # Validation
     if not secret or not phonetic:
@@ -439,8 +516,12 @@ def create_word(request):
     if len(secret) > 50 or len(phonetic) > 50:
         return Response({'error': 'Words must be 50 characters or less'}, status=400)
     
-    # Check if secret is a valid word
-    if not ValidWord.objects.filter(word=secret).exists():
+    # Check if secret is a valid word in the puzzle's dictionary
+    try:
+        valid = is_valid_word(secret, dictionary)
+    except UnknownDictionary:
+        return Response({'error': f'Unknown dictionary "{dictionary}"'}, status=400)
+    if not valid:
         return Response({
             'error': f'"{secret}" is not a valid word in our dictionary'
         }, status=400)
@@ -462,17 +543,17 @@ def create_word(request):
         word = Word.objects.create(
             secret=secret,
             phonetic=phonetic,
-            date=next_date
+            date=next_date,
+            dictionary=dictionary
         )
         
         # Parse sounds to get position mapping
         sound_list = [s.strip() for s in sounds.split('-') if s.strip()] if sounds else []
         
         # Get or create the identity pattern for keep-as-is sounds
-        identity_pattern, _ = PhoneticPattern.objects.get_or_create(
-            letters='*',
-            sound='*',
-            reference='identity'
+        identity_pattern = (
+            PhoneticPattern.objects.filter(letters='*', sound__name='*', reference='identity').first()
+            or PhoneticPattern.objects.create(letters='*', sound=sound_for('*'), reference='identity')
         )
         
         # Build position-to-pattern mapping
@@ -500,6 +581,7 @@ def create_word(request):
                             no_change=False
                         )
                         pattern_idx += 1
+        invalidate_puzzles()
         
         return Response({
             'message': 'Word created successfully',
@@ -509,7 +591,8 @@ def create_word(request):
                 'date': word.date.isoformat(),
                 'sounds': sounds,
                 'pattern_count': len([p for p in pattern_ids if p]) if pattern_ids else 0,
-                'keep_as_is_count': len(no_change_indexes)
+                'keep_as_is_count': len(no_change_indexes),
+                'dictionary': word.dictionary
             }
         }, status=201)
     
@@ -520,6 +603,7 @@ def create_word(request):
 
 
 @api_view(['GET'])
+@replica_reads
 def get_random_word(request):
     """
     Get a random word from the ValidWord database for testing.
@@ -540,50 +624,121 @@ def get_random_word(request):
 
 
 @api_view(['GET'])
+@replica_reads
 def get_leaderboard(request):
     """
     Get top 5 players + current user's rank
     Sorted by: 1) most wins, 2) least losses, 3) oldest account
+    `period` is 'all' (lifetime UserStats, default) or 'day', 'week' or 'month'
+    (the current period's LeaderboardRollup rows).
+    Both lookups walk the userstats_leaderboard_idx / rollup_leaderboard_idx
+    index; user ids are assigned in sign-up order, so they stand in for account age.
     """
-    from .models import UserStats
-    from django.db.models import F
-    
-    # get all users sorted by ranking logic
-    all_users = UserStats.objects.select_related('user').order_by(
-        '-correctGuesses',  # most wins first
-        'wrongGuesses',     # least losses (tiebreaker)
-        'user__date_joined' # oldest account (hidden tiebreaker)
-    )
-    
-    # build ranked list w/ positions
-    ranked = []
-    for idx, stat in enumerate(all_users, start=1):
-        ranked.append({
-            'rank': idx,
-            'username': stat.user.username,
-            'correct': stat.correctGuesses,
-            'wrong': stat.wrongGuesses,
-            'streak': stat.streak
-        })
-    
+    from .models import LeaderboardRollup
+    from .stats import LEADERBOARD_RANKING, leaderboard_entry as entry, leaderboard_rows
+    from django.db.models import Q
+
+    period = request.query_params.get('period', 'all')
+    if period != 'all' and period not in dict(LeaderboardRollup.PERIOD_CHOICES):
+        return Response({'error': "period must be one of 'all', 'day', 'week', 'month'"}, status=400)
+    rows = leaderboard_rows(period, timezone.now().date())
+
     # top 5
-    top_5 = ranked[:5]
-    
+    top_stats = rows.order_by(*LEADERBOARD_RANKING)[:5]
+    top_5 = [entry(idx, stat) for idx, stat in enumerate(top_stats, start=1)]
+
     # find current user
     current_user_data = None
     if request.user.is_authenticated:
-        for entry in ranked:
-            if entry['username'] == request.user.username:
-                current_user_data = entry
-                break
+        current_user_data = next((e for e in top_5 if e['username'] == request.user.username), None)
+        stat = None if current_user_data else rows.filter(user=request.user).first()
+        if stat:
+            # rank = 1 + players ordered ahead of this one
+            ahead = rows.filter(
+                Q(correctGuesses__gt=stat.correctGuesses) |
+                Q(correctGuesses=stat.correctGuesses, wrongGuesses__lt=stat.wrongGuesses) |
+                Q(correctGuesses=stat.correctGuesses, wrongGuesses=stat.wrongGuesses, user_id__lt=stat.user_id)
+            ).count()
+            current_user_data = entry(ahead + 1, stat)
     
     return Response({
+        'period': period,
         'top_5': top_5,
         'current_user': current_user_data
     })
 
 
 @api_view(['GET'])
+@authentication_classes([])
+@permission_classes([])
+@replica_reads
+def get_archive(request):
+    """
+    Past puzzles, newest first, in keyset-paginated pages.
+    Pass `before` (YYYY-MM-DD, from the previous page's `next`) and `limit` (max 50).
+    Each entry has the same shape as get_word plus its `date`.
+    """
+    from datetime import date as date_type, datetime, time as time_type, timedelta, timezone as dt_timezone
+    from django.db.models import Prefetch
+    from django.utils.cache import patch_cache_control
+    from .models import PhoneticComponent
+    from .puzzles import serialize_word
+
+    today = timezone.now().date()
+    before_str = request.query_params.get('before')
+    try:
+        before = date_type.fromisoformat(before_str) if before_str else today + timedelta(days=1)
+        limit = min(max(int(request.query_params.get('limit', 10)), 1), 50)
+    except ValueError:
+        return Response({'error': 'Use before=YYYY-MM-DD and an integer limit.'}, status=400)
+    # A page ending before a date that has already started never changes
+    frozen = before <= today
+    before = min(before, today)
+
+    words = list(
+        Word.objects.filter(date__lt=before)
+        .order_by('-date')
+        .prefetch_related(Prefetch(
+            'phoneticcomponent_set',
+            queryset=PhoneticComponent.objects.select_related('pattern__sound').order_by('position'),
+            to_attr='ordered_components',
+        ))[:limit + 1]
+    )
+    has_more = len(words) > limit
+    words = words[:limit]
+
+    response = Response({
+        'results': [
+            {'date': word.date.isoformat(), **serialize_word(word, word.ordered_components)}
+            for word in words
+        ],
+        'next': words[-1].date.isoformat() if has_more else None,
+    })
+
+    if frozen:
+        max_age = 7 * 24 * 60 * 60
+    else:
+        # The first page gains a puzzle at midnight (UTC)
+        midnight = datetime.combine(today + timedelta(days=1), time_type.min, tzinfo=dt_timezone.utc)
+        max_age = int((midnight - timezone.now()).total_seconds())
+    patch_cache_control(response, public=True, max_age=max_age)
+    return response
+
+
+@api_view(['GET'])
+def get_lexicon_stats(request):
+    """Configured dictionaries with their load state, size and load time in this worker - admin only"""
+    if not request.user.is_authenticated or not request.user.is_superuser:
+        return Response({'error': 'Permission denied. Admin access required.'}, status=403)
+
+    return Response({
+        'budget_bytes': lexicon_registry.budget_bytes,
+        'dictionaries': lexicon_registry.stats(),
+    })
+
+
+@api_view(['GET'])
+@replica_reads
 def get_schedule(request):
     """Return all words with their assigned dates - admin only"""
     if not request.user.is_authenticated or not request.user.is_superuser:
@@ -593,6 +748,97 @@ def get_schedule(request):
     return Response(list(words))
 
 
+@api_view(['GET'])
+def search_words(request):
+    """
+    Search the lexicon for puzzle candidates - admin only.
+    `shape`: letters with ? for one letter and * for any run (f?sh, ph*, *ough*)
+    `length`: word length; `contains`: substring(s), comma-separated;
+    `excludes`: letters that must not appear; `page` / `page_size` (max 200).
+    """
+    if not request.user.is_authenticated or not request.user.is_superuser:
+        return Response({'error': 'Permission denied. Admin access required.'}, status=403)
+
+    import re
+    from .search import SHAPE_RE, search_words as run_search
+
+    params = request.query_params
+    shape = params.get('shape', '').lower().strip() or None
+    contains = [c for c in params.get('contains', '').lower().replace(' ', '').split(',') if c]
+    excludes = params.get('excludes', '').lower().strip()
+
+    if shape and not SHAPE_RE.match(shape):
+        return Response({'error': 'shape may only contain letters, ? and *'}, status=400)
+    if any(not re.fullmatch(r'[a-z]+', c) for c in contains) or not re.fullmatch(r'[a-z]*', excludes):
+        return Response({'error': 'contains and excludes may only contain letters'}, status=400)
+    try:
+        length = int(params['length']) if params.get('length') else None
+        page = max(int(params.get('page', 1)), 1)
+        page_size = min(max(int(params.get('page_size', 50)), 1), 200)
+    except ValueError:
+        return Response({'error': 'length, page and page_size must be integers'}, status=400)
+    if not (shape or length or contains or excludes):
+        return Response({'error': 'Give at least one of shape, length, contains or excludes'}, status=400)
+
+    matches = run_search(shape=shape, length=length, contains=contains, excludes=excludes)
+    start = (page - 1) * page_size
+    return Response({
+        'count': len(matches),
+        'page': page,
+        'page_size': page_size,
+        'next': page + 1 if start + page_size < len(matches) else None,
+        'results': matches[start:start + page_size],
+    })
+
+
+@api_view(['POST'])
+def autoschedule_words(request):
+    """
+    Fill every empty date from `start` to `end` (YYYY-MM-DD) with reused library
+    words - admin only. Optional: `min_gap`, `max_overlap`, `seed`, `dry_run`.
+    See game/scheduling.py for the constraints.
+    """
+    if not request.user.is_authenticated or not request.user.is_superuser:
+        return Response({'error': 'Permission denied. Admin access required.'}, status=403)
+
+    from datetime import date as date_type
+    from django.db import IntegrityError
+    from .scheduling import autoschedule
+
+    try:
+        start = date_type.fromisoformat(request.data.get('start', ''))
+        end = date_type.fromisoformat(request.data.get('end', ''))
+    except (TypeError, ValueError):
+        return Response({'error': 'start and end are required. Use YYYY-MM-DD.'}, status=400)
+    if end < start or (end - start).days > 3660:
+        return Response({'error': 'end must be on or after start, within 10 years'}, status=400)
+
+    try:
+        min_gap = int(request.data.get('min_gap', 180))
+        max_overlap = int(request.data.get('max_overlap', 3))
+        seed = request.data.get('seed')
+        seed = int(seed) if seed is not None else None
+    except (TypeError, ValueError):
+        return Response({'error': 'min_gap, max_overlap and seed must be integers'}, status=400)
+    dry_run = request.data.get('dry_run', False)
+    if not isinstance(dry_run, bool):
+        return Response({'error': 'dry_run must be true or false'}, status=400)
+
+    try:
+        result = autoschedule(start, end, min_gap=min_gap, max_overlap=max_overlap, seed=seed, dry_run=dry_run)
+    except IntegrityError:
+        return Response({'error': 'A date in the range was scheduled concurrently, nothing saved'}, status=409)
+
+    return Response({
+        'dry_run': dry_run,
+        'assigned': [
+            {'date': day, 'secret': secret, 'difficulty': difficulty}
+            for day, secret, difficulty in result.assigned
+        ],
+        'unfilled': result.unfilled,
+    }, status=200 if dry_run else 201)
+
+
 @api_view(['PATCH'])
 def reschedule_word(request, word_id):
     """Reassign a word to a different date - admin only"""
@@ -614,14 +860,20 @@ def reschedule_word(request, word_id):
     except Word.DoesNotExist:
         return Response({'error': 'Word not found'}, status=404)
 
-    # If another word is already on this date, swap their dates
-    existing = Word.objects.filter(date=new_date).exclude(id=word_id).first()
-    if existing:
-        existing.date = word.date
-        existing.save()
+    from django.db import transaction
 
-    word.date = new_date
-    word.save()
+    # If another word is already on this date, swap their dates
+    with transaction.atomic():
+        existing = Word.objects.filter(date=new_date).exclude(id=word_id).first()
+        if existing:
+            # date is unique: park this word on a placeholder date while the other one moves
+            Word.objects.filter(id=word.id).update(date=date_type.min)
+            existing.date = word.date
+            existing.save()
+
+        word.date = new_date
+        word.save()
+    invalidate_puzzles()
 
     return Response({
         'id': word.id,
@@ -630,3 +882,37 @@ def reschedule_word(request, word_id):
         'date': word.date,
         'swapped_with': existing.secret if existing else None,
     })
+
+
+@api_view(['GET'])
+def download_profile(request, filename):
+    """Download a profile or SQL trace written by the profiling middleware - admin only"""
+    if not request.user.is_authenticated or not request.user.is_superuser:
+        return Response({'error': 'Permission denied. Admin access required.'}, status=403)
+
+    from django.http import FileResponse
+    from .profiling import profile_path
+
+    path = profile_path(filename)
+    if path is None or not path.is_file():
+        return Response({'error': 'Profile not found'}, status=404)
+    return FileResponse(path.open('rb'), as_attachment=True, filename=filename)
+
+
+async def live_feed(request):
+    """
+    Server-Sent Events stream of today's solve count and the top 5 (see game/live.py).
+    Only available when served through ghotidle_backend.asgi.
+    """
+    from django.core.handlers.asgi import ASGIRequest
+    from django.http import JsonResponse, StreamingHttpResponse
+    from .live import broadcaster
+
+    if not isinstance(request, ASGIRequest):
+        # Under WSGI the stream would be buffered forever
+        return JsonResponse({'error': 'Live updates are served by the ASGI app'}, status=503)
+
+    response = StreamingHttpResponse(broadcaster.stream(), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
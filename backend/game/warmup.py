@@ -0,0 +1,40 @@
+"""
+Preload read-mostly game data into the current process.
+
+Called from the gunicorn master (see `gunicorn.conf.py`) before workers are
+forked, so every worker starts with the lexicon, solver matrices, pattern
+index and current puzzle already in memory.
+"""
+import logging
+import time
+
+from django.db import connections
+
+from . import artifacts, lexicon, puzzles, solver
+
+logger = logging.getLogger(__name__)
+
+
+def warm_caches():
+    """Load all process caches and return {name: seconds} timings"""
+    timings = {}
+    for name, loader in (
+        ('lexicon', lexicon.get_lexicon),
+        ('solver_tables', solver.get_tables),
+        ('lexicon_artifact', artifacts.lexicon_artifact),
+        ('pattern_index', puzzles.pattern_index),
+        ('current_puzzle', puzzles.current_puzzle),
+    ):
+        start = time.perf_counter()
+        try:
+            loader()
+        except Exception:
+            # A cold database must not stop the server from booting;
+            # workers will load lazily on first request instead.
+            logger.exception('Failed to warm %s', name)
+            continue
+        timings[name] = time.perf_counter() - start
+
+    # DB connections must not be shared across fork()
+    connections.close_all()
+    return timings
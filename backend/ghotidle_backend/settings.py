@@ -56,6 +56,7 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     # 'django.middleware.csrf.CsrfViewMiddleware',  # Disabled for REST API
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'game.profiling.ProfilingMiddleware',  # No-op unless PROFILING_ENABLED
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -100,6 +101,14 @@ else:
         }
     }
 
+# Optional read replicas (comma-separated URLs) for read-only game views; see
+# game/routers.py. Tests mirror them onto the default database.
+for _i, _url in enumerate(filter(None, os.environ.get('DATABASE_REPLICA_URLS', '').split(',')), start=1):
+    DATABASES[f'replica{_i}'] = dj_database_url.parse(_url.strip(), conn_max_age=600)
+    DATABASES[f'replica{_i}']['TEST'] = {'MIRROR': 'default'}
+
+DATABASE_ROUTERS = ['game.routers.ReplicaRouter']
+
 
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
@@ -184,3 +193,44 @@ EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
 
 # Password Reset Settings
 PASSWORD_RESET_TIMEOUT = 3600  # Token valid for 1 hour (in seconds)
+
+# Dictionaries puzzles can validate against. 'en' is the ValidWord table; others are
+# word-list files (one word per line). Any data/dictionaries/<id>.txt is picked up as <id>.
+LEXICON_DICTIONARIES = {
+    'en': {},
+    'en-expert': {'path': BASE_DIR / 'data' / 'words.txt'},
+}
+for _path in sorted((BASE_DIR / 'data' / 'dictionaries').glob('*.txt')):
+    LEXICON_DICTIONARIES.setdefault(_path.stem, {'path': _path})
+
+# Loaded dictionaries beyond this are evicted least-recently-used first
+LEXICON_MEMORY_BUDGET_MB = int(os.environ.get('LEXICON_MEMORY_BUDGET_MB', '64'))
+
+# False-positive rate of the Bloom filter served at /api/lexicon/ (1% ~ 120 KB for 97k words)
+LEXICON_BLOOM_FP_RATE = float(os.environ.get('LEXICON_BLOOM_FP_RATE', '0.01'))
+
+# Finished periods of windowed leaderboard rollups kept by compact_leaderboards
+LEADERBOARD_RETENTION = {
+    'day': int(os.environ.get('LEADERBOARD_KEEP_DAYS', '7')),
+    'week': int(os.environ.get('LEADERBOARD_KEEP_WEEKS', '8')),
+    'month': int(os.environ.get('LEADERBOARD_KEEP_MONTHS', '12')),
+}
+
+# Guess-event analytics (game/events.py): each worker buffers events and writes
+# them in one batch every N events or T milliseconds
+GUESS_EVENTS_ENABLED = os.environ.get('GUESS_EVENTS_ENABLED', 'True') == 'True'
+GUESS_EVENT_FLUSH_EVENTS = int(os.environ.get('GUESS_EVENT_FLUSH_EVENTS', '500'))
+GUESS_EVENT_FLUSH_MS = int(os.environ.get('GUESS_EVENT_FLUSH_MS', '2000'))
+GUESS_EVENT_MAX_BUFFER = int(os.environ.get('GUESS_EVENT_MAX_BUFFER', '50000'))
+GUESS_EVENT_RETENTION_DAYS = int(os.environ.get('GUESS_EVENT_RETENTION_DAYS', '90'))
+
+# Per-request profiling for superusers (X-Profile header, see game/profiling.py)
+PROFILING_ENABLED = os.environ.get('PROFILING_ENABLED', 'False') == 'True'
+PROFILE_DIR = os.environ.get('PROFILE_DIR', str(BASE_DIR / 'profiles'))
+PROFILE_KEEP = int(os.environ.get('PROFILE_KEEP', '50'))
+PROFILE_SAMPLE_INTERVAL_MS = float(os.environ.get('PROFILE_SAMPLE_INTERVAL_MS', '1'))
+
+# Server-Sent Events feed at /api/live/ (game/live.py, ASGI only)
+LIVE_POLL_SECONDS = float(os.environ.get('LIVE_POLL_SECONDS', '1'))
+LIVE_HEARTBEAT_SECONDS = float(os.environ.get('LIVE_HEARTBEAT_SECONDS', '15'))
+LIVE_MAX_SECONDS = float(os.environ.get('LIVE_MAX_SECONDS', '300'))
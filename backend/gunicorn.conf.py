@@ -0,0 +1,83 @@
+"""
+Gunicorn configuration for production.
+
+Usage:
+    gunicorn -c gunicorn.conf.py ghotidle_backend.wsgi:application
+
+The app is preloaded in the master and its caches (lexicon, pattern index,
+current puzzle) are warmed before workers fork, so workers share that memory
+copy-on-write and serve their first request without a cold start.
+
+Environment variables:
+    PORT                       Port to bind (default 8000)
+    WEB_CONCURRENCY            Worker count (default 2 * CPUs + 1)
+    GUNICORN_THREADS           Threads per worker (default 1)
+    GUNICORN_TIMEOUT           Worker timeout in seconds (default 30 + 10 per CPU, max 120)
+    GUNICORN_MAX_REQUESTS      Recycle a worker after this many requests (default 1000)
+    GUNICORN_MAX_WORKER_MB     Recycle a worker once its RSS exceeds this (default 512)
+    GUNICORN_LOG_LEVEL         Log level (default info)
+"""
+import gc
+import multiprocessing
+import os
+import resource
+
+cpu_count = multiprocessing.cpu_count()
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+workers = int(os.environ.get('WEB_CONCURRENCY', cpu_count * 2 + 1))
+threads = int(os.environ.get('GUNICORN_THREADS', 1))
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', min(30 + 10 * cpu_count, 120)))
+graceful_timeout = timeout
+keepalive = 5
+
+preload_app = True
+
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', 1000))
+max_requests_jitter = max_requests // 10
+max_worker_memory_mb = int(os.environ.get('GUNICORN_MAX_WORKER_MB', 512))
+
+loglevel = os.environ.get('GUNICORN_LOG_LEVEL', 'info')
+accesslog = '-'
+forwarded_allow_ips = '*'
+
+
+def _rss_mb():
+    """Current resident set size of this process in MB"""
+    try:
+        with open('/proc/self/statm') as f:
+            pages = int(f.read().split()[1])
+        return pages * resource.getpagesize() / (1024 * 1024)
+    except OSError:
+        # No procfs (macOS dev machines) - peak RSS is close enough
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def when_ready(server):
+    """Runs in the master after the app is loaded, before workers are forked"""
+    from game.warmup import warm_caches
+
+    timings = warm_caches()
+    for name, seconds in timings.items():
+        server.log.info('Warmed %s in %.1f ms', name, seconds * 1000)
+
+    # Move everything allocated so far out of the GC's reach so collections
+    # in the workers don't touch (and copy) the shared pages.
+    gc.collect()
+    gc.freeze()
+
+
+def post_request(worker, req, environ, resp):
+    """Gracefully recycle a worker that has grown past the memory threshold"""
+    if max_worker_memory_mb and _rss_mb() > max_worker_memory_mb:
+        worker.log.info('Worker %s over %d MB, recycling', worker.pid, max_worker_memory_mb)
+        worker.alive = False
+
+
+def worker_exit(server, worker):
+    """Write out buffered guess events before the worker goes away"""
+    from game.events import flush
+
+    written = flush()
+    if written:
+        worker.log.info('Flushed %d guess events on exit', written)
@@ -10,6 +10,7 @@ import MenuBar from './components/MenuBar';
 import PasswordResetModal from './components/PasswordResetModal';
 import Keyboard from './components/Keyboard';
 import API_BASE_URL from './api';
+import { loadLexicon, mightBeWord } from './lexicon';
 
 interface LetterFeedback {
   letter: string;
@@ -204,6 +205,7 @@ function App() {
     };
 
     fetchWord();
+    loadLexicon();
   }, []);
 
   // Calculate keyboard letter statuses based on all guesses
@@ -269,7 +271,26 @@ function App() {
   // eslint-disable-next-line react-hooks/exhaustive-deps
   }, [currentGuess, gameWon, gameLost, isLoading]);
 
+  // Fire-and-forget: feeds today's guess distribution and the player's stats
+  const recordResult = (guessCount: number, solved: boolean) => {
+    fetch(`${API_BASE_URL}/results/`, {
+      method: 'POST',
+      headers: {
+        'Content-Type': 'application/json',
+      },
+      credentials: 'include',
+      body: JSON.stringify({ guesses: guessCount, solved }),
+    }).catch((err) => console.error('Error recording result:', err));
+  };
+
   const submitGuess = async () => {
+    // Reject definite non-words locally; the server still checks everything else.
+    // Only server rejections come with "did you mean" suggestions.
+    if (!mightBeWord(currentGuess)) {
+      setError('Not a valid word');
+      return;
+    }
+
     setIsLoading(true);
     setError('');
 
@@ -286,7 +307,10 @@ function App() {
 
       // Check if backend sent an error message (e.g., invalid word)
       if (!response.ok) {
-        setError(data.error || 'Invalid guess');
+        const suggestions: string[] = data.suggestions || [];
+        setError(suggestions.length
+          ? `${data.error}. Did you mean ${suggestions.map((w) => w.toUpperCase()).join(', ')}?`
+          : data.error || 'Invalid guess');
         setIsLoading(false);
         return;
       }
@@ -301,8 +325,10 @@ function App() {
       
       if (data.is_correct) {
         setGameWon(true);
+        recordResult(guesses.length + 1, true);
       } else if (guesses.length + 1 >= MAX_ATTEMPTS) {
         setGameLost(true);
+        recordResult(guesses.length + 1, false);
       }
       
       setCurrentGuess('');
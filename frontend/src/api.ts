@@ -1,9 +1,13 @@
 declare global {
   interface Window {
     __API_URL__?: string;
+    __LIVE_URL__?: string;
   }
 }
 
 const API_BASE_URL = window.__API_URL__ || process.env.REACT_APP_API_URL || 'http://localhost:8000/api';
 
+// Server-Sent Events are served by the ASGI app, which may run on its own host
+export const LIVE_URL = window.__LIVE_URL__ || process.env.REACT_APP_LIVE_URL || API_BASE_URL;
+
 export default API_BASE_URL;
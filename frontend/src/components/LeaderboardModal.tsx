@@ -1,5 +1,5 @@
 import React, { useEffect, useState } from 'react';
-import API_BASE_URL from '../api';
+import API_BASE_URL, { LIVE_URL } from '../api';
 
 interface LeaderboardEntry {
   rank: number;
@@ -24,6 +24,7 @@ function LeaderboardModal({ isOpen, onClose, user }: LeaderboardModalProps) {
   const [data, setData] = useState<LeaderboardData | null>(null);
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState('');
+  const [solvedToday, setSolvedToday] = useState<number | null>(null);
 
   useEffect(() => {
     if (!isOpen) return;
@@ -51,6 +52,22 @@ function LeaderboardModal({ isOpen, onClose, user }: LeaderboardModalProps) {
     fetchLeaderboard();
   }, [isOpen]);
 
+  // Live top 5 and solve count while the modal is open; without the feed the
+  // snapshot above just stays as it is
+  useEffect(() => {
+    if (!isOpen || typeof EventSource === 'undefined') return;
+
+    const source = new EventSource(`${LIVE_URL}/live/`, { withCredentials: true });
+    source.addEventListener('leaderboard', (event) => {
+      const { top_5 } = JSON.parse((event as MessageEvent).data);
+      setData((prev) => (prev ? { ...prev, top_5 } : prev));
+    });
+    source.addEventListener('solves', (event) => {
+      setSolvedToday(JSON.parse((event as MessageEvent).data).solved);
+    });
+    return () => source.close();
+  }, [isOpen]);
+
   if (!isOpen) return null;
 
   return (
@@ -92,6 +109,9 @@ function LeaderboardModal({ isOpen, onClose, user }: LeaderboardModalProps) {
               {/* Top 5 */}
               <div className="top-players-section">
                 <h3>Top Players</h3>
+                {solvedToday !== null && (
+                  <p className="empty-message">{solvedToday} {solvedToday === 1 ? 'player has' : 'players have'} solved today</p>
+                )}
                 {data.top_5.length === 0 ? (
                   <p className="empty-message">No players yet. Be the first!</p>
                 ) : (
@@ -0,0 +1,68 @@
+import API_BASE_URL from './api';
+
+// Client-side copy of the puzzle dictionary as a Bloom filter (see backend/game/artifacts.py).
+// A miss means the word is definitely not valid; a hit still goes to the server.
+
+const FNV_PRIME = 0x01000193;
+const FNV_OFFSET = 0x811c9dc5;
+const SECOND_OFFSET = 0x050c5d1f;
+
+interface BloomFilter {
+  hashes: number;
+  bits: number;
+  array: Uint8Array;
+}
+
+let filter: BloomFilter | null = null;
+
+const fnv1a = (bytes: Uint8Array, offset: number): number => {
+  let h = offset >>> 0;
+  for (let i = 0; i < bytes.length; i++) {
+    h = Math.imul(h ^ bytes[i], FNV_PRIME) >>> 0;
+  }
+  return h;
+};
+
+const encode = (word: string): Uint8Array => {
+  // Guesses are lowercase a-z, so one byte per character matches UTF-8
+  const bytes = new Uint8Array(word.length);
+  for (let i = 0; i < word.length; i++) {
+    bytes[i] = word.charCodeAt(i) & 0xff;
+  }
+  return bytes;
+};
+
+export const loadLexicon = async (): Promise<void> => {
+  try {
+    const manifest = await (await fetch(`${API_BASE_URL}/lexicon/`)).json();
+    // Versioned URL is served immutable, so the browser cache does the rest
+    const response = await fetch(`${API_BASE_URL}/lexicon/${manifest.dictionary}/${manifest.version}/`);
+    if (!response.ok) return;
+    const data = new DataView(await response.arrayBuffer());
+    const magic = String.fromCharCode(data.getUint8(0), data.getUint8(1), data.getUint8(2), data.getUint8(3));
+    if (magic !== 'GHBF' || data.getUint8(4) !== 1) return;
+    filter = {
+      hashes: data.getUint8(5),
+      bits: data.getUint32(6),
+      array: new Uint8Array(data.buffer, 10),
+    };
+  } catch (err) {
+    // Without the filter every guess is simply checked by the server
+    console.error('Error loading lexicon:', err);
+  }
+};
+
+// False only if the word is certainly not in the dictionary
+export const mightBeWord = (word: string): boolean => {
+  if (!filter || !/^[a-z]+$/.test(word)) return true;
+  const bytes = encode(word);
+  const h1 = fnv1a(bytes, FNV_OFFSET);
+  const h2 = (fnv1a(bytes, SECOND_OFFSET) | 1) >>> 0;
+  for (let i = 0; i < filter.hashes; i++) {
+    const position = ((h1 + Math.imul(i, h2)) >>> 0) % filter.bits;
+    if (!(filter.array[position >> 3] & (1 << (position & 7)))) {
+      return false;
+    }
+  }
+  return true;
+};